@@ -1,217 +1,332 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+import os
 import sys
+import time
 import heapq
+import math
 import argparse
 
-# Árvore de busca para visualização
-search_tree = nx.DiGraph()
-node_counter = 0
-
-def add_tree_node(label, parent_node_id=None):
-    global node_counter
-    node_id = node_counter
-    node_counter += 1
-    search_tree.add_node(node_id, label=label)
-    if parent_node_id is not None:
-        search_tree.add_edge(parent_node_id, node_id)
-    return node_id
-
-def read_graph(file_path):
-    with open(file_path, 'r') as f:
-        lines = [line.strip() for line in f if line.strip()]
-    
-    if lines[0].upper() != "DIMENSION":
-        raise ValueError("Erro: esperava 'DIMENSION' na primeira linha.")
-    dimension = int(lines[1])
-    
-    if lines[2].upper() != "GRAPH":
-        raise ValueError("Erro: esperava 'GRAPH' após a dimensão.")
-    
-    edges = []
-    for line in lines[3:]:
-        parts = line.split()
-        if len(parts) >= 3:
-            u = int(parts[0])
-            v = int(parts[1])
-            cost = float(parts[2])
-            edges.append((u, v, cost))
-    
-    G = nx.Graph()
-    G.add_nodes_from(range(1, dimension + 1))
-    G.add_weighted_edges_from(edges)
-    return G
-
-def is_valid(G, vertex, color, assignment):
-    for neighbor in G.neighbors(vertex):
-        if neighbor in assignment and assignment[neighbor] == color:
-            return False
-    return True
-
-def cost_for_vertex(G, vertex, assignment):
-    custo = 0
-    for neighbor in G.neighbors(vertex):
-        if neighbor in assignment:
-            custo += G[vertex][neighbor]["weight"]
-    return custo
-
-def heuristic(G, current_assignment, vertex):
-    """
-    Calcula h(n) = (Nº de vizinhos não coloridos) × (peso médio das arestas)
-    """
-    neighbors = list(G.neighbors(vertex))
-    uncolored = len([n for n in neighbors if n not in current_assignment])
-    
-    total_weight = sum(G[vertex][n]["weight"] for n in neighbors)
-    avg_weight = total_weight / len(neighbors) if neighbors else 0
-    
-    return uncolored * avg_weight
-
-def state_to_string(state, vertices, algorithm):
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from core import (ColorState, PackedColoring, SearchNode, TrailState, TranspositionTable,
+                  read_graph, LOG_MODES, open_search_log, HEURISTICS, heuristic_table,
+                  ROOT, SOLUTION, SearchTreeRecorder, add_tree_arguments, recorder_from_args,
+                  add_palette_arguments, color_name, add_metrics_arguments, metrics_from_args, timed,
+                  add_profile_arguments, profiler_from_args, profiled, render_search_tree,
+                  add_output_arguments, output_from_args, write_result)
+
+# Árvore de busca (ver core.tree); main() a troca pelo modo pedido na linha de comando.
+search_tree = SearchTreeRecorder()
+# Métricas da execução (ver core.metrics); None quando --metrics não é usado.
+metrics = None
+
+def tree_label(tree, row, algorithm):
+    """Formata o rótulo de um nó da árvore de busca; só é chamada ao desenhar."""
+    kind = tree.kind[row]
+    if kind == ROOT:
+        return "root"
+    if kind == SOLUTION:
+        return f"Solução: {tree.assignment(row)}, Custo Total: {tree.g[row]}"
+    if algorithm in ("astar", "idastar"):
+        g, h = tree.g[row], tree.h[row]
+        return f"{tree.vertex[row]}={tree.color[row]}\ng={g}, h={h}, f={g + h}"
+    return f"{tree.vertex[row]}={tree.color[row]}"
+
+def state_to_string(state, algorithm):
     if algorithm == "astar":
-        assignment, index, tree_id, g, h = state
+        node, tree_id, g, h = state[:4]
         f = g + h
-        if index > 0:
-            last_vertex = vertices[index - 1]
-            last_color = assignment.get(last_vertex, "")
-            return f"ID {tree_id}: {last_vertex}={last_color}, g={g}, h={h}, f={f}"
+        if node.depth > 0:
+            return f"ID {tree_id}: {node.vertex}={node.color}, g={g}, h={h}, f={f}"
         return f"ID {tree_id}: Início, g={g}, h={h}, f={f}"
     else:
-        assignment, index, tree_id, custo = state
-        if index > 0:
-            last_vertex = vertices[index - 1]
-            last_color = assignment.get(last_vertex, "")
-            return f"ID {tree_id}: {last_vertex}={last_color}, Custo={custo}"
+        node, tree_id, custo = state[:3]
+        if node.depth > 0:
+            return f"ID {tree_id}: {node.vertex}={node.color}, Custo={custo}"
         return f"ID {tree_id}: Início, Custo={custo}"
 
-def astar_search(G, vertices, root_id, log_filename="astar_log.txt"):
+def state_key(state):
+    """Identifica o estado no log delta pelo ID do nó na árvore de busca."""
+    return state[1]
+
+def astar_search(G, vertices, root_id, log_filename="astar_log.txt", transposition=True,
+                 heuristic="remaining", symmetry=False, num_colors=4):
+    """
+    Busca A* com f = g + h, em que h vem da tabela pré-calculada da heurística
+    'heuristic' (ver core.heuristics); entre estados com o mesmo f, sai primeiro
+    o de menor h. Cada estado é (search_node, tree_id, g, h, canon), em que
+    'canon' é a coloração parcial em forma canônica; com 'transposition', um
+    filho que repete (a menos de permutação de cores) um estado já gerado com g
+    menor ou igual é descartado. Com 'symmetry', cada vértice só recebe cores
+    até (maior cor usada + 1). 'num_colors' é o tamanho da paleta. A A* não
+    grava log; 'log_filename' só mantém a assinatura igual à dos outros motores.
+    Retorna (assignment, index, tree_id, g) ao retirar da fila um estado com
+    todos os vértices coloridos, ou None se não houver solução.
+    """
     open_list = []
-    closed_states = []
     state_counter = 0
 
-    # Correção: Calcular a heurística para o primeiro vértice
-    initial_vertex = vertices[0] if vertices else None
-    initial_h = heuristic(G, {}, initial_vertex) if initial_vertex else 0
+    h_table = heuristic_table(heuristic, G, vertices)
+    initial_h = h_table[0]
+    root = SearchNode()
+    trail = TrailState(G, root, num_colors)
+    packing = PackedColoring(G, vertices, num_colors)
+    table = TranspositionTable() if transposition else None
 
-    initial_state = ({}, 0, root_id, 0, initial_h)
-    heapq.heappush(open_list, (initial_h + 0, state_counter, initial_state))
+    initial_state = (root, root_id, 0, initial_h, packing.canonical_root())
+    heapq.heappush(open_list, (initial_h + 0, initial_h, state_counter, initial_state))
     state_counter += 1
-    iteration = 0
+    add_node = search_tree.add
+    first_id = search_tree.size
+    if metrics is not None:
+        metrics.instrument(trail)
+    expanded = pops = max_frontier = max_depth = 0
 
-    with open(log_filename, "w", encoding="utf-8") as log_file:
+    try:
         while open_list:
-            # ... (código de log)
-            
-            current_f, _, current_state = heapq.heappop(open_list)
-            assignment, index, tree_id, g, h = current_state
-
-            # --- Verificação de segurança adicionada ---
-            if index >= len(vertices):
+            if len(open_list) > max_frontier:
+                max_frontier = len(open_list)
+            current_f, _, _, current_state = heapq.heappop(open_list)
+            pops += 1
+            node, tree_id, g, h, canon = current_state
+            index = node.depth
+            if table is not None and index and table.is_stale((index, canon[0]), g):
                 continue
-            # -------------------------------------------
-
-            vertex = vertices[index]  # Agora seguro
-
-            for color in [1, 2, 3, 4]:
-                if is_valid(G, vertex, color, assignment):
-                    new_assignment = assignment.copy()
-                    new_assignment[vertex] = color
-                    
-                    # CÁLCULO DO CUSTO REAL (g(n))
-                    new_g = g + cost_for_vertex(G, vertex, new_assignment)
-                    
-                    # ----> AQUI ENTRA A HEURÍSTICA <----
-                    new_h = heuristic(G, new_assignment, vertex)  # Calcula h(n) para o vértice atual
-                    new_f = new_g + new_h  # f(n) = g(n) + h(n)
-                    # -----------------------------------
-                    
-                    new_index = index + 1
-                    new_label = f"{vertex}={color}\ng={new_g}, h={new_h}, f={new_f}"
-                    new_tree_id = add_tree_node(new_label, tree_id)
-                    
-                    heapq.heappush(open_list, (new_f, state_counter, (new_assignment, new_index, new_tree_id, new_g, new_h)))
-                    state_counter += 1
-                    
-            closed_states.append(current_state)
+            if index > max_depth:
+                max_depth = index
+
+            if index == len(vertices):
+                assignment = node.assignment()
+                add_node(tree_id, g=g, kind=SOLUTION)
+                return (assignment, index, tree_id, g)
+
+            trail.goto(node)
+            vertex = vertices[index]
+            expanded += 1
+
+            # CÁLCULO DO CUSTO REAL (g(n)); não depende da cor escolhida
+            new_g = g + trail.cost_for_vertex(vertex)
+
+            new_h = h_table[index + 1]
+            new_f = new_g + new_h  # f(n) = g(n) + h(n)
+
+            for color in trail.legal_colors(vertex, symmetry):
+                new_canon = packing.canonical_child(canon, index, color)
+                if table is not None and not table.offer((index + 1, new_canon[0]), new_g):
+                    continue
+                new_node = SearchNode(vertex, color, node)
+                new_tree_id = add_node(tree_id, vertex, color, new_g, new_h)
+
+                heapq.heappush(open_list, (new_f, new_h, state_counter, (new_node, new_tree_id, new_g, new_h, new_canon)))
+                state_counter += 1
+    finally:
+        if metrics is not None:
+            metrics.record(generated=search_tree.size - first_id, expanded=expanded,
+                           heap_pushes=state_counter, heap_pops=pops,
+                           max_frontier=max_frontier, max_depth=max_depth)
     return None
 
-def ordered_search(G, vertices, root_id, log_filename="ordered_log.txt"):
+def ordered_search(G, vertices, root_id, log_filename="ordered_log.txt", log_mode="full",
+                   transposition=True, symmetry=False, num_colors=4):
+    """
+    Busca ordenada pelo custo acumulado. Cada estado é (search_node, tree_id,
+    custo, canon); a tabela de transposição, 'symmetry' e 'num_colors'
+    funcionam como em astar_search.
+    """
     open_list = []
     closed_states = []
     state_counter = 0
-    initial_state = ({}, 0, root_id, 0)
+    root = SearchNode()
+    trail = TrailState(G, root, num_colors)
+    packing = PackedColoring(G, vertices, num_colors)
+    table = TranspositionTable() if transposition else None
+    initial_state = (root, root_id, 0, packing.canonical_root())
     heapq.heappush(open_list, (0, state_counter, initial_state))
     state_counter += 1
     iteration = 0
+    describe = lambda s: state_to_string(s, "ordered")
+    add_node = search_tree.add
+    first_id = search_tree.size
+    if metrics is not None:
+        metrics.instrument(trail)
+    expanded = pops = max_frontier = max_depth = 0
 
-    with open(log_filename, "w", encoding="utf-8") as log_file:
-        while open_list:
-            log_file.write(f"Iteração {iteration}:\n")
-            log_file.write("Abertos: " + ", ".join([state_to_string(s, vertices, "ordered") for _, _, s in open_list]) + "\n")
-            log_file.write("Fechados: " + ", ".join([state_to_string(s, vertices, "ordered") for s in closed_states]) + "\n\n")
-            iteration += 1
-
-            _, _, state = heapq.heappop(open_list)
-            assignment, index, tree_node_id, current_cost = state
-
-            if index == len(vertices):
-                sol_label = f"Solução: {assignment}, Custo Total: {current_cost}"
-                add_tree_node(sol_label, tree_node_id)
-                return state
-
-            vertex = vertices[index]
-            for color in [1, 2, 3, 4]:
-                if is_valid(G, vertex, color, assignment):
-                    new_assignment = assignment.copy()
-                    new_assignment[vertex] = color
-                    additional_cost = cost_for_vertex(G, vertex, new_assignment)
-                    new_cost = current_cost + additional_cost
-                    new_index = index + 1
-                    new_label = f"{vertex}={color}"
-                    new_tree_node_id = add_tree_node(new_label, tree_node_id)
-                    new_state = (new_assignment, new_index, new_tree_node_id, new_cost)
+    try:
+        with open_search_log(log_mode, log_filename, describe, state_key) as log:
+            log.push(initial_state)
+            while open_list:
+                log.iteration(iteration, (s for _, _, s in open_list), closed_states)
+                iteration += 1
+
+                if len(open_list) > max_frontier:
+                    max_frontier = len(open_list)
+                _, _, state = heapq.heappop(open_list)
+                pops += 1
+                log.pop(state)
+                node, tree_node_id, current_cost, canon = state
+                index = node.depth
+                if table is not None and index and table.is_stale((index, canon[0]), current_cost):
+                    continue
+                if index > max_depth:
+                    max_depth = index
+
+                if index == len(vertices):
+                    assignment = node.assignment()
+                    add_node(tree_node_id, g=current_cost, kind=SOLUTION)
+                    return (assignment, index, tree_node_id, current_cost)
+
+                trail.goto(node)
+                vertex = vertices[index]
+                expanded += 1
+                additional_cost = trail.cost_for_vertex(vertex)
+                new_cost = current_cost + additional_cost
+                for color in trail.legal_colors(vertex, symmetry):
+                    new_canon = packing.canonical_child(canon, index, color)
+                    if table is not None and not table.offer((index + 1, new_canon[0]), new_cost):
+                        continue
+                    new_node = SearchNode(vertex, color, node)
+                    new_tree_node_id = add_node(tree_node_id, vertex, color, new_cost)
+                    new_state = (new_node, new_tree_node_id, new_cost, new_canon)
                     heapq.heappush(open_list, (new_cost, state_counter, new_state))
                     state_counter += 1
-            closed_states.append(state)
+                    log.push(new_state)
+                if log.keeps_closed:
+                    closed_states.append(state)
+                log.close_state(state)
+    finally:
+        if metrics is not None:
+            metrics.record(generated=search_tree.size - first_id, expanded=expanded,
+                           heap_pushes=state_counter, heap_pops=pops,
+                           max_frontier=max_frontier, max_depth=max_depth)
     return None
 
-def greedy_search(G, vertices, root_id, log_filename="greedy_log.txt"):
-    assignment = {}
+def greedy_search(G, vertices, root_id, log_filename="greedy_log.txt", symmetry=False,
+                  num_colors=4):
+    state = ColorState(G, num_colors)
     current_cost = 0
     current_tree_node_id = root_id
+    first_id = search_tree.size
+    if metrics is not None:
+        metrics.instrument(state)
+    expanded = max_frontier = max_depth = 0
 
-    with open(log_filename, "w", encoding="utf-8") as log_file:
-        for index, vertex in enumerate(vertices):
-            log_file.write(f"\n=== Iteração para vértice {vertex} ===\n")
-            abertos = []
+    try:
+        with open(log_filename, "w", encoding="utf-8") as log_file:
+            for index, vertex in enumerate(vertices):
+                log_file.write(f"\n=== Iteração para vértice {vertex} ===\n")
+                abertos = []
+                expanded += 1
             
-            for color in [1, 2, 3, 4]:
-                if is_valid(G, vertex, color, assignment):
-                    new_assignment = assignment.copy()
-                    new_assignment[vertex] = color
-                    additional_cost = cost_for_vertex(G, vertex, new_assignment)
+                additional_cost = state.cost_for_vertex(vertex)
+                for color in state.legal_colors(vertex, symmetry):
                     abertos.append((vertex, color, additional_cost))
+                max_frontier = max(max_frontier, len(abertos))
             
-            if not abertos:
-                log_file.write("Abertos: (nenhum estado válido)\n")
-                return None
+                if not abertos:
+                    log_file.write("Abertos: (nenhum estado válido)\n")
+                    return None
             
-            chosen_state = min(abertos, key=lambda x: x[2])
-            (chosen_vertex, chosen_color, chosen_add_cost) = chosen_state
+                chosen_state = min(abertos, key=lambda x: x[2])
+                (chosen_vertex, chosen_color, chosen_add_cost) = chosen_state
             
-            assignment[chosen_vertex] = chosen_color
-            current_cost += chosen_add_cost
+                state.assign(chosen_vertex, chosen_color)
+                current_cost += chosen_add_cost
+                max_depth = index + 1
             
-            new_label = f"{chosen_vertex}={chosen_color}"
-            current_tree_node_id = add_tree_node(new_label, current_tree_node_id)
+                current_tree_node_id = search_tree.add(current_tree_node_id, chosen_vertex, chosen_color, current_cost)
     
-    sol_label = f"Solução: {assignment}, Custo Total: {current_cost}"
-    add_tree_node(sol_label, current_tree_node_id)
-    return (assignment, len(vertices), current_tree_node_id, current_cost)
+        assignment = state.assignment(vertices)
+        search_tree.add(current_tree_node_id, g=current_cost, kind=SOLUTION)
+        return (assignment, len(vertices), current_tree_node_id, current_cost)
+    finally:
+        if metrics is not None:
+            metrics.record(generated=search_tree.size - first_id, expanded=expanded,
+                           max_frontier=max_frontier, max_depth=max_depth)
+
+def idastar_search(G, vertices, root_id, log_filename="idastar_log.txt", heuristic="remaining",
+                   symmetry=False, num_colors=4):
+    """
+    IDA*: busca em profundidade limitada por f = g + h, repetida com o limite
+    elevado ao menor f que ultrapassou o limite da rodada anterior.
+    Usa um único ColorState (cada atribuição é desfeita ao voltar) e uma pilha
+    com um iterador de cores por nível, então a memória é O(n). O log registra
+    o limite e o número de nós gerados em cada rodada. 'heuristic' é como em
+    astar_search; com a heurística exata (remaining) basta uma rodada. 'symmetry'
+    e 'num_colors' são como em astar_search.
+    Retorna (assignment, index, tree_id, custo) ou None se não houver solução.
+    """
+    state = ColorState(G, num_colors)
+    n = len(vertices)
+    add_node = search_tree.add
+    h_table = heuristic_table(heuristic, G, vertices)
+    bound = h_table[0]
+    round_number = 0
+    first_id = search_tree.size
+    if metrics is not None:
+        metrics.instrument(state)
+    expanded = max_depth = 0
+
+    try:
+        with open(log_filename, "w", encoding="utf-8") as log_file:
+            while True:
+                next_bound = math.inf
+                generated = 0
+                # Cada nível: (tree_id do pai, g e h dos filhos, cores ainda não tentadas)
+                frames = []
+                tree_id, g = root_id, 0
+                while True:
+                    index = len(frames)
+                    if index > max_depth:
+                        max_depth = index
+                    if index == n:
+                        assignment = state.assignment(vertices)
+                        add_node(tree_id, g=g, kind=SOLUTION)
+                        log_file.write(f"Rodada {round_number}: limite f = {bound}, nós gerados = {generated}, solução encontrada\n")
+                        return (assignment, index, tree_id, g)
+
+                    vertex = vertices[index]
+                    child_g = g + state.cost_for_vertex(vertex)
+                    child_h = h_table[index + 1]
+                    child_f = child_g + child_h
+                    if child_f <= bound:
+                        colors = iter(state.legal_colors(vertex, symmetry))
+                        expanded += 1
+                    else:
+                        next_bound = min(next_bound, child_f)
+                        colors = iter(())
+                    frames.append((tree_id, child_g, child_h, colors))
+
+                    # Avança para o próximo filho, voltando enquanto o nível estiver esgotado
+                    while frames:
+                        parent_id, child_g, child_h, colors = frames[-1]
+                        vertex = vertices[len(frames) - 1]
+                        if state.colors[vertex]:
+                            state.unassign(vertex)
+                        color = next(colors, None)
+                        if color is not None:
+                            state.assign(vertex, color)
+                            tree_id = add_node(parent_id, vertex, color, child_g, child_h)
+                            g = child_g
+                            generated += 1
+                            break
+                        frames.pop()
+                    if not frames:
+                        break
+
+                log_file.write(f"Rodada {round_number}: limite f = {bound}, nós gerados = {generated}, próximo limite = {next_bound}\n")
+                if next_bound == math.inf:
+                    return None
+                bound = next_bound
+                round_number += 1
+    finally:
+        if metrics is not None:
+            metrics.record(generated=search_tree.size - first_id, expanded=expanded, max_depth=max_depth)
 
 def draw_colored_graph(G, assignment, output_file, title):
-    color_map = {1: "red", 2: "green", 3: "blue", 4: "yellow"}
-    node_colors = [color_map.get(assignment.get(node, 0), "gray") for node in G.nodes()]
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
+    G = G.to_networkx()
+    node_colors = [color_name(assignment.get(node)) for node in G.nodes()]
     
     try:
         pos = nx.nx_agraph.graphviz_layout(G, prog='dot')
@@ -225,7 +340,9 @@ def draw_colored_graph(G, assignment, output_file, title):
     plt.close()
 
 def draw_search_tree(tree, output_file, title):
-    color_map = {"1": "red", "2": "green", "3": "blue", "4": "yellow"}
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
     node_colors = []
     labels = nx.get_node_attributes(tree, 'label')
     
@@ -241,7 +358,7 @@ def draw_search_tree(tree, output_file, title):
             parts = label.split("=")
             vertex_part = parts[0]
             color_part = parts[1].split("\n")[0].strip() if "\n" in label else parts[1]
-            color = color_map.get(color_part, "lightgray")
+            color = color_name(color_part, "lightgray")
             
             # Formatação especial para nós de solução
             if "Solução" in label:
@@ -288,37 +405,90 @@ def draw_search_tree(tree, output_file, title):
     plt.close()
 
 def main():
+    global search_tree, metrics
     parser = argparse.ArgumentParser(description="Algoritmos de Coloração de Grafos")
     parser.add_argument("file_path", help="Caminho do arquivo de entrada")
-    parser.add_argument("--algorithm", choices=["greedy", "ordered", "astar"], default="greedy",
+    parser.add_argument("--algorithm", choices=["greedy", "ordered", "astar", "idastar"], default="greedy",
                       help="Algoritmo a ser utilizado (padrão: greedy)")
+    parser.add_argument("--log-mode", choices=LOG_MODES, default="full",
+                      help="Log de abertos/fechados da busca ordenada: completo, só mudanças ou desligado (padrão: full)")
+    parser.add_argument("--heuristic", choices=sorted(HEURISTICS), default="remaining",
+                      help="Heurística do A* e do IDA* (padrão: remaining, custo restante exato)")
+    parser.add_argument("--no-transposition", action="store_true",
+                      help="Desliga a tabela de transposição do A* e da busca ordenada")
+    parser.add_argument("--symmetry", action="store_true",
+                      help="Quebra a simetria de cores: cada vértice só recebe cores até (maior cor usada + 1)")
+    add_palette_arguments(parser)
+    add_tree_arguments(parser)
+    add_metrics_arguments(parser)
+    add_profile_arguments(parser)
+    add_output_arguments(parser)
     args = parser.parse_args()
+    stdout = output_from_args(args)
+    search_tree = recorder_from_args(parser, args)
+    metrics = metrics_from_args(parser, args)
+    profiler = profiler_from_args(parser, args)
 
-    G = read_graph(args.file_path)
+    with timed(metrics, "parse"):
+        G = read_graph(args.file_path, weighted=True)
     vertices = sorted(G.nodes())
-    root_id = add_tree_node("root")
+    root_id = search_tree.add(kind=ROOT)
 
     solution = None
     log_file = ""
     output_prefix = args.algorithm
 
-    if args.algorithm == "astar":
-        solution = astar_search(G, vertices, root_id, f"{output_prefix}_log.txt")
-        draw_colored_graph(G, solution[0] if solution else {}, f"colored_graph_{output_prefix}.png", "Busca A*")
-        draw_search_tree(search_tree, f"search_tree_{output_prefix}.png", "Árvore de Busca A* (g, h, f)")
-    elif args.algorithm == "ordered":
-        solution = ordered_search(G, vertices, root_id, f"{output_prefix}_log.txt")
-        draw_colored_graph(G, solution[0] if solution else {}, f"colored_graph_{output_prefix}.png", "Busca Ordenada")
-        draw_search_tree(search_tree, f"search_tree_{output_prefix}.png", "Árvore de Busca Ordenada")
-    else:
-        solution = greedy_search(G, vertices, root_id, f"{output_prefix}_log.txt")
-        draw_colored_graph(G, solution[0] if solution else {}, f"colored_graph_{output_prefix}.png", "Busca Gulosa")
-        draw_search_tree(search_tree, f"search_tree_{output_prefix}.png", "Árvore de Busca Gulosa")
-
+    start = time.perf_counter()
+    with timed(metrics, "search"), profiled(profiler, "search"):
+        if args.algorithm == "astar":
+            solution = astar_search(G, vertices, root_id, f"{output_prefix}_log.txt",
+                                    transposition=not args.no_transposition, heuristic=args.heuristic,
+                                    symmetry=args.symmetry, num_colors=args.colors)
+            graph_title = "Busca A*"
+            tree_title = "Árvore de Busca A* (g, h, f)"
+        elif args.algorithm == "idastar":
+            solution = idastar_search(G, vertices, root_id, f"{output_prefix}_log.txt", heuristic=args.heuristic,
+                                      symmetry=args.symmetry, num_colors=args.colors)
+            graph_title = "Busca IDA*"
+            tree_title = "Árvore de Busca IDA* (g, h, f)"
+        elif args.algorithm == "ordered":
+            solution = ordered_search(G, vertices, root_id, f"{output_prefix}_log.txt", args.log_mode,
+                                      transposition=not args.no_transposition, symmetry=args.symmetry,
+                                      num_colors=args.colors)
+            graph_title = "Busca Ordenada"
+            tree_title = "Árvore de Busca Ordenada"
+        else:
+            solution = greedy_search(G, vertices, root_id, f"{output_prefix}_log.txt", symmetry=args.symmetry,
+                                     num_colors=args.colors)
+            graph_title = "Busca Gulosa"
+            tree_title = "Árvore de Busca Gulosa"
+    seconds = time.perf_counter() - start
+
+    if not args.no_draw:
+        with timed(metrics, "render"):
+            draw_colored_graph(G, solution[0] if solution else {}, f"colored_graph_{output_prefix}.png", graph_title)
+        if search_tree.mode != "off":
+            with timed(metrics, "render"):
+                path, drawn, stored = render_search_tree(search_tree, lambda t, row: tree_label(t, row, args.algorithm),
+                                                         f"search_tree_{output_prefix}.png", args,
+                                                         lambda tree, path: draw_search_tree(tree, path, tree_title),
+                                                         tree_title)
+            print(f"Árvore de busca salva em '{path}' ({drawn} de {stored} nós).")
+    if args.tree_export:
+        search_tree.save(args.tree_export)
+        print(f"Árvore de busca exportada para '{args.tree_export}'.")
     if solution:
         print(f"Solução encontrada: {solution[0]}\nCusto Total: {solution[-1]}")
     else:
         print("Nenhuma solução encontrada.")
+    if metrics is not None:
+        metrics.save(args.metrics)
+        print(f"Métricas salvas em '{args.metrics}'.")
+    if profiler is not None:
+        summary = profiler.save()
+        print(f"Perfil salvo em '{args.profile}' (resumo em '{summary}').")
+    write_result(args, stdout, args.algorithm, solution[0] if solution else None, search_tree.size, seconds,
+                 custo=solution[-1] if solution else None)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -1,163 +1,559 @@
-import networkx as nx
-import matplotlib.pyplot as plt
-
-search_tree = nx.DiGraph()
-node_counter = 0
-
-def add_tree_node(label, parent_node_id=None):
-    """
-    Cria um novo nó na árvore de busca com o rótulo 'label' e, se informado,
-    adiciona uma aresta do nó 'parent_node_id' para o novo nó.
-    """
-    global node_counter
-    node_id = node_counter
-    node_counter += 1
-    search_tree.add_node(node_id, label=label)
-    if parent_node_id is not None:
-        search_tree.add_edge(parent_node_id, node_id)
-    return node_id
-
-def read_graph(file_path):
-    """
-    Lê o arquivo e cria o grafo.
-    Espera o arquivo no seguinte formato:
-      DIMENSION
-      <número de vértices>
-      GRAPH
-      <u1> <v1>
-      <u2> <v2>
-      ...
-    """
-    with open(file_path, 'r') as f:
-        lines = [line.strip() for line in f if line.strip()]
-    
-    if lines[0].upper() != "DIMENSION":
-        raise ValueError("Erro no formato do arquivo: Esperado 'DIMENSION' na primeira linha.")
-    dimension = int(lines[1])
-    
-    if lines[2].upper() != "GRAPH":
-        raise ValueError("Erro no formato do arquivo: Esperado 'GRAPH' após a dimensão.")
-    
-    edges = []
-    for line in lines[3:]:
-        parts = line.split()
-        if len(parts) >= 2:
-            u = int(parts[0])
-            v = int(parts[1])
-            edges.append((u, v))
-    
-    G = nx.Graph()
-    G.add_nodes_from(range(1, dimension + 1))
-    G.add_edges_from(edges)
-    return G
-
-def is_valid(G, vertex, color, assignment):
-    """
-    Verifica se é válido colorir 'vertex' com 'color', ou seja, nenhum
-    vizinho já colorido tem a mesma cor.
-    """
-    for neighbor in G.neighbors(vertex):
-        if neighbor in assignment and assignment[neighbor] == color:
-            return False
-    return True
-
-def backtrack(G, vertices, index, assignment, parent_node_id):
-    """
-    Função recursiva que implementa o algoritmo de backtracking.
-    - G: grafo
-    - vertices: lista ordenada de vértices
-    - index: índice do vértice atual a ser colorido
-    - assignment: dicionário com as cores atribuídas (ex: {1: 2, 2: 4, ...})
-    - parent_node_id: nó da árvore de busca do qual este estado deriva
-    A busca para ao encontrar a primeira solução válida.
-    """
-    if index == len(vertices):
-        node_label = "Solução: " + str(assignment)
-        add_tree_node(node_label, parent_node_id)
-        return True, assignment
-
-    vertex = vertices[index]
-    for color in [1, 2, 3, 4]:
-        if is_valid(G, vertex, color, assignment):
-            assignment[vertex] = color
-            node_label = f"{vertex} = {color}"
-            new_node_id = add_tree_node(node_label, parent_node_id)
-            found, sol = backtrack(G, vertices, index + 1, assignment, new_node_id)
-            if found:
-                return True, sol
-            del assignment[vertex]
-    return False, None
-
-def draw_colored_graph(G, assignment, output_file="colored_graph.png"):
-    """
-    Desenha o grafo colorido usando o dicionário 'assignment' e salva a imagem.
-    """
-    color_map = {1: "red", 2: "green", 3: "blue", 4: "yellow"}
-    node_colors = [color_map[assignment[node]] if node in assignment else "gray" for node in G.nodes()]
-    pos = nx.spring_layout(G)
-    plt.figure(figsize=(8, 6))
-    nx.draw(G, pos, with_labels=True, node_color=node_colors, node_size=800, font_size=12)
-    plt.title("Grafo Colorido")
-    plt.savefig(output_file)
-    plt.close()
-
-def draw_search_tree(tree, output_file="search_tree_bfs.png"):
-    """
-    Desenha a árvore de busca com nós preenchidos com a cor correspondente.
-    Tenta usar um layout hierárquico com Graphviz, aplicando espaçamentos personalizados;
-    caso não seja possível, utiliza um layout padrão.
-    """
-    try:
-        pos = nx.nx_agraph.graphviz_layout(tree, prog='dot', args='-Granksep=2 -Gnodesep=1')
-    except Exception as e:
-        pos = nx.spring_layout(tree)
-    
-    labels = nx.get_node_attributes(tree, 'label')
-    mapping = {"1": "red", "2": "green", "3": "blue", "4": "yellow"}
-    
-    node_colors = []
-    for n in tree.nodes():
-        label = labels.get(n, "")
-        fill_color = "lightgray" 
-        if " = " in label:
-            try:
-                parts = label.split(" = ")
-                candidate = parts[-1].strip()
-                if candidate in mapping:
-                    fill_color = mapping[candidate]
-            except Exception as ex:
-                fill_color = "lightgray"
-        node_colors.append(fill_color)
-    
-    plt.figure(figsize=(16, 12))
-    nx.draw(tree, pos, with_labels=True, labels=labels, node_color=node_colors,
-            node_size=500, font_size=10, arrows=True)
-    plt.title("Árvore de Busca (BFS) com nós coloridos")
-    plt.savefig(output_file)
-    plt.close()
-
-
-def main():
-    import sys
-    if len(sys.argv) < 2:
-        print("Uso: python script.py <arquivo_grafo>")
-        sys.exit(1)
-    
-    file_path = sys.argv[1]
-    G = read_graph(file_path)
-    vertices = list(G.nodes())
-    vertices.sort() 
-    root_id = add_tree_node("root")
-    found, solution = backtrack(G, vertices, 0, {}, root_id)
-    if found:
-        print("Solução encontrada:", solution)
-    else:
-        print("Nenhuma solução encontrada.")
-    
-    draw_colored_graph(G, solution)
-    print("Grafo colorido salvo em 'colored_graph.png'.")
-    draw_search_tree(search_tree)
-    print("Árvore de busca salva em 'search_tree.png'.")
-
-if __name__ == '__main__':
-    main()
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from core import (ColorState, DsaturState, DomainStore, NogoodStore, PROPAGATION_MODES, read_graph,
+                  ROOT, SOLUTION, SearchTreeRecorder, add_tree_arguments, recorder_from_args,
+                  add_palette_arguments, chromatic_number, color_name,
+                  add_solution_arguments, solutions_from_args, symmetry_weight, write_solutions,
+                  BudgetExceeded, BudgetRecorder, parallel_search,
+                  add_metrics_arguments, metrics_from_args, timed,
+                  add_profile_arguments, profiler_from_args, profiled, render_search_tree,
+                  add_output_arguments, output_from_args, write_result)
+
+# Árvore de busca (ver core.tree); main() a troca pelo modo pedido na linha de comando.
+search_tree = SearchTreeRecorder()
+# Métricas da execução (ver core.metrics); None quando --metrics não é usado.
+metrics = None
+# Tamanho máximo dos nogoods reaproveitados entre os valores de k no modo
+# --chromatic quando --learn não é informado.
+CHROMATIC_NOGOOD_SIZE = 8
+
+def tree_label(tree, row):
+    """Formata o rótulo de um nó da árvore de busca; só é chamada ao desenhar."""
+    kind = tree.kind[row]
+    if kind == ROOT:
+        return "root"
+    if kind == SOLUTION:
+        return "Solução: " + str(tree.assignment(row))
+    return f"{tree.vertex[row]} = {tree.color[row]}"
+
+def search_leaves(state, vertices, index, parent_node_id, dsatur=False, domains=None, symmetry=False,
+                  nogoods=None):
+    """
+    Algoritmo de backtracking, iterativo, como gerador: a cada coloração
+    completa registra o nó de solução na árvore e devolve o ID dele; nesse
+    momento 'state' contém a coloração. Ao ser retomado, continua a busca.
+    - state: ColorState com a coloração parcial e as cores proibidas de cada vértice
+    - vertices: lista ordenada de vértices
+    - index: índice do vértice atual a ser colorido
+    - parent_node_id: nó da árvore de busca do qual este estado deriva
+    - dsatur: se verdadeiro, 'state' é um DsaturState e o próximo vértice é o de
+      maior saturação (DSATUR) em vez de vertices[index]
+    - domains: DomainStore opcional; as cores tentadas vêm dos domínios e cada
+      atribuição é propagada (forward checking ou AC-3), podando o ramo assim
+      que algum domínio esvazia. As reduções são desfeitas ao voltar.
+    - symmetry: só tenta cores até (maior cor usada + 1), quebrando a simetria
+      entre colorações que diferem por uma troca de cores
+    - nogoods: NogoodStore opcional (só com index == 0); cada coloração parcial
+      cujas extensões falharam todas é guardada como nogood, e as cores que
+      completam um nogood guardado não são tentadas. Só vale para colorações
+      parciais de até nogoods.max_size vértices, e só até a primeira solução.
+    Em vez de uma chamada recursiva por vértice, o nível atual fica em variáveis
+    locais (vértice, iterador das cores ainda não tentadas, nó pai na árvore e
+    marca da trilha de domínios) e os níveis acima dele em uma pilha explícita,
+    então a profundidade não esbarra no limite de recursão.
+    Se o registro da árvore interromper a busca com BudgetExceeded (busca
+    paralela), a exceção leva em 'subtasks' os ramos ainda não tentados de cada
+    nível da pilha, como colorações parciais relativas a 'index', na ordem em
+    que a busca os visitaria (ver unexplored_branches).
+    """
+    n = len(vertices)
+    add_node = search_tree.add
+    colors_of = state.colors
+    assign = state.assign
+    unassign = state.unassign
+    stack = []
+    depth = index
+    node_id = parent_node_id
+    first_id = search_tree.size
+    expanded = 0
+    max_depth = depth
+
+    try:
+        while True:
+            if depth == n:
+                max_depth = n
+                add_node(node_id, kind=SOLUTION)
+                yield node_id
+                # Depois de uma solução, esgotar um nível não prova mais que ele falha.
+                nogoods = None
+                # Nível vazio: o laço abaixo volta direto ao último vértice colorido.
+                pending = iter(())
+            else:
+                # Abre o nível do próximo vértice.
+                expanded += 1
+                if depth > max_depth:
+                    max_depth = depth
+                vertex = state.select_vertex() if dsatur else vertices[depth]
+                if domains is not None:
+                    colors = domains.legal_colors(vertex, state.max_color() if symmetry else None)
+                    mark = domains.mark()
+                else:
+                    colors = state.legal_colors(vertex, symmetry)
+                    mark = 0
+                pending = iter(colors)
+                parent = node_id
+
+            # Tenta a próxima cor do nível; se as cores acabaram, volta ao nível de
+            # cima desfazendo a cor dele. O iterador 'pending' é o cursor do nível:
+            # o for retoma de onde parou.
+            while True:
+                for color in pending:
+                    if nogoods is not None and nogoods.violated(vertex, color, colors_of) is not None:
+                        continue
+                    assign(vertex, color)
+                    node_id = add_node(parent, vertex, color)
+                    if domains is None or domains.assign(vertex, color):
+                        break
+                    domains.undo(mark)
+                    unassign(vertex)
+                else:
+                    # Nenhuma cor do nível levou a uma solução: a coloração dos
+                    # níveis de cima não tem extensão.
+                    if nogoods is not None and len(stack) <= nogoods.max_size:
+                        nogoods.record_path([(v, colors_of[v]) for v, _, _, _ in stack])
+                    if not stack:
+                        return
+                    vertex, pending, parent, mark = stack.pop()
+                    depth -= 1
+                    if domains is not None:
+                        domains.undo(mark)
+                    unassign(vertex)
+                    continue
+                break
+
+            stack.append((vertex, pending, parent, mark))
+            depth += 1
+    except BudgetExceeded as exc:
+        # Só o registro de um passo interrompe a busca, com 'color' ainda sem nó.
+        exc.subtasks = unexplored_branches(stack, (vertex, color, pending), state.colors)
+        raise
+    finally:
+        # Também roda quando o gerador é fechado na primeira solução (ver backtrack).
+        if metrics is not None:
+            metrics.record(generated=search_tree.size - first_id, expanded=expanded, max_depth=max_depth)
+
+def unexplored_branches(stack, current, colors):
+    """
+    Ramos que search_leaves ainda não tentou, como tuplas de (vértice, cor)
+    a partir do seu primeiro nível, na ordem em que ela os visitaria: primeiro
+    as cores restantes do nível mais fundo, depois as dos níveis de cima.
+    - stack: níveis empilhados (vértice, iterador das cores restantes, ...),
+      cada vértice com a cor atual em 'colors'
+    - current: (vértice, cor interrompida, iterador das cores restantes) do
+      nível aberto; a cor interrompida ainda não tinha gerado o seu nó
+    """
+    path = []
+    levels = []
+    for vertex, pending, _, _ in stack:
+        levels.append([tuple(path) + ((vertex, color),) for color in pending])
+        path.append((vertex, colors[vertex]))
+    vertex, color, pending = current
+    levels.append([tuple(path) + ((vertex, c),) for c in (color, *pending)])
+    return [branch for level in reversed(levels) for branch in level]
+
+def backtrack(state, vertices, index, parent_node_id, dsatur=False, domains=None, symmetry=False,
+              nogoods=None):
+    """
+    Busca por backtracking (ver search_leaves para os parâmetros) que para na
+    primeira solução válida e retorna (True, dicionário com as cores atribuídas,
+    ex: {1: 2, 2: 4, ...}) ou (False, None).
+    """
+    for _ in search_leaves(state, vertices, index, parent_node_id, dsatur, domains, symmetry, nogoods):
+        return True, state.assignment(vertices)
+    return False, None
+
+def all_solutions(state, vertices, parent_node_id, dsatur=False, domains=None, symmetry=False):
+    """Gera, uma de cada vez, todas as colorações válidas como dicionários."""
+    for _ in search_leaves(state, vertices, 0, parent_node_id, dsatur, domains, symmetry):
+        yield state.assignment(vertices)
+
+def count_solutions(state, vertices, parent_node_id, dsatur=False, domains=None, symmetry=False):
+    """
+    Conta as colorações válidas sem montá-las. Com 'symmetry', cada coloração
+    gerada vale pelas k! / (k - m)! que diferem dela por uma troca de cores.
+    """
+    total = 0
+    num_colors = state.num_colors
+    for _ in search_leaves(state, vertices, 0, parent_node_id, dsatur, domains, symmetry):
+        total += symmetry_weight(num_colors, state.max_color()) if symmetry else 1
+    return total
+
+def backjump(state, vertices, index, parent_node_id, dsatur, level, nogoods=None, symmetry=False):
+    """
+    Backtracking com backjumping dirigido por conflitos (CBJ).
+    Para cada vértice mantém o conjunto de conflitos: os vértices já coloridos
+    responsáveis por descartar alguma de suas cores (o vizinho colorido mais
+    antigo com aquela cor) e os conflitos devolvidos pelas subárvores que
+    falharam. Se uma subárvore falha sem envolver o vértice atual, a busca volta
+    direto ao vértice mais recente do conflito, pulando os intermediários.
+    - level: profundidade em que cada vértice foi colorido
+    - nogoods: NogoodStore opcional; ao esgotar as cores de um vértice, o seu
+      conjunto de conflitos (com as cores atuais) é guardado como nogood
+    - symmetry: como em backtrack; uma cor descartada só pela quebra de simetria
+      depende de todas as cores já usadas, então todos os vértices coloridos
+      entram no conjunto de conflitos
+    Como em search_leaves, o nível atual fica em variáveis locais e os de cima
+    em uma pilha explícita, cada um com o seu conjunto de conflitos; o salto é
+    feito desempilhando níveis até o vértice mais recente do conflito.
+    Retorna (True, solução, None) ou (False, None, conflitos).
+    """
+    n = len(vertices)
+    colors = state.colors
+    adjacency = state.graph.adjacency()
+    add_node = search_tree.add
+    stack = []
+    depth = index
+    node_id = parent_node_id
+
+    while True:
+        if metrics is not None:
+            metrics.record(expanded=int(depth < n), max_depth=depth)
+        if depth == n:
+            search_tree.add(node_id, kind=SOLUTION)
+            return True, state.assignment(vertices), None
+
+        # Abre o nível do próximo vértice com os conflitos das cores descartadas.
+        vertex = state.select_vertex() if dsatur else vertices[depth]
+        blame = {}
+        for neighbor in adjacency[vertex]:
+            c = colors[neighbor]
+            if c and (c not in blame or level[neighbor] < level[blame[c]]):
+                blame[c] = neighbor
+        conflicts = set(blame.values())
+        if symmetry:
+            top = state.max_color()
+            if any(c not in blame for c in range(top + 2, state.num_colors + 1)):
+                conflicts.update(u for u in vertices if colors[u])
+        pending = iter(state.legal_colors(vertex, symmetry))
+        parent = node_id
+
+        # Tenta a próxima cor do nível. Se as cores acabaram, o nível falha com
+        # 'conflicts' e os níveis de cima são desempilhados (desfazendo a cor de
+        # cada um) até o vértice mais recente do conflito, que absorve o
+        # conjunto e retoma as suas cores de onde parou.
+        while True:
+            for color in pending:
+                if nogoods is not None:
+                    culprits = nogoods.violated(vertex, color, colors)
+                    if culprits is not None:
+                        conflicts.update(culprits)
+                        continue
+                state.assign(vertex, color)
+                level[vertex] = depth
+                node_id = add_node(parent, vertex, color)
+                break
+            else:
+                if nogoods is not None:
+                    nogoods.record(conflicts, colors, level)
+                failed = conflicts
+                while True:
+                    if not stack:
+                        return False, None, failed
+                    vertex, pending, parent, conflicts = stack.pop()
+                    depth -= 1
+                    state.unassign(vertex)
+                    if vertex in failed:
+                        break
+                conflicts |= failed
+                conflicts.discard(vertex)
+                continue
+            break
+
+        stack.append((vertex, pending, parent, conflicts))
+        depth += 1
+
+def draw_colored_graph(G, assignment, output_file="colored_graph.png"):
+    """
+    Desenha o grafo colorido usando o dicionário 'assignment' e salva a imagem.
+    """
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
+    G = G.to_networkx()
+    node_colors = [color_name(assignment.get(node)) for node in G.nodes()]
+    pos = nx.spring_layout(G)
+    plt.figure(figsize=(8, 6))
+    nx.draw(G, pos, with_labels=True, node_color=node_colors, node_size=800, font_size=12)
+    plt.title("Grafo Colorido")
+    plt.savefig(output_file)
+    plt.close()
+
+def draw_search_tree(tree, output_file="search_tree_bfs.png"):
+    """
+    Desenha a árvore de busca com nós preenchidos com a cor correspondente.
+    Tenta usar um layout hierárquico com Graphviz, aplicando espaçamentos personalizados;
+    caso não seja possível, utiliza um layout padrão.
+    """
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
+    try:
+        pos = nx.nx_agraph.graphviz_layout(tree, prog='dot', args='-Granksep=2 -Gnodesep=1')
+    except Exception as e:
+        pos = nx.spring_layout(tree)
+    
+    labels = nx.get_node_attributes(tree, 'label')
+    node_colors = []
+    for n in tree.nodes():
+        label = labels.get(n, "")
+        fill_color = "lightgray" 
+        if " = " in label:
+            try:
+                parts = label.split(" = ")
+                fill_color = color_name(parts[-1].strip(), "lightgray")
+            except Exception as ex:
+                fill_color = "lightgray"
+        node_colors.append(fill_color)
+    
+    plt.figure(figsize=(16, 12))
+    nx.draw(tree, pos, with_labels=True, labels=labels, node_color=node_colors,
+            node_size=500, font_size=10, arrows=True)
+    plt.title("Árvore de Busca (BFS) com nós coloridos")
+    plt.savefig(output_file)
+    plt.close()
+
+def build_state(G, vertices, num_colors, args):
+    """Monta (state, dsatur, domains) conforme a ordem e a propagação pedidas."""
+    dsatur = args.order == "dsatur"
+    if dsatur:
+        state = DsaturState(G, vertices, num_colors, track_cost=False)
+    else:
+        state = ColorState(G, num_colors, track_cost=False)
+    domains = None
+    if args.propagation != "none":
+        domains = DomainStore(G, vertices, num_colors, mode=args.propagation)
+    if metrics is not None:
+        metrics.instrument(state)
+        if domains is not None:
+            metrics.instrument(domains)
+    return state, dsatur, domains
+
+def solve(G, vertices, num_colors, args, nogoods=None):
+    """
+    Roda o backtracking configurado na linha de comando com 'num_colors' cores,
+    pendurando a busca em uma nova raiz da árvore. Retorna (encontrou, solução).
+    """
+    root_id = search_tree.add(kind=ROOT)
+    state, dsatur, domains = build_state(G, vertices, num_colors, args)
+    if args.backjump:
+        level = [0] * (G.dimension + 1)
+        first_id = search_tree.size
+        found, solution, _ = backjump(state, vertices, 0, root_id, dsatur, level, nogoods, args.symmetry)
+        if metrics is not None:
+            metrics.record(generated=search_tree.size - first_id)
+    else:
+        found, solution = backtrack(state, vertices, 0, root_id, dsatur, domains, args.symmetry, nogoods)
+    return found, solution
+
+def apply_prefix(state, domains, prefix):
+    """Aplica as atribuições (vértice, cor) de 'prefix'; False se a propagação falhar."""
+    for vertex, color in prefix:
+        state.assign(vertex, color)
+        if domains is not None and not domains.assign(vertex, color):
+            return False
+    return True
+
+def expand_prefix(G, vertices, num_colors, args, prefix):
+    """
+    Filhos de uma coloração parcial 'prefix' na árvore do backtracking: o
+    próximo vértice (na ordem pedida) com cada uma das suas cores válidas.
+    """
+    state, dsatur, domains = build_state(G, vertices, num_colors, args)
+    if not apply_prefix(state, domains, prefix) or len(prefix) == len(vertices):
+        return []
+    vertex = state.select_vertex() if dsatur else vertices[len(prefix)]
+    if domains is not None:
+        colors = domains.legal_colors(vertex, state.max_color() if args.symmetry else None)
+    else:
+        colors = state.legal_colors(vertex, args.symmetry)
+    children = []
+    for color in colors:
+        if domains is not None:
+            mark = domains.mark()
+            consistent = domains.assign(vertex, color)
+            domains.undo(mark)
+            if not consistent:
+                continue
+        children.append(prefix + ((vertex, color),))
+    return children
+
+def initial_prefixes(G, vertices, num_colors, args, target):
+    """Aprofunda os prefixos nível a nível até haver pelo menos 'target' deles."""
+    prefixes = [()]
+    for _ in range(len(vertices)):
+        if len(prefixes) >= target:
+            break
+        prefixes = [child for prefix in prefixes
+                    for child in expand_prefix(G, vertices, num_colors, args, prefix)]
+    return prefixes
+
+# Grafo e opções de cada processo da busca paralela (ver init_worker).
+worker_context = None
+
+def init_worker(G, vertices, num_colors, args):
+    global worker_context
+    worker_context = (G, vertices, num_colors, args)
+
+def run_prefix(prefix):
+    """
+    Subproblema da busca paralela: o backtracking a partir de 'prefix', com
+    orçamento de args.split_budget nós. Se o orçamento acabar, devolve como
+    novos subproblemas os ramos que a busca ainda não tinha tentado (ver
+    unexplored_branches), de modo que nenhuma parte já explorada é refeita.
+    """
+    global search_tree
+    G, vertices, num_colors, args = worker_context
+    search_tree = BudgetRecorder(args.split_budget)
+    # O nó da última atribuição do prefixo: a busca que devolveu o ramo não
+    # chegou a gerá-lo. Assim cada nó da árvore é contado uma única vez.
+    parent = search_tree.add() if prefix else None
+    state, dsatur, domains = build_state(G, vertices, num_colors, args)
+    if not apply_prefix(state, domains, prefix):
+        return None, [], search_tree.size
+    try:
+        found, solution = backtrack(state, vertices, len(prefix), parent, dsatur, domains, args.symmetry)
+    except BudgetExceeded as exc:
+        return None, [prefix + branch for branch in exc.subtasks], search_tree.size
+    return solution, [], search_tree.size
+
+def report_chromatic(k, assignment, origin):
+    """Mostra o andamento de chromatic_number."""
+    if origin == "clique":
+        print(f"Limite inferior (clique gulosa): {k}")
+    elif origin == "dsatur":
+        print(f"Limite superior (DSATUR): {k}")
+    elif assignment is None:
+        print(f"k = {k}: sem coloração ({origin})")
+    else:
+        print(f"k = {k}: colorível ({origin})")
+
+def main():
+    global search_tree, metrics
+    parser = argparse.ArgumentParser(description="Coloração de grafos por backtracking")
+    parser.add_argument("file_path", help="Caminho do arquivo de entrada")
+    parser.add_argument("--order", choices=["static", "dsatur"], default="static",
+                        help="Ordem dos vértices: crescente ou dinâmica por saturação (padrão: static)")
+    parser.add_argument("--propagation", choices=PROPAGATION_MODES, default="none",
+                        help="Propagação a cada atribuição: nenhuma, forward checking ou AC-3 (padrão: none)")
+    parser.add_argument("--backjump", action="store_true",
+                        help="Usa backjumping dirigido por conflitos (CBJ) em vez do retrocesso cronológico")
+    parser.add_argument("--learn", type=int, default=0, metavar="K",
+                        help="Guarda nogoods de até K atribuições: com --backjump os conjuntos de conflito, "
+                             "sem ele as colorações parciais sem extensão "
+                             f"(padrão: 0, desligado; {CHROMATIC_NOGOOD_SIZE} com --chromatic)")
+    parser.add_argument("--symmetry", action="store_true",
+                        help="Quebra a simetria de cores: cada vértice só recebe cores até (maior cor usada + 1)")
+    parser.add_argument("--chromatic", action="store_true",
+                        help="Calcula o número cromático em vez de colorir com --colors cores")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                        help="Processos da busca paralela (padrão: 1, sem paralelismo; a árvore não é registrada)")
+    parser.add_argument("--split-budget", type=int, default=50000, metavar="NÓS",
+                        help="Com --jobs, nós que um subproblema gera antes de ser redividido (padrão: 50000)")
+    add_palette_arguments(parser)
+    add_solution_arguments(parser)
+    add_tree_arguments(parser)
+    add_metrics_arguments(parser)
+    add_profile_arguments(parser)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+    if args.backjump and args.propagation != "none":
+        parser.error("--backjump não pode ser combinado com --propagation")
+    if args.learn < 0:
+        parser.error("--learn não pode ser negativo")
+    enumerate_all = solutions_from_args(args)
+    if enumerate_all and (args.backjump or args.chromatic or args.learn):
+        parser.error("--all e --count não podem ser combinados com --backjump, --learn nem --chromatic")
+    if args.jobs < 1 or args.split_budget < 1:
+        parser.error("--jobs e --split-budget devem ser pelo menos 1")
+    if args.jobs > 1 and (args.backjump or args.chromatic or args.learn or enumerate_all):
+        parser.error("--jobs não pode ser combinado com --backjump, --learn, --chromatic, --all nem --count")
+    stdout = output_from_args(args)
+    search_tree = recorder_from_args(parser, args)
+    metrics = metrics_from_args(parser, args)
+    profiler = profiler_from_args(parser, args)
+    
+    with timed(metrics, "parse"):
+        G = read_graph(args.file_path)
+    vertices = list(G.nodes())
+    vertices.sort() 
+    # Os nogoods valem para qualquer número menor de cores, então o modo
+    # --chromatic usa o mesmo NogoodStore em todas as tentativas, com qualquer
+    # combinação de ordem, propagação e backjumping.
+    if args.chromatic:
+        nogoods = NogoodStore(args.learn or CHROMATIC_NOGOOD_SIZE)
+    else:
+        nogoods = NogoodStore(args.learn) if args.learn > 0 else None
+    solution = total = k = None
+    nodes = 0
+    start = time.perf_counter()
+    with timed(metrics, "search"), profiled(profiler, "search"):
+        if args.chromatic:
+            k, solution = chromatic_number(G, vertices,
+                                           lambda k, store: solve(G, vertices, k, args, store)[1],
+                                           nogoods, report_chromatic)
+            print("Número cromático:", k)
+            print("Solução encontrada:", solution)
+        elif enumerate_all:
+            root_id = search_tree.add(kind=ROOT)
+            state, dsatur, domains = build_state(G, vertices, args.colors, args)
+            if args.count:
+                total = count_solutions(state, vertices, root_id, dsatur, domains, args.symmetry)
+                print("Número de colorações válidas:", total)
+            else:
+                solutions = all_solutions(state, vertices, root_id, dsatur, domains, args.symmetry)
+                total = write_solutions(args.all, vertices, solutions)
+                print(f"{total} colorações gravadas em '{args.all}'.")
+        elif args.jobs > 1:
+            prefixes = initial_prefixes(G, vertices, args.colors, args, 8 * args.jobs)
+            solution, solved, nodes = parallel_search(prefixes, run_prefix, args.jobs, init_worker,
+                                                      (G, vertices, args.colors, args))
+            print(f"Busca paralela: {args.jobs} processos, {solved} subproblemas, {nodes} nós")
+            if metrics is not None:
+                # Os processos têm cópias próprias das métricas; só o total de nós volta.
+                metrics.record(generated=nodes)
+            if solution:
+                print("Solução encontrada:", solution)
+            else:
+                print("Nenhuma solução encontrada.")
+        else:
+            found, solution = solve(G, vertices, args.colors, args, nogoods)
+            if found:
+                print("Solução encontrada:", solution)
+            else:
+                print("Nenhuma solução encontrada.")
+    seconds = time.perf_counter() - start
+    
+    if not enumerate_all and not args.no_draw:
+        with timed(metrics, "render"):
+            draw_colored_graph(G, solution or {})
+        print("Grafo colorido salvo em 'colored_graph.png'.")
+    if search_tree.mode != "off" and args.jobs == 1 and not args.no_draw and not enumerate_all:
+        with timed(metrics, "render"):
+            path, drawn, stored = render_search_tree(search_tree, tree_label, "search_tree.png", args,
+                                                     lambda tree, path: draw_search_tree(tree, output_file=path),
+                                                     "Árvore de Busca (Backtracking)")
+        print(f"Árvore de busca salva em '{path}' ({drawn} de {stored} nós).")
+    if args.tree_export:
+        search_tree.save(args.tree_export)
+        print(f"Árvore de busca exportada para '{args.tree_export}'.")
+    if metrics is not None:
+        metrics.save(args.metrics)
+        print(f"Métricas salvas em '{args.metrics}'.")
+    if profiler is not None:
+        summary = profiler.save()
+        print(f"Perfil salvo em '{args.profile}' (resumo em '{summary}').")
+    nodes = nodes if args.jobs > 1 else search_tree.size
+    if enumerate_all:
+        write_result(args, stdout, "backtracking", None, nodes, seconds, status="enumeração", total=total)
+    elif args.chromatic:
+        write_result(args, stdout, "backtracking", solution, nodes, seconds, numero_cromatico=k)
+    else:
+        write_result(args, stdout, "backtracking", solution, nodes, seconds)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+import os
+import sys
+import csv
+import glob
+import json
+import time
+import signal
+import argparse
+import multiprocessing
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from core import (ENGINES, run_engine, read_graph, cost_for_vertex,
+                  add_palette_arguments, color_name, SearchProfiler, profiled)
+
+# Colunas do resumo, na ordem do CSV.
+SUMMARY_FIELDS = ["arquivo", "motor", "status", "cores", "custo", "nos_expandidos", "segundos", "saida", "solucao", "erro"]
+
+def collect_files(inputs, pattern):
+    """
+    Expande as entradas (diretórios, padrões glob ou arquivos) na lista de
+    arquivos de grafo, sem repetições e na ordem em que aparecem. De um
+    diretório são usados os arquivos que casam com 'pattern'.
+    """
+    files = []
+    seen = set()
+    for entry in inputs:
+        if os.path.isdir(entry):
+            matches = sorted(glob.glob(os.path.join(entry, pattern)))
+        else:
+            matches = sorted(glob.glob(entry)) or [entry]
+        for path in matches:
+            key = os.path.abspath(path)
+            if key not in seen and not os.path.isdir(path):
+                seen.add(key)
+                files.append(path)
+    return files
+
+def output_folders(files, output_dir):
+    """Pasta de saída de cada arquivo: o nome dele sem extensão, com sufixo se repetido."""
+    folders = []
+    used = set()
+    for path in files:
+        name = os.path.splitext(os.path.basename(path))[0]
+        folder, suffix = name, 2
+        while folder in used:
+            folder, suffix = f"{name}_{suffix}", suffix + 1
+        used.add(folder)
+        folders.append(os.path.join(output_dir, folder))
+    return folders
+
+def coloring_cost(G, assignment):
+    """Custo da coloração: soma dos pesos das arestas entre vértices coloridos."""
+    colored = set()
+    cost = 0
+    for vertex in assignment:
+        cost += cost_for_vertex(G, vertex, colored)
+        colored.add(vertex)
+    return cost
+
+def draw_colored_graph(G, assignment, output_file="colored_graph.png"):
+    """
+    Desenha o grafo colorido usando o dicionário 'assignment' e salva a imagem.
+    """
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
+    G = G.to_networkx()
+    node_colors = [color_name(assignment.get(node)) for node in G.nodes()]
+    pos = nx.spring_layout(G)
+    plt.figure(figsize=(8, 6))
+    nx.draw(G, pos, with_labels=True, node_color=node_colors, node_size=800, font_size=12)
+    plt.title("Grafo Colorido")
+    plt.savefig(output_file)
+    plt.close()
+
+class TimeLimitExceeded(Exception):
+    """O arquivo passou do tempo limite do lote."""
+
+def _time_limit_handler(signum, frame):
+    raise TimeLimitExceeded()
+
+def solve_file(task):
+    """
+    Resolve um arquivo do lote em um processo do pool. Grava a coloração em
+    'solucao.txt' (uma linha "vértice cor" por vértice) na pasta do arquivo e
+    devolve a linha do resumo. Com 'time_limit' (segundos, só onde há SIGALRM)
+    a busca é interrompida ao passar do limite. Com 'profile_top' a busca roda
+    sob cProfile e o perfil fica em 'perfil.prof' e 'perfil_top.txt'.
+    """
+    path, folder, engine, weighted, symmetry, num_colors, draw, time_limit, profile_top = task
+    row = dict.fromkeys(SUMMARY_FIELDS, "")
+    row.update(arquivo=path, motor=engine, saida=folder)
+    start = time.perf_counter()
+    if time_limit:
+        signal.signal(signal.SIGALRM, _time_limit_handler)
+        signal.setitimer(signal.ITIMER_REAL, time_limit)
+    try:
+        G = read_graph(path, weighted=weighted)
+        vertices = sorted(G.nodes())
+        profiler = SearchProfiler(os.path.join(folder, "perfil.prof"), profile_top) if profile_top else None
+        with profiled(profiler, "search"):
+            solution, _, expanded = run_engine(engine, G, vertices, num_colors, symmetry)
+        if time_limit:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        row["segundos"] = round(time.perf_counter() - start, 6)
+        row["nos_expandidos"] = expanded
+        os.makedirs(folder, exist_ok=True)
+        if profiler is not None:
+            profiler.save()
+        if solution is None:
+            row["status"] = "sem coloração"
+        else:
+            row["status"] = "coloração"
+            row["cores"] = max(solution.values(), default=0)
+            row["custo"] = coloring_cost(G, solution)
+            row["solucao"] = " ".join(str(solution[v]) for v in vertices)
+            with open(os.path.join(folder, "solucao.txt"), "w", encoding="utf-8") as output:
+                for vertex in vertices:
+                    output.write(f"{vertex} {solution[vertex]}\n")
+            if draw:
+                draw_colored_graph(G, solution, os.path.join(folder, "colored_graph.png"))
+    except TimeLimitExceeded:
+        row["segundos"] = round(time.perf_counter() - start, 6)
+        row["status"] = "tempo esgotado"
+    except Exception as e:
+        row["segundos"] = round(time.perf_counter() - start, 6)
+        row["status"] = "erro"
+        row["erro"] = f"{type(e).__name__}: {e}"
+    finally:
+        if time_limit:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    return row
+
+def write_summary(output_dir, rows):
+    """Grava o resumo do lote em 'resumo.csv' e 'resumo.json' dentro de 'output_dir'."""
+    with open(os.path.join(output_dir, "resumo.csv"), "w", newline="", encoding="utf-8") as output:
+        writer = csv.DictWriter(output, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    with open(os.path.join(output_dir, "resumo.json"), "w", encoding="utf-8") as output:
+        json.dump(rows, output, ensure_ascii=False, indent=1)
+
+def main():
+    parser = argparse.ArgumentParser(description="Coloração de um lote de grafos em um pool de processos")
+    parser.add_argument("inputs", nargs="+", metavar="ENTRADA",
+                        help="Diretórios, padrões glob (entre aspas) ou arquivos de grafo")
+    parser.add_argument("--pattern", default="*.txt",
+                        help="Arquivos usados de cada diretório (padrão: *.txt)")
+    parser.add_argument("--engine", choices=list(ENGINES), default="dsatur",
+                        help="Motor de busca usado em todos os arquivos (padrão: dsatur)")
+    parser.add_argument("--output", default="resultados", metavar="DIRETÓRIO",
+                        help="Diretório das pastas de cada arquivo e do resumo (padrão: resultados)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, metavar="N",
+                        help="Processos do pool (padrão: número de CPUs)")
+    parser.add_argument("--time-limit", type=float, default=None, metavar="SEGUNDOS",
+                        help="Tempo máximo de cada arquivo; ao passar dele o arquivo fica como 'tempo esgotado'")
+    parser.add_argument("--weighted", action="store_true",
+                        help="Lê o custo de cada aresta (arquivos *custo.txt)")
+    parser.add_argument("--symmetry", action="store_true",
+                        help="Quebra a simetria de cores no motor escolhido")
+    parser.add_argument("--draw", action="store_true",
+                        help="Desenha o grafo colorido na pasta de cada arquivo (lento em lotes grandes)")
+    parser.add_argument("--profile", action="store_true",
+                        help="Roda a busca de cada arquivo sob cProfile e grava 'perfil.prof' e 'perfil_top.txt' na pasta dele")
+    parser.add_argument("--profile-top", type=int, default=20, metavar="N",
+                        help="Funções listadas em 'perfil_top.txt' (padrão: 20)")
+    add_palette_arguments(parser)
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs deve ser pelo menos 1")
+    if args.profile_top < 1:
+        parser.error("--profile-top deve ser pelo menos 1")
+    if args.time_limit is not None:
+        if args.time_limit <= 0:
+            parser.error("--time-limit deve ser positivo")
+        if not hasattr(signal, "SIGALRM"):
+            parser.error("--time-limit não está disponível neste sistema (exige SIGALRM)")
+
+    files = collect_files(args.inputs, args.pattern)
+    if not files:
+        parser.error("nenhum arquivo de grafo encontrado")
+    os.makedirs(args.output, exist_ok=True)
+    tasks = [(path, folder, args.engine, args.weighted, args.symmetry, args.colors, args.draw,
+              args.time_limit, args.profile_top if args.profile else None)
+             for path, folder in zip(files, output_folders(files, args.output))]
+
+    start = time.perf_counter()
+    rows = [None] * len(tasks)
+    with multiprocessing.Pool(min(args.jobs, len(tasks))) as pool:
+        # Os resultados chegam fora de ordem; o resumo segue a ordem dos arquivos.
+        done = pool.imap_unordered(solve_file, tasks)
+        position = {path: i for i, path in enumerate(files)}
+        for count, row in enumerate(done, 1):
+            rows[position[row["arquivo"]]] = row
+            print(f"[{count}/{len(tasks)}] {row['arquivo']}: {row['status']} em {row['segundos']:.2f}s")
+    write_summary(args.output, rows)
+
+    solved = sum(row["status"] == "coloração" for row in rows)
+    failed = sum(row["status"] == "erro" for row in rows)
+    print(f"{solved} de {len(rows)} arquivos coloridos ({failed} com erro) em {time.perf_counter() - start:.2f}s.")
+    print(f"Resumo salvo em '{os.path.join(args.output, 'resumo.csv')}' e "
+          f"'{os.path.join(args.output, 'resumo.json')}'.")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import multiprocessing
+import queue
+
+try:
+    import resource
+except ImportError:  # Windows: sem medição de memória
+    resource = None
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from core import ENGINES, GENERATORS, generate_graph, load_script, run_engine, read_graph, add_palette_arguments
+
+# Os seis motores dos scripts: backtrack, bfs, dfs, greedy_search, ordered_search e astar_search.
+DEFAULT_ENGINES = "backtracking,bfs,dfs,greedy,ordered,astar"
+DEFAULT_FAMILIES = ",".join(GENERATORS)
+DEFAULT_SIZES = "10,20,40"
+
+def peak_memory():
+    """Pico de memória residente do processo em bytes, ou None sem o módulo resource."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss vem em bytes no macOS e em KiB no Linux.
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def benchmark_worker(path, engine, weighted, num_colors, symmetry, memory_limit, results):
+    """
+    Processo de uma medição: lê o grafo, roda o motor e envia (status, segundos,
+    nós, memória). A memória é o quanto o pico do processo cresceu durante a busca.
+    """
+    if memory_limit and resource is not None:
+        limit = memory_limit * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    try:
+        G = read_graph(path, weighted=weighted, use_cache=False)
+        vertices = sorted(G.nodes())
+        before = peak_memory()
+        start = time.perf_counter()
+        solution, nodes, _ = run_engine(engine, G, vertices, num_colors, symmetry)
+        seconds = time.perf_counter() - start
+        after = peak_memory()
+        memory = None if before is None else after - before
+        results.put(("coloração" if solution is not None else "sem coloração", seconds, nodes, memory))
+    except MemoryError:
+        results.put(("memória esgotada", None, None, None))
+    except Exception as e:
+        results.put((f"erro: {type(e).__name__}: {e}", None, None, None))
+
+def measure(path, engine, weighted, num_colors, symmetry, timeout, memory_limit):
+    """
+    Mede um motor em um grafo em um processo separado, encerrado ao passar de
+    'timeout' segundos. Retorna (status, segundos, nós, memória em bytes).
+    """
+    results = multiprocessing.Queue()
+    process = multiprocessing.Process(target=benchmark_worker,
+                                      args=(path, engine, weighted, num_colors, symmetry,
+                                            memory_limit, results),
+                                      daemon=True)
+    process.start()
+    deadline = time.perf_counter() + timeout
+    try:
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return "tempo esgotado", None, None, None
+            try:
+                return results.get(timeout=min(remaining, 0.5))
+            except queue.Empty:
+                pass
+            if not process.is_alive():
+                # O resultado pode ter chegado junto com o fim do processo.
+                try:
+                    return results.get(timeout=0.1)
+                except queue.Empty:
+                    return f"processo encerrado (código {process.exitcode})", None, None, None
+    finally:
+        if process.is_alive():
+            process.terminate()
+        process.join()
+
+def format_table(rows):
+    """Monta a tabela de texto do relatório, uma linha por medição."""
+    header = ["família", "n", "arestas", "motor", "status", "segundos", "nós", "memória (MiB)"]
+    lines = [header]
+    for row in rows:
+        lines.append([
+            row["familia"], str(row["n"]), str(row["arestas"]), row["motor"], row["status"],
+            "-" if row["segundos"] is None else f"{row['segundos']:.4f}",
+            "-" if row["nos"] is None else str(row["nos"]),
+            "-" if row["memoria"] is None else f"{row['memoria'] / 2 ** 20:.1f}",
+        ])
+    widths = [max(len(line[i]) for line in lines) for i in range(len(header))]
+    return "\n".join("  ".join(cell.ljust(width) for cell, width in zip(line, widths)).rstrip()
+                     for line in lines)
+
+def parse_list(parser, text, allowed, option):
+    """Separa uma lista por vírgulas e confere se cada item está em 'allowed'."""
+    items = [item.strip() for item in text.split(",") if item.strip()]
+    unknown = [item for item in items if item not in allowed]
+    if unknown or not items:
+        parser.error(f"{option}: valores desconhecidos: {', '.join(unknown)}" if unknown
+                     else f"{option}: nenhum valor informado")
+    return items
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dos motores de coloração em grafos gerados")
+    parser.add_argument("--families", default=DEFAULT_FAMILIES,
+                        help=f"Famílias de grafos separadas por vírgula, entre: {DEFAULT_FAMILIES} (padrão: todas)")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help=f"Números de vértices separados por vírgula (padrão: {DEFAULT_SIZES})")
+    parser.add_argument("--engines", default=DEFAULT_ENGINES,
+                        help=f"Motores separados por vírgula, entre: {', '.join(ENGINES)} (padrão: {DEFAULT_ENGINES})")
+    parser.add_argument("--timeout", type=float, default=10.0, metavar="SEGUNDOS",
+                        help="Tempo máximo de cada medição (padrão: 10)")
+    parser.add_argument("--memory-limit", type=int, default=None, metavar="MIB",
+                        help="Limite da memória virtual de cada processo de medição, onde o sistema permitir (RLIMIT_AS)")
+    parser.add_argument("--degree", type=float, default=3.0,
+                        help="Grau médio dos grafos random e geometric (padrão: 3)")
+    parser.add_argument("--density", type=float, default=0.5,
+                        help="Probabilidade de cada aresta nos grafos dense (padrão: 0.5)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Semente dos geradores (padrão: 0)")
+    parser.add_argument("--weighted", action="store_true",
+                        help="Gera e lê os grafos com custo nas arestas")
+    parser.add_argument("--symmetry", action="store_true",
+                        help="Quebra a simetria de cores em todos os motores")
+    parser.add_argument("--graphs-dir", default=None, metavar="DIRETÓRIO",
+                        help="Guarda os grafos gerados neste diretório (padrão: diretório temporário apagado no fim)")
+    parser.add_argument("--json", default="benchmark.json", metavar="ARQUIVO",
+                        help="Arquivo JSON com o resultado de cada medição (padrão: benchmark.json)")
+    add_palette_arguments(parser)
+    args = parser.parse_args()
+    families = parse_list(parser, args.families, GENERATORS, "--families")
+    engines = parse_list(parser, args.engines, ENGINES, "--engines")
+    try:
+        sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    except ValueError:
+        parser.error("--sizes deve ser uma lista de inteiros")
+    if not sizes or min(sizes) < 1:
+        parser.error("--sizes deve ter tamanhos de pelo menos 1 vértice")
+    if args.timeout <= 0:
+        parser.error("--timeout deve ser positivo")
+    if not 0 <= args.density <= 1:
+        parser.error("--density deve estar entre 0 e 1")
+
+    # Os scripts são carregados uma vez aqui e herdados pelos processos de medição.
+    for name in engines:
+        load_script(ENGINES[name].directory)
+    graphs_dir = args.graphs_dir or tempfile.mkdtemp(prefix="benchmark_")
+    os.makedirs(graphs_dir, exist_ok=True)
+    rows = []
+    try:
+        for family in families:
+            for n in sizes:
+                suffix = "custo" if args.weighted else ""
+                path = os.path.join(graphs_dir, f"{family}_{n}_{args.seed}{suffix}.txt")
+                edges = generate_graph(path, family, n, seed=args.seed, weighted=args.weighted,
+                                       degree=args.degree, density=args.density)
+                for engine in engines:
+                    status, seconds, nodes, memory = measure(path, engine, args.weighted, args.colors,
+                                                             args.symmetry, args.timeout, args.memory_limit)
+                    rows.append({"familia": family, "n": n, "arestas": edges, "motor": engine,
+                                 "status": status, "segundos": seconds, "nos": nodes, "memoria": memory,
+                                 "grafo": path if args.graphs_dir else None})
+                    print(f"{family} n={n}: {engine} {status}"
+                          + ("" if seconds is None else f" em {seconds:.4f}s"), flush=True)
+    finally:
+        if args.graphs_dir is None:
+            shutil.rmtree(graphs_dir, ignore_errors=True)
+
+    print()
+    print(format_table(rows))
+    with open(args.json, "w", encoding="utf-8") as output:
+        json.dump({"seed": args.seed, "colors": args.colors, "weighted": args.weighted,
+                   "symmetry": args.symmetry, "timeout": args.timeout, "results": rows},
+                  output, ensure_ascii=False, indent=1)
+    print(f"Resultados salvos em '{args.json}'.")
+
+if __name__ == '__main__':
+    main()
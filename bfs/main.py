@@ -1,128 +1,139 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+import os
 import sys
-
-search_tree = nx.DiGraph()
-node_counter = 0
-
-def add_tree_node(label, parent_node_id=None):
-    """
-    Adiciona um nó à árvore de busca com o rótulo 'label'. Se informado,
-    cria uma aresta do nó 'parent_node_id' para o novo nó.
-    """
-    global node_counter
-    node_id = node_counter
-    node_counter += 1
-    search_tree.add_node(node_id, label=label)
-    if parent_node_id is not None:
-        search_tree.add_edge(parent_node_id, node_id)
-    return node_id
-
-def read_graph(file_path):
-    """
-    Lê o arquivo e cria o grafo.
-    Formato esperado:
-      DIMENSION 
-      <número de vértices>
-      GRAPH
-      <vértice1> <vértice2>
-      ...
-    """
-    with open(file_path, 'r') as f:
-        lines = [line.strip() for line in f if line.strip()]
-    
-    if lines[0].upper() != "DIMENSION":
-        raise ValueError("Erro: esperava 'DIMENSION' na primeira linha.")
-    dimension = int(lines[1])
-    
-    if lines[2].upper() != "GRAPH":
-        raise ValueError("Erro: esperava 'GRAPH' após a dimensão.")
-    
-    edges = []
-    for line in lines[3:]:
-        parts = line.split()
-        if len(parts) >= 2:
-            u = int(parts[0])
-            v = int(parts[1])
-            edges.append((u, v))
-    
-    G = nx.Graph()
-    G.add_nodes_from(range(1, dimension + 1))
-    G.add_edges_from(edges)
-    return G
-
-def is_valid(G, vertex, color, assignment):
-    """
-    Verifica se é válido colorir 'vertex' com 'color', isto é, nenhum vizinho já
-    colorido possui a mesma cor.
-    """
-    for neighbor in G.neighbors(vertex):
-        if neighbor in assignment and assignment[neighbor] == color:
-            return False
-    return True
-
-def state_to_string_simple(state, vertices):
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from core import (PackedColoring, SpillQueue, read_graph, LOG_MODES, open_search_log,
+                  ROOT, SOLUTION, SearchTreeRecorder, add_tree_arguments, recorder_from_args,
+                  add_palette_arguments, color_name, add_metrics_arguments, metrics_from_args, timed,
+                  add_profile_arguments, profiler_from_args, profiled, render_search_tree,
+                  add_output_arguments, output_from_args, write_result)
+
+# Árvore de busca (ver core.tree); main() a troca pelo modo pedido na linha de comando.
+search_tree = SearchTreeRecorder()
+# Métricas da execução (ver core.metrics); None quando --metrics não é usado.
+metrics = None
+
+def tree_label(tree, row):
+    """Formata o rótulo de um nó da árvore de busca; só é chamada ao desenhar."""
+    kind = tree.kind[row]
+    if kind == ROOT:
+        return "root"
+    if kind == SOLUTION:
+        return "Solução: " + str(tree.assignment(row))
+    return f"{tree.vertex[row]} = {tree.color[row]}"
+
+def state_to_string_simple(state, packing):
     """
     Converte o estado para uma string simples contendo o ID do nó e a cor
     atribuída no último vértice (ou 'sem cor' se nenhum vértice foi colorido).
-    Cada estado é uma tupla: (assignment, index, tree_node_id)
+    Cada estado é uma tupla: (packed, index, tree_node_id, top)
     """
-    assignment, index, tree_node_id = state
+    packed, index, tree_node_id, _ = state
     if index > 0:
-        last_vertex = vertices[index - 1]
-        last_color = assignment[last_vertex]
+        last_vertex = packing.vertices[index - 1]
+        last_color = packing.color_at(packed, index - 1)
         return f"ID {tree_node_id}: {last_vertex} = {last_color}"
     else:
         return f"ID {tree_node_id}: sem cor"
 
-def bfs(G, vertices, root_id, log_filename="bfs_log.txt"):
+def state_key(state):
+    """Identifica o estado no log delta pelo ID do nó na árvore de busca."""
+    return state[2]
+
+def bfs(G, vertices, root_id, log_filename="bfs_log.txt", log_mode="off",
+        frontier_cap=None, spill_dir=None, symmetry=False, num_colors=4):
     """
     Executa a busca em largura para encontrar uma coloração válida.
-    Em cada iteração, grava um log simples (em português) com a lista de estados
-    abertos ("Abertos") e fechados ("Fechados").
-    
-    Cada estado é representado por (assignment, index, tree_node_id).
+    Com log_mode="full", grava em cada iteração um log simples (em português) com
+    a lista de estados abertos ("Abertos") e fechados ("Fechados"); com "delta"
+    grava só as mudanças (ver core.searchlog). Os estados fechados só são
+    guardados no modo "full".
+
+    Cada estado é representado por (packed, index, tree_node_id, top), em que
+    'packed' é um inteiro com as cores dos 'index' primeiros vértices (bits
+    suficientes para 'num_colors' cores por vértice, ver PackedColoring) e 'top' é a maior cor usada. Com
+    symmetry=True, cada vértice só recebe cores até top + 1. A fronteira é uma fila FIFO; com
+    'frontier_cap', os estados além desse limite são gravados em um arquivo
+    temporário (em 'spill_dir') e lidos de volta quando chegar a vez deles.
     """
-    open_queue = []
+    packing = PackedColoring(G, vertices, num_colors)
+    record_size = packing.nbytes + 13
+
+    def encode(state):
+        packed, index, tree_node_id, top = state
+        return (packing.to_bytes(packed) + index.to_bytes(4, "little")
+                + tree_node_id.to_bytes(8, "little", signed=True) + bytes((top,)))
+
+    def decode(record):
+        nbytes = packing.nbytes
+        return (packing.from_bytes(record[:nbytes]),
+                int.from_bytes(record[nbytes:nbytes + 4], "little"),
+                int.from_bytes(record[nbytes + 4:nbytes + 12], "little", signed=True),
+                record[nbytes + 12])
+
+    open_queue = SpillQueue(record_size, encode, decode, frontier_cap, spill_dir)
     closed_states = []
-    initial_state = ({}, 0, root_id)
+    initial_state = (0, 0, root_id, 0)
     open_queue.append(initial_state)
     iteration = 0
-
-    # with open(log_filename, "w", encoding="utf-8") as log_file:
-    while open_queue:
-        # log_file.write(f"Iteração {iteration}:\n")
-        # log_file.write("Abertos: " + ", ".join([state_to_string_simple(s, vertices) for s in open_queue]) + "\n")
-        # log_file.write("Fechados: " + ", ".join([state_to_string_simple(s, vertices) for s in closed_states]) + "\n\n")
-        iteration += 1
-
-        state = open_queue.pop(0)
-        assignment, index, tree_node_id = state
-
-        if index == len(vertices):
-            sol_label = "Solução: " + str(assignment)
-            add_tree_node(sol_label, tree_node_id)
-            return assignment
-
-        vertex = vertices[index]
-        for color in [1, 2, 3, 4]:
-            if is_valid(G, vertex, color, assignment):
-                new_assignment = assignment.copy()
-                new_assignment[vertex] = color
-                new_index = index + 1
-                new_label = f"{vertex} = {color}"
-                new_tree_node_id = add_tree_node(new_label, tree_node_id)
-                new_state = (new_assignment, new_index, new_tree_node_id)
+    describe = lambda s: state_to_string_simple(s, packing)
+    add_node = search_tree.add
+    first_id = search_tree.size
+    if metrics is not None:
+        metrics.instrument(packing)
+    expanded = max_frontier = max_depth = 0
+
+    log = open_search_log(log_mode, log_filename, describe, state_key)
+    try:
+        log.push(initial_state)
+        while open_queue:
+            log.iteration(iteration, open_queue, closed_states)
+            iteration += 1
+
+            if len(open_queue) > max_frontier:
+                max_frontier = len(open_queue)
+            state = open_queue.popleft()
+            log.pop(state)
+            packed, index, tree_node_id, top = state
+            if index > max_depth:
+                max_depth = index
+
+            if index == len(vertices):
+                assignment = packing.unpack(packed, index)
+                add_node(tree_node_id, kind=SOLUTION)
+                return assignment
+
+            vertex = vertices[index]
+            expanded += 1
+            for color in packing.legal_colors(packed, index, top if symmetry else None):
+                new_packed = packing.with_color(packed, index, color)
+                new_tree_node_id = add_node(tree_node_id, vertex, color)
+                new_state = (new_packed, index + 1, new_tree_node_id, max(top, color))
                 open_queue.append(new_state)
-        closed_states.append(state)
+                log.push(new_state)
+            if log.keeps_closed:
+                closed_states.append(state)
+            log.close_state(state)
+    finally:
+        open_queue.close()
+        log.close()
+        if metrics is not None:
+            metrics.record(generated=search_tree.size - first_id, expanded=expanded,
+                           max_frontier=max_frontier, max_depth=max_depth)
     return None
 
 def draw_colored_graph(G, assignment, output_file="colored_graph_bfs.png"):
     """
     Desenha o grafo colorido usando o dicionário 'assignment' e salva a imagem.
     """
-    color_map = {1: "red", 2: "green", 3: "blue", 4: "yellow"}
-    node_colors = [color_map[assignment[node]] if node in assignment else "gray" for node in G.nodes()]
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
+    G = G.to_networkx()
+    node_colors = [color_name(assignment.get(node)) for node in G.nodes()]
     
     try:
         pos = nx.nx_agraph.graphviz_layout(G, prog='dot', args='-Granksep=2 -Gnodesep=1')
@@ -141,14 +152,15 @@ def draw_search_tree(tree, output_file="search_tree_bfs.png"):
     Tenta usar um layout hierárquico com Graphviz, aplicando espaçamentos personalizados;
     caso não seja possível, utiliza um layout padrão.
     """
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
     try:
         pos = nx.nx_agraph.graphviz_layout(tree, prog='dot', args='-Granksep=2 -Gnodesep=1')
     except Exception as e:
         pos = nx.spring_layout(tree)
     
     labels = nx.get_node_attributes(tree, 'label')
-    mapping = {"1": "red", "2": "green", "3": "blue", "4": "yellow"}
-    
     node_colors = []
     for n in tree.nodes():
         label = labels.get(n, "")
@@ -156,9 +168,7 @@ def draw_search_tree(tree, output_file="search_tree_bfs.png"):
         if " = " in label:
             try:
                 parts = label.split(" = ")
-                candidate = parts[-1].strip()
-                if candidate in mapping:
-                    fill_color = mapping[candidate]
+                fill_color = color_name(parts[-1].strip(), "lightgray")
             except Exception as ex:
                 fill_color = "lightgray"
         node_colors.append(fill_color)
@@ -172,28 +182,73 @@ def draw_search_tree(tree, output_file="search_tree_bfs.png"):
 
 
 def main():
-    if len(sys.argv) < 2:
-        sys.exit(1)
-    
-    file_path = sys.argv[1]
-    G = read_graph(file_path)
+    global search_tree, metrics
+    parser = argparse.ArgumentParser(description="Coloração de grafos por busca em largura")
+    parser.add_argument("file_path", help="Caminho do arquivo de entrada")
+    parser.add_argument("--log-mode", choices=LOG_MODES, default="off",
+                        help="Log de abertos/fechados em 'bfs_log.txt': completo, só mudanças ou desligado (padrão: off)")
+    parser.add_argument("--log", action="store_const", const="full", dest="log_mode",
+                        help="Equivale a --log-mode full")
+    parser.add_argument("--frontier-cap", type=int, default=None,
+                        help="Máximo de estados abertos em memória; o excedente vai para disco")
+    parser.add_argument("--spill-dir", default=None,
+                        help="Pasta dos arquivos temporários da fronteira (padrão: do sistema)")
+    parser.add_argument("--symmetry", action="store_true",
+                        help="Quebra a simetria de cores: cada vértice só recebe cores até (maior cor usada + 1)")
+    add_palette_arguments(parser)
+    add_tree_arguments(parser)
+    add_metrics_arguments(parser)
+    add_profile_arguments(parser)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+    if args.frontier_cap is not None and args.frontier_cap < 1:
+        parser.error("--frontier-cap deve ser pelo menos 1")
+    stdout = output_from_args(args)
+    search_tree = recorder_from_args(parser, args)
+    metrics = metrics_from_args(parser, args)
+    profiler = profiler_from_args(parser, args)
+
+    with timed(metrics, "parse"):
+        G = read_graph(args.file_path)
     vertices = list(G.nodes())
     vertices.sort()
     
-    root_id = add_tree_node("root")
-    solution = bfs(G, vertices, root_id, log_filename="bfs_log.txt")
+    root_id = search_tree.add(kind=ROOT)
+    start = time.perf_counter()
+    with timed(metrics, "search"), profiled(profiler, "search"):
+        solution = bfs(G, vertices, root_id, log_filename="bfs_log.txt", log_mode=args.log_mode,
+                       frontier_cap=args.frontier_cap, spill_dir=args.spill_dir, symmetry=args.symmetry,
+                       num_colors=args.colors)
+    seconds = time.perf_counter() - start
     
     if solution:
         print("Solução encontrada:", solution)
     else:
         print("Nenhuma solução encontrada.")
     
-    draw_colored_graph(G, solution, output_file="colored_graph_bfs.png")
-    print("Grafo colorido salvo em 'colored_graph_bfs.png'.")
+    if not args.no_draw:
+        with timed(metrics, "render"):
+            draw_colored_graph(G, solution or {}, output_file="colored_graph_bfs.png")
+        print("Grafo colorido salvo em 'colored_graph_bfs.png'.")
     
-    draw_search_tree(search_tree, output_file="search_tree_bfs.png")
-    print("Árvore de busca salva em 'search_tree_bfs.png'.")
-    print("Log de BFS salvo em 'bfs_log.txt'.")
+    if search_tree.mode != "off" and not args.no_draw:
+        with timed(metrics, "render"):
+            path, drawn, stored = render_search_tree(search_tree, tree_label, "search_tree_bfs.png", args,
+                                                     lambda tree, path: draw_search_tree(tree, output_file=path),
+                                                     "Árvore de Busca (BFS)")
+        print(f"Árvore de busca salva em '{path}' ({drawn} de {stored} nós).")
+    if args.tree_export:
+        search_tree.save(args.tree_export)
+        print(f"Árvore de busca exportada para '{args.tree_export}'.")
+    if args.log_mode != "off":
+        print("Log de BFS salvo em 'bfs_log.txt'.")
+    if metrics is not None:
+        metrics.save(args.metrics)
+        print(f"Métricas salvas em '{args.metrics}'.")
+    if profiler is not None:
+        summary = profiler.save()
+        print(f"Perfil salvo em '{args.profile}' (resumo em '{summary}').")
+    write_result(args, stdout, "bfs", solution, search_tree.size, seconds)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,29 @@
+"""
+Núcleo compartilhado pelos algoritmos de coloração de grafos.
+
+Os scripts de cada diretório (backtracking, bfs, dfs, greedy, ordenada, aStar,
+portfolio, batch e benchmark) usam este pacote para ler o grafo e consultar a adjacência.
+"""
+from core.graph import CSRGraph
+from core.parser import read_graph
+from core.coloring import ColorState, is_valid, legal_colors, cost_for_vertex
+from core.state import SearchNode, TrailState
+from core.ordering import DsaturState
+from core.propagation import PROPAGATION_MODES, DomainStore
+from core.nogoods import NogoodStore
+from core.packing import PackedColoring
+from core.frontier import SpillQueue
+from core.searchlog import LOG_MODES, open_search_log
+from core.tree import ROOT, STEP, SOLUTION, SearchTreeRecorder, add_tree_arguments, recorder_from_args
+from core.transposition import TranspositionTable
+from core.heuristics import HEURISTICS, heuristic_table
+from core.palette import DEFAULT_COLORS, add_palette_arguments, color_name
+from core.chromatic import chromatic_number
+from core.solutions import add_solution_arguments, solutions_from_args, symmetry_weight, write_solutions
+from core.parallel import BudgetExceeded, BudgetRecorder, parallel_search
+from core.engines import ENGINES, load_script, run_engine
+from core.generators import GENERATORS, generate_graph
+from core.metrics import SearchMetrics, add_metrics_arguments, metrics_from_args, timed
+from core.profiling import SearchProfiler, add_profile_arguments, profiler_from_args, profiled
+from core.treeview import render_search_tree, write_dot, write_svg
+from core.output import add_output_arguments, output_from_args, write_result
@@ -0,0 +1,112 @@
+"""
+Número cromático: o menor k para o qual o grafo tem uma k-coloração.
+
+A busca parte de dois limites baratos:
+  inferior  tamanho de uma clique achada de forma gulosa (uma clique com q
+            vértices exige q cores);
+  superior  número de cores da coloração gulosa DSATUR.
+Em seguida tenta k = superior - 1, superior - 2, ... até uma tentativa falhar
+ou k chegar ao limite inferior. O trabalho é reaproveitado entre os valores de k:
+  - antes de buscar, a melhor solução é reparada: cada vértice com a maior cor
+    tenta uma cor menor livre; se todos conseguirem, k sai sem busca;
+  - o mesmo 'context' é passado a cada k; o que não se estende com k cores
+    também não se estende com menos, então o que foi aprendido continua
+    valendo. No backtracking/main.py ele é um NogoodStore, usado por todas as
+    combinações de ordem, propagação e backjumping: o CBJ guarda os seus
+    conjuntos de conflito e o backtracking cronológico as colorações parciais
+    (de até K vértices) cujas extensões falharam todas; na tentativa seguinte
+    esses ramos são cortados sem busca.
+"""
+from core.ordering import DsaturState
+
+# Vértices de maior grau usados como semente da clique gulosa.
+CLIQUE_SEEDS = 32
+
+
+def greedy_clique(G, vertices):
+    """
+    Clique maximal gulosa: a partir de cada semente (os vértices de maior grau)
+    acrescenta o candidato de maior grau vizinho de todos os já escolhidos.
+    Retorna a maior clique encontrada.
+    """
+    if not vertices:
+        return []
+    adjacency = G.adjacency()
+    allowed = set(vertices)
+    neighbors = {v: allowed.intersection(adjacency[v]) for v in vertices}
+    by_degree = sorted(vertices, key=lambda v: (-len(neighbors[v]), v))
+    best = by_degree[:1]
+    for seed in by_degree[:CLIQUE_SEEDS]:
+        if len(neighbors[seed]) < len(best):
+            break
+        clique = [seed]
+        candidates = set(neighbors[seed])
+        while candidates:
+            chosen = max(candidates, key=lambda v: (len(neighbors[v] & candidates), -v))
+            clique.append(chosen)
+            candidates &= neighbors[chosen]
+        if len(clique) > len(best):
+            best = clique
+    return best
+
+
+def dsatur_coloring(G, vertices):
+    """Coloração gulosa DSATUR: cada vértice escolhido recebe a menor cor livre."""
+    adjacency = G.adjacency()
+    palette_size = max((len(adjacency[v]) for v in vertices), default=0) + 1
+    state = DsaturState(G, vertices, palette_size, track_cost=False)
+    while True:
+        vertex = state.select_vertex()
+        if vertex is None:
+            return state.assignment(vertices)
+        state.assign(vertex, state.legal_colors(vertex)[0])
+
+
+def drop_color(G, assignment, color):
+    """
+    Tenta eliminar 'color' de 'assignment' trocando, um por vez, cada vértice
+    com essa cor pela menor cor livre abaixo dela. Retorna a nova coloração ou
+    None se algum vértice não tiver para onde ir.
+    """
+    adjacency = G.adjacency()
+    result = dict(assignment)
+    for vertex, current in assignment.items():
+        if current != color:
+            continue
+        used = {result.get(u) for u in adjacency[vertex]}
+        free = next((c for c in range(1, color) if c not in used), None)
+        if free is None:
+            return None
+        result[vertex] = free
+    return result
+
+
+def chromatic_number(G, vertices, solve, context=None, report=None):
+    """
+    Calcula o número cromático. 'solve(k, context)' deve devolver uma coloração
+    {vértice: cor} com cores de 1 a k ou None se não houver; 'report(k, coloração
+    ou None, origem)', se informado, é chamado a cada k decidido, com origem
+    "clique", "dsatur", "reparo" ou "busca".
+    Retorna (k, coloração com k cores).
+    """
+    if not vertices:
+        return 0, {}
+    report = report or (lambda k, assignment, origin: None)
+    lower = len(greedy_clique(G, vertices))
+    report(lower, None, "clique")
+    best = dsatur_coloring(G, vertices)
+    upper = max(best.values())
+    report(upper, best, "dsatur")
+    k = upper - 1
+    while k >= lower:
+        assignment = drop_color(G, best, k + 1)
+        origin = "reparo"
+        if assignment is None:
+            assignment = solve(k, context)
+            origin = "busca"
+        report(k, assignment, origin)
+        if assignment is None:
+            break
+        best = assignment
+        k = max(best.values()) - 1
+    return max(best.values()), best
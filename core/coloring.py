@@ -0,0 +1,143 @@
+def is_valid(G, vertex, color, assignment):
+    """
+    Verifica se é válido colorir 'vertex' com 'color', isto é, nenhum vizinho já
+    colorido possui a mesma cor.
+    """
+    for neighbor in G.neighbors(vertex):
+        if assignment.get(neighbor) == color:
+            return False
+    return True
+
+
+def legal_colors(G, vertex, assignment, num_colors=4):
+    """
+    Retorna as cores válidas para 'vertex' com uma única passada pelos vizinhos,
+    em vez de uma chamada de is_valid por cor.
+    """
+    forbidden = 0
+    for neighbor in G.neighbors(vertex):
+        color = assignment.get(neighbor)
+        if color is not None:
+            forbidden |= 1 << color
+    return [color for color in range(1, num_colors + 1) if not forbidden >> color & 1]
+
+
+def cost_for_vertex(G, vertex, assignment):
+    """
+    Calcula o custo de colorir 'vertex' dado que alguns vizinhos já foram coloridos.
+    O custo é a soma dos pesos das arestas que ligam 'vertex' a cada vizinho já colorido.
+    """
+    custo = 0
+    for neighbor, weight in zip(G.neighbors(vertex), G.adjacency_weights()[vertex]):
+        if neighbor in assignment:
+            custo += weight
+    return custo
+
+
+class ColorState:
+    """
+    Coloração parcial mantida de forma incremental.
+
+    Para cada vértice guarda uma máscara de cores proibidas (bit c ligado quando
+    algum vizinho colorido usa a cor c) e, para poder desfazer atribuições, quantos
+    vizinhos usam cada cor (uma lista por cor, indexada pelo vértice). Atribuir ou
+    desfazer custa O(grau); consultar as cores válidas de um vértice é uma única
+    consulta à máscara.
+    Também acumula o peso das arestas ligadas a vizinhos coloridos, que é o custo
+    de colorir o vértice (ver cost_for_vertex). Buscas que não usam custo passam
+    track_cost=False e economizam essa soma a cada atribuição.
+    """
+
+    def __init__(self, G, num_colors=4, track_cost=True):
+        n = G.dimension
+        self.graph = G
+        self.num_colors = num_colors
+        self.palette = list(range(1, num_colors + 1))
+        self.track_cost = track_cost
+        self.colors = [0] * (n + 1)
+        self.forbidden = [0] * (n + 1)
+        self.colored_weight = [0] * (n + 1)
+        self._counts = [[0] * (n + 1) for _ in range(num_colors + 1)]
+        self._adjacency = G.adjacency()
+        self._adjacency_weights = G.adjacency_weights()
+        self._legal = {}
+        # Quantos vértices usam cada cor, para a quebra de simetria (ver legal_colors)
+        self.color_uses = [0] * (num_colors + 1)
+        self._above = [sum(1 << c for c in self.palette if c > limit) for limit in range(num_colors + 2)]
+
+    def assign(self, vertex, color):
+        self.colors[vertex] = color
+        self.color_uses[color] += 1
+        bit = 1 << color
+        counts = self._counts[color]
+        forbidden = self.forbidden
+        if self.track_cost:
+            colored_weight = self.colored_weight
+            for neighbor, weight in zip(self._adjacency[vertex], self._adjacency_weights[vertex]):
+                if not counts[neighbor]:
+                    forbidden[neighbor] |= bit
+                counts[neighbor] += 1
+                colored_weight[neighbor] += weight
+        else:
+            for neighbor in self._adjacency[vertex]:
+                if not counts[neighbor]:
+                    forbidden[neighbor] |= bit
+                counts[neighbor] += 1
+
+    def unassign(self, vertex):
+        color = self.colors[vertex]
+        self.colors[vertex] = 0
+        self.color_uses[color] -= 1
+        mask = ~(1 << color)
+        counts = self._counts[color]
+        forbidden = self.forbidden
+        if self.track_cost:
+            colored_weight = self.colored_weight
+            for neighbor, weight in zip(self._adjacency[vertex], self._adjacency_weights[vertex]):
+                counts[neighbor] -= 1
+                if not counts[neighbor]:
+                    forbidden[neighbor] &= mask
+                colored_weight[neighbor] -= weight
+        else:
+            for neighbor in self._adjacency[vertex]:
+                counts[neighbor] -= 1
+                if not counts[neighbor]:
+                    forbidden[neighbor] &= mask
+
+    def is_valid(self, vertex, color):
+        return not self.forbidden[vertex] >> color & 1
+
+    def max_color(self):
+        """Maior cor usada na coloração parcial (0 se nenhuma)."""
+        uses = self.color_uses
+        for color in range(self.num_colors, 0, -1):
+            if uses[color]:
+                return color
+        return 0
+
+    def legal_colors(self, vertex, symmetry=False):
+        """
+        Retorna as cores válidas para 'vertex' (lista compartilhada, não alterar).
+        Com 'symmetry', só aceita cores até (maior cor usada + 1): colorações
+        que diferem por uma troca de cores são geradas uma única vez.
+        """
+        mask = self.forbidden[vertex]
+        if symmetry:
+            mask |= self._above[self.max_color() + 1]
+        legal = self._legal.get(mask)
+        if legal is None:
+            legal = [color for color in self.palette if not mask >> color & 1]
+            self._legal[mask] = legal
+        return legal
+
+    def saturation(self, vertex):
+        """Número de cores distintas já usadas pelos vizinhos de 'vertex'."""
+        return bin(self.forbidden[vertex]).count("1")
+
+    def cost_for_vertex(self, vertex):
+        return self.colored_weight[vertex]
+
+    def assignment(self, vertices):
+        """Retorna o dicionário {vértice: cor} dos vértices coloridos, na ordem dada."""
+        colors = self.colors
+        return {v: colors[v] for v in vertices if colors[v]}
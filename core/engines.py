@@ -0,0 +1,116 @@
+"""
+Acesso aos motores de busca dos scripts de cada diretório.
+
+Os scripts (backtracking/main.py, dfs/main.py, ...) não formam pacotes, então
+são carregados pelo caminho do arquivo. Cada motor é rodado com o registro da
+árvore desligado e sem log, e devolve a coloração encontrada (ou None) e os
+números de nós que gerou e que expandiu.
+"""
+import importlib.util
+import os
+from argparse import Namespace
+from collections import namedtuple
+
+from core.metrics import COUNTERS, SearchMetrics
+from core.tree import ROOT, SearchTreeRecorder
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_scripts = {}
+
+
+class _SearchCounts:
+    """
+    Coleta só os contadores que os motores registram ao terminar (ver
+    SearchMetrics.record). Ao contrário de SearchMetrics, instrument() não
+    embrulha os métodos do estado, para não pesar no tempo medido.
+    """
+
+    def __init__(self):
+        self.counters = dict.fromkeys(COUNTERS, 0)
+
+    record = SearchMetrics.record
+
+    def instrument(self, state):
+        return state
+
+
+def load_script(directory):
+    """Carrega (uma única vez) o main.py do diretório 'directory' como módulo."""
+    module = _scripts.get(directory)
+    if module is None:
+        path = os.path.join(REPO_DIR, directory, "main.py")
+        spec = importlib.util.spec_from_file_location(f"{directory}_main", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _scripts[directory] = module
+    return module
+
+
+def _backtracking(order, propagation):
+    def run(module, G, vertices, num_colors, symmetry, root_id):
+        args = Namespace(order=order, propagation=propagation, symmetry=symmetry)
+        state, dsatur, domains = module.build_state(G, vertices, num_colors, args)
+        found, solution = module.backtrack(state, vertices, 0, root_id, dsatur, domains, symmetry)
+        return solution if found else None
+    return run
+
+
+def _dfs(module, G, vertices, num_colors, symmetry, root_id):
+    return module.dfs(G, vertices, root_id, os.devnull, "off", symmetry, num_colors)
+
+
+def _bfs(module, G, vertices, num_colors, symmetry, root_id):
+    return module.bfs(G, vertices, root_id, os.devnull, "off", symmetry=symmetry, num_colors=num_colors)
+
+
+def _first(result):
+    return result[0] if result else None
+
+
+def _greedy(module, G, vertices, num_colors, symmetry, root_id):
+    return _first(module.greedy_search(G, vertices, root_id, os.devnull, symmetry, num_colors))
+
+
+def _ordered(module, G, vertices, num_colors, symmetry, root_id):
+    return _first(module.ordered_search(G, vertices, root_id, os.devnull, "off",
+                                        symmetry=symmetry, num_colors=num_colors))
+
+
+def _astar(module, G, vertices, num_colors, symmetry, root_id):
+    return _first(module.astar_search(G, vertices, root_id, os.devnull,
+                                      symmetry=symmetry, num_colors=num_colors))
+
+
+def _idastar(module, G, vertices, num_colors, symmetry, root_id):
+    return _first(module.idastar_search(G, vertices, root_id, os.devnull,
+                                        symmetry=symmetry, num_colors=num_colors))
+
+
+# directory: script que tem o motor; complete: se None prova que não há coloração
+Engine = namedtuple("Engine", ["directory", "run", "complete"])
+
+ENGINES = {
+    "backtracking": Engine("backtracking", _backtracking("static", "none"), True),
+    "dsatur": Engine("backtracking", _backtracking("dsatur", "fc"), True),
+    "dfs": Engine("dfs", _dfs, True),
+    "bfs": Engine("bfs", _bfs, True),
+    "greedy": Engine("aStar", _greedy, False),
+    "ordered": Engine("aStar", _ordered, True),
+    "astar": Engine("aStar", _astar, True),
+    "idastar": Engine("aStar", _idastar, True),
+}
+
+
+def run_engine(name, G, vertices, num_colors=4, symmetry=False):
+    """
+    Roda o motor 'name' e retorna (coloração encontrada ou None, nós gerados na
+    árvore de busca sem contar a raiz, nós expandidos).
+    """
+    engine = ENGINES[name]
+    module = load_script(engine.directory)
+    module.search_tree = SearchTreeRecorder("off")
+    module.metrics = counts = _SearchCounts()
+    root_id = module.search_tree.add(kind=ROOT)
+    solution = engine.run(module, G, vertices, num_colors, symmetry, root_id)
+    return solution, module.search_tree.size - 1, counts.counters["expanded"]
@@ -0,0 +1,92 @@
+import tempfile
+from collections import deque
+
+
+class SpillQueue:
+    """
+    Fila FIFO que mantém no máximo 'capacity' itens em memória e grava o
+    excedente em um arquivo temporário.
+
+    Os itens vão para o disco como registros de tamanho fixo ('record_size'
+    bytes), produzidos por 'encode' e lidos de volta por 'decode'. Quando a parte
+    em memória esvazia, um lote de até 'capacity' registros é lido do arquivo.
+    Enquanto houver registros no disco, os novos itens também vão para o disco,
+    preservando a ordem FIFO. Sem 'capacity' a fila é apenas um deque.
+    """
+
+    def __init__(self, record_size, encode, decode, capacity=None, spill_dir=None):
+        self.record_size = record_size
+        self.encode = encode
+        self.decode = decode
+        self.capacity = capacity
+        self.spill_dir = spill_dir
+        self.spilled_total = 0
+        self._memory = deque()
+        self._file = None
+        self._pending = []
+        self._spilled = 0
+        self._read_pos = 0
+        self._write_pos = 0
+
+    def __len__(self):
+        return len(self._memory) + self._spilled
+
+    def __bool__(self):
+        return bool(self._memory) or self._spilled > 0
+
+    def append(self, item):
+        if self._spilled or (self.capacity is not None and len(self._memory) >= self.capacity):
+            self._pending.append(self.encode(item))
+            self._spilled += 1
+            self.spilled_total += 1
+            if len(self._pending) >= 4096:
+                self._flush()
+        else:
+            self._memory.append(item)
+
+    def popleft(self):
+        if not self._memory and self._spilled:
+            self._refill()
+        return self._memory.popleft()
+
+    def __iter__(self):
+        """Percorre os itens na ordem de saída, sem removê-los (usado pelo log)."""
+        yield from self._memory
+        if self._spilled:
+            self._flush()
+            self._file.seek(self._read_pos)
+            for _ in range(self._spilled - len(self._pending)):
+                yield self.decode(self._file.read(self.record_size))
+            for record in self._pending:
+                yield self.decode(record)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _flush(self):
+        if not self._pending:
+            return
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(dir=self.spill_dir)
+        self._file.seek(self._write_pos)
+        self._file.write(b"".join(self._pending))
+        self._write_pos = self._file.tell()
+        self._pending = []
+
+    def _refill(self):
+        self._flush()
+        count = min(self._spilled, self.capacity)
+        size = self.record_size
+        self._file.seek(self._read_pos)
+        data = self._file.read(count * size)
+        self._read_pos += count * size
+        self._spilled -= count
+        decode = self.decode
+        self._memory.extend(decode(data[i:i + size]) for i in range(0, len(data), size))
+        if not self._spilled:
+            # Arquivo esgotado: volta ao início para reaproveitar o espaço.
+            self._file.seek(0)
+            self._file.truncate()
+            self._read_pos = self._write_pos = 0
@@ -0,0 +1,115 @@
+"""
+Geradores de grafos aleatórios no formato de entrada (DIMENSION / GRAPH).
+
+Famílias:
+  random     Erdős–Rényi: cada par de vértices vira aresta com probabilidade
+             grau / (n - 1);
+  planar     grade quase quadrada em que cada célula ganha uma diagonal
+             sorteada (planar, então sempre tem uma 4-coloração);
+  geometric  pontos sorteados no quadrado unitário, ligados quando estão a
+             menos de um raio escolhido para dar o grau médio pedido;
+  dense      Erdős–Rényi com probabilidade 'density' (padrão 0.5).
+Cada gerador devolve os vetores (origens, destinos) com vértices de 1 a n.
+"""
+import math
+
+import numpy as np
+
+# Custos sorteados para as arestas nos arquivos com custo: inteiros de 1 a MAX_COST.
+MAX_COST = 10
+
+
+def _pairs(n, probability, rng):
+    """Sorteia cada par u < v com a probabilidade dada, uma linha da matriz por vez."""
+    sources = []
+    destinations = []
+    for u in range(1, n):
+        others = np.arange(u + 1, n + 1)
+        chosen = others[rng.random(len(others)) < probability]
+        sources.append(np.full(len(chosen), u))
+        destinations.append(chosen)
+    if not sources:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(sources), np.concatenate(destinations)
+
+
+def random_graph(n, rng, degree=3.0, density=0.5):
+    """Grafo de Erdős–Rényi com grau médio 'degree'."""
+    return _pairs(n, min(1.0, degree / max(n - 1, 1)), rng)
+
+
+def dense_graph(n, rng, degree=3.0, density=0.5):
+    """Grafo de Erdős–Rényi em que cada par vira aresta com probabilidade 'density'."""
+    return _pairs(n, density, rng)
+
+
+def planar_graph(n, rng, degree=3.0, density=0.5):
+    """
+    Grade com largura ceil(sqrt(n)) preenchida linha a linha até n vértices, com
+    as arestas horizontais e verticais e uma diagonal sorteada em cada célula.
+    """
+    width = max(1, math.ceil(math.sqrt(n)))
+    vertices = np.arange(n)
+    col = vertices % width
+    sources = []
+    destinations = []
+    right = vertices[(col + 1 < width) & (vertices + 1 < n)]
+    sources.append(right)
+    destinations.append(right + 1)
+    down = vertices[vertices + width < n]
+    sources.append(down)
+    destinations.append(down + width)
+    # Célula com canto superior esquerdo em v: diagonal v--(v+width+1) ou (v+1)--(v+width).
+    cells = vertices[(col + 1 < width) & (vertices + width + 1 < n)]
+    flip = rng.random(len(cells)) < 0.5
+    sources.append(np.where(flip, cells + 1, cells))
+    destinations.append(np.where(flip, cells + width, cells + width + 1))
+    return np.concatenate(sources) + 1, np.concatenate(destinations) + 1
+
+
+def geometric_graph(n, rng, degree=3.0, density=0.5):
+    """Grafo geométrico aleatório com raio sqrt(grau / (pi * n))."""
+    points = rng.random((n, 2))
+    radius = math.sqrt(degree / (math.pi * max(n, 1)))
+    sources = []
+    destinations = []
+    for u in range(n - 1):
+        distance = np.hypot(*(points[u + 1:] - points[u]).T)
+        chosen = np.nonzero(distance < radius)[0] + u + 2
+        sources.append(np.full(len(chosen), u + 1))
+        destinations.append(chosen)
+    if not sources:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(sources), np.concatenate(destinations)
+
+
+GENERATORS = {
+    "random": random_graph,
+    "planar": planar_graph,
+    "geometric": geometric_graph,
+    "dense": dense_graph,
+}
+
+
+def write_graph(path, n, sources, destinations, costs=None):
+    """Grava o grafo no formato de entrada, com a coluna de custo se 'costs' for dado."""
+    with open(path, "w", encoding="utf-8") as output:
+        output.write(f"DIMENSION\n{n}\nGRAPH\n")
+        if costs is None:
+            for u, v in zip(sources.tolist(), destinations.tolist()):
+                output.write(f"{u} {v}\n")
+        else:
+            for u, v, c in zip(sources.tolist(), destinations.tolist(), costs.tolist()):
+                output.write(f"{u} {v} {c}\n")
+
+
+def generate_graph(path, family, n, seed=0, weighted=False, degree=3.0, density=0.5):
+    """
+    Gera um grafo da família 'family' com 'n' vértices e o grava em 'path'.
+    Retorna o número de arestas.
+    """
+    rng = np.random.default_rng(seed)
+    sources, destinations = GENERATORS[family](n, rng, degree=degree, density=density)
+    costs = rng.integers(1, MAX_COST + 1, len(sources)) if weighted else None
+    write_graph(path, n, sources, destinations, costs)
+    return len(sources)
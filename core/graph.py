@@ -0,0 +1,131 @@
+import numpy as np
+
+
+class CSRGraph:
+    """
+    Grafo não direcionado armazenado em formato CSR (Compressed Sparse Row).
+
+    Os vértices são numerados de 1 a 'dimension'. Os vizinhos do vértice v ficam
+    em targets[offsets[v]:offsets[v + 1]] (em ordem crescente) e os pesos das
+    arestas correspondentes em weights[offsets[v]:offsets[v + 1]].
+    Cada aresta aparece duas vezes, uma em cada sentido.
+    """
+
+    def __init__(self, dimension, offsets, targets, weights, weighted=False):
+        self.dimension = dimension
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.weighted = weighted
+        self._adjacency = None
+        self._adjacency_weights = None
+
+    @classmethod
+    def from_edges(cls, dimension, sources, destinations, costs=None):
+        """
+        Constrói o grafo a partir de vetores de arestas (u, v[, custo]).
+        Arestas repetidas ficam com o último custo informado e laços (u == v)
+        são descartados.
+        """
+        src = np.asarray(sources, dtype=np.int64)
+        dst = np.asarray(destinations, dtype=np.int64)
+        weighted = costs is not None
+        if weighted:
+            cost = np.asarray(costs, dtype=np.float64)
+        else:
+            cost = np.ones(len(src), dtype=np.float64)
+
+        if len(src) and min(src.min(), dst.min()) < 1:
+            raise ValueError("Erro: vértices devem ser numerados a partir de 1.")
+        if len(src):
+            dimension = max(dimension, int(src.max()), int(dst.max()))
+
+        keep = src != dst
+        src, dst, cost = src[keep], dst[keep], cost[keep]
+
+        # Cada aresta é guardada nos dois sentidos e ordenada por (origem, destino).
+        all_src = np.concatenate((src, dst))
+        all_dst = np.concatenate((dst, src))
+        all_cost = np.concatenate((cost, cost))
+        keys = all_src * (dimension + 1) + all_dst
+        idx = np.argsort(keys)
+        sorted_keys = keys[idx]
+        repeated = sorted_keys[1:] == sorted_keys[:-1]
+        if repeated.any():
+            # Só com arestas repetidas a ordem original importa: a ordenação
+            # estável garante que a última ocorrência vença.
+            idx = np.argsort(keys, kind="stable")
+            sorted_keys = keys[idx]
+            last = np.ones(len(idx), dtype=bool)
+            last[:-1] = sorted_keys[1:] != sorted_keys[:-1]
+            idx = idx[last]
+        all_src, all_dst, all_cost = all_src[idx], all_dst[idx], all_cost[idx]
+
+        counts = np.bincount(all_src, minlength=dimension + 1)
+        offsets = np.zeros(dimension + 2, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return cls(dimension, offsets, all_dst.astype(np.int32), all_cost, weighted)
+
+    def nodes(self):
+        """Retorna os vértices do grafo (1..dimension)."""
+        return range(1, self.dimension + 1)
+
+    def number_of_nodes(self):
+        return self.dimension
+
+    def number_of_edges(self):
+        return len(self.targets) // 2
+
+    def degree(self, vertex):
+        return int(self.offsets[vertex + 1] - self.offsets[vertex])
+
+    def adjacency(self):
+        """
+        Retorna, para cada vértice, a lista de vizinhos como inteiros Python.
+        As listas são geradas uma única vez a partir dos vetores CSR e servem
+        aos laços das buscas, onde indexar arrays NumPy elemento a elemento
+        seria mais lento.
+        """
+        if self._adjacency is None:
+            offsets = self.offsets.tolist()
+            targets = self.targets.tolist()
+            self._adjacency = [targets[offsets[v]:offsets[v + 1]] for v in range(self.dimension + 1)]
+        return self._adjacency
+
+    def adjacency_weights(self):
+        """Retorna, para cada vértice, os pesos das arestas na ordem de adjacency()."""
+        if self._adjacency_weights is None:
+            offsets = self.offsets.tolist()
+            weights = self.weights.tolist()
+            self._adjacency_weights = [weights[offsets[v]:offsets[v + 1]] for v in range(self.dimension + 1)]
+        return self._adjacency_weights
+
+    def neighbors(self, vertex):
+        return self.adjacency()[vertex]
+
+    def weight(self, u, v):
+        """Retorna o peso da aresta (u, v); gera KeyError se ela não existir."""
+        start, end = self.offsets[u], self.offsets[u + 1]
+        pos = start + np.searchsorted(self.targets[start:end], v)
+        if pos >= end or self.targets[pos] != v:
+            raise KeyError((u, v))
+        return float(self.weights[pos])
+
+    def to_networkx(self):
+        """
+        Constrói um nx.Graph equivalente. Usado apenas para desenhar o grafo,
+        por isso o networkx só é importado aqui.
+        """
+        import networkx as nx
+
+        G = nx.Graph()
+        G.add_nodes_from(self.nodes())
+        src = np.repeat(np.arange(self.dimension + 1), np.diff(self.offsets))
+        mask = src < self.targets
+        if self.weighted:
+            G.add_weighted_edges_from(zip(src[mask].tolist(), self.targets[mask].tolist(),
+                                          self.weights[mask].tolist()))
+        else:
+            G.add_edges_from(zip(src[mask].tolist(), self.targets[mask].tolist()))
+        return G
+
@@ -0,0 +1,75 @@
+"""
+Heurísticas da busca A* e do IDA*, pré-calculadas por profundidade.
+
+Com a ordem dos vértices fixa, o estado de profundidade d tem exatamente os d
+primeiros vértices coloridos. Como o custo de colorir um vértice é o peso das
+arestas até os vizinhos já coloridos, ele não depende das cores escolhidas, e
+cada heurística abaixo vira uma tabela h[d] consultada em O(1) por filho.
+
+  remaining  peso das arestas que ainda serão pagas (as que têm uma ponta na
+             posição d ou depois). É o custo restante exato, logo admissível.
+  average    (vizinhos não coloridos do último vértice colorido) × (peso médio
+             das arestas dele); era a heurística original, não é admissível.
+  zero       h = 0 (equivale à busca ordenada pelo custo).
+"""
+
+
+def _positions(vertices):
+    return {v: i for i, v in enumerate(vertices)}
+
+
+def remaining_weight(G, vertices):
+    """h[d] = soma dos pesos das arestas cuja ponta mais tardia está na posição d ou depois."""
+    position = _positions(vertices)
+    adjacency = G.adjacency()
+    adjacency_weights = G.adjacency_weights()
+    # paid[i]: peso pago ao colorir o vértice da posição i
+    paid = [0.0] * len(vertices)
+    for i, v in enumerate(vertices):
+        for u, w in zip(adjacency[v], adjacency_weights[v]):
+            j = position.get(u)
+            if j is not None and j < i:
+                paid[i] += w
+    table = [0.0] * (len(vertices) + 1)
+    for i in range(len(vertices) - 1, -1, -1):
+        table[i] = table[i + 1] + paid[i]
+    return table
+
+
+def average_weight(G, vertices):
+    """
+    h[d] = vizinhos ainda não coloridos do vértice da posição d - 1 × peso médio
+    das arestas dele (na raiz, o primeiro vértice).
+    """
+    position = _positions(vertices)
+    adjacency = G.adjacency()
+    adjacency_weights = G.adjacency_weights()
+    per_vertex = []
+    for i, v in enumerate(vertices):
+        neighbors = adjacency[v]
+        later = sum(1 for u in neighbors if position.get(u, -1) > i)
+        avg = sum(adjacency_weights[v]) / len(neighbors) if len(neighbors) else 0
+        per_vertex.append(later * avg)
+    if not per_vertex:
+        return [0]
+    return [per_vertex[0]] + per_vertex
+
+
+def zero(G, vertices):
+    return [0] * (len(vertices) + 1)
+
+
+HEURISTICS = {
+    "remaining": remaining_weight,
+    "average": average_weight,
+    "zero": zero,
+}
+
+
+def heuristic_table(name, G, vertices):
+    """Monta a tabela h[profundidade] da heurística 'name'."""
+    try:
+        build = HEURISTICS[name]
+    except KeyError:
+        raise ValueError(f"Heurística desconhecida: {name}") from None
+    return build(G, vertices)
@@ -0,0 +1,122 @@
+"""
+Métricas de uma execução, gravadas em JSON com a opção --metrics.
+
+Contadores da busca:
+  generated              nós criados na árvore de busca (inclui os de solução);
+  expanded               estados cujos filhos foram gerados;
+  is_valid_calls         testes de uma cor para um vértice;
+  legal_colors_calls     consultas das cores válidas de um vértice (os motores
+                         usam esta consulta, que testa todas as cores de uma
+                         vez, no lugar de uma chamada de is_valid por cor);
+  cost_for_vertex_calls  cálculos do custo de colorir um vértice;
+  heap_pushes/heap_pops  operações na fila de prioridade (A* e busca ordenada);
+  max_frontier           maior número de estados abertos ao mesmo tempo;
+  max_depth              maior profundidade (vértices coloridos) alcançada.
+Os motores somam os contadores em variáveis locais e os registram uma vez, ao
+terminar, em vez de atualizar o objeto a cada nó. As chamadas de is_valid,
+legal_colors e cost_for_vertex são contadas embrulhando os métodos do objeto
+de estado (ver SearchMetrics.instrument), o que só acontece com as métricas
+ligadas.
+
+Também são medidos o tempo de cada fase (leitura, busca, desenho) e, com
+--metrics-memory, o pico de memória alocada pelo Python (tracemalloc, que
+deixa a execução algumas vezes mais lenta).
+"""
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+COUNTERS = ("generated", "expanded", "is_valid_calls", "legal_colors_calls", "cost_for_vertex_calls",
+            "heap_pushes", "heap_pops", "max_frontier", "max_depth")
+# Contadores que guardam o maior valor visto, e não a soma.
+MAXIMA = ("max_frontier", "max_depth")
+# Métodos contados por instrument() e o contador de cada um.
+INSTRUMENTED = (("is_valid", "is_valid_calls"), ("legal_colors", "legal_colors_calls"),
+                ("cost_for_vertex", "cost_for_vertex_calls"))
+
+
+def _counting(method, counters, key):
+    def counted(*args, **kwargs):
+        counters[key] += 1
+        return method(*args, **kwargs)
+    return counted
+
+
+class SearchMetrics:
+    """Contadores, tempos por fase e pico de memória de uma execução."""
+
+    def __init__(self, memory=False):
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.phases = {}
+        self.memory = memory
+        if memory:
+            tracemalloc.start()
+
+    def record(self, **counts):
+        """Soma os contadores informados (ou guarda o máximo, para os de MAXIMA)."""
+        counters = self.counters
+        for key, value in counts.items():
+            if key in MAXIMA:
+                counters[key] = max(counters[key], value)
+            else:
+                counters[key] += value
+
+    def instrument(self, state):
+        """
+        Passa a contar as chamadas de is_valid, legal_colors e cost_for_vertex de 'state'
+        (ColorState, TrailState, PackedColoring, DomainStore...), trocando os
+        métodos do objeto por versões que contam. Retorna o próprio 'state'.
+        """
+        for name, key in INSTRUMENTED:
+            method = getattr(state, name, None)
+            if method is not None:
+                setattr(state, name, _counting(method, self.counters, key))
+        return state
+
+    @contextmanager
+    def phase(self, name):
+        """Soma ao tempo da fase 'name' o tempo gasto dentro do bloco."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def to_dict(self):
+        result = {"counters": dict(self.counters),
+                  "phases": {name: round(seconds, 6) for name, seconds in self.phases.items()}}
+        if self.memory and tracemalloc.is_tracing():
+            result["memory_peak"] = tracemalloc.get_traced_memory()[1]
+        return result
+
+    def save(self, path):
+        """Grava as métricas em JSON e desliga o tracemalloc, se estava ligado."""
+        data = self.to_dict()
+        if self.memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        with open(path, "w", encoding="utf-8") as output:
+            json.dump(data, output, indent=1)
+        return data
+
+
+def timed(metrics, name):
+    """Cronômetro da fase 'name', ou um bloco vazio se as métricas estão desligadas."""
+    return metrics.phase(name) if metrics is not None else nullcontext()
+
+
+def add_metrics_arguments(parser):
+    """Adiciona ao argparse as opções --metrics e --metrics-memory."""
+    parser.add_argument("--metrics", metavar="ARQUIVO", default=None,
+                        help="Grava em JSON os contadores da busca e o tempo de cada fase")
+    parser.add_argument("--metrics-memory", action="store_true",
+                        help="Com --metrics, mede também o pico de memória (tracemalloc; deixa a busca mais lenta)")
+
+
+def metrics_from_args(parser, args):
+    """Cria o SearchMetrics pedido na linha de comando ou None se --metrics não foi usado."""
+    if args.metrics_memory and args.metrics is None:
+        parser.error("--metrics-memory exige --metrics")
+    if args.metrics is None:
+        return None
+    return SearchMetrics(memory=args.metrics_memory)
@@ -0,0 +1,47 @@
+class NogoodStore:
+    """
+    Nogoods aprendidos pelo backjumping: combinações de atribuições
+    {(vértice, cor), ...} que não podem ser estendidas a uma solução.
+
+    Cada nogood é indexado pela atribuição do seu vértice mais profundo; ao
+    tentar essa atribuição de novo, basta conferir se as demais continuam
+    valendo. Só são guardados nogoods com até 'max_size' atribuições.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._by_literal = {}
+        self.recorded = 0
+        self.hits = 0
+
+    def __len__(self):
+        return self.recorded
+
+    def record(self, conflicts, colors, level):
+        """Guarda o nogood formado pelas cores atuais dos vértices em 'conflicts'."""
+        if not conflicts or len(conflicts) > self.max_size:
+            return
+        deepest = max(conflicts, key=level.__getitem__)
+        rest = [(u, colors[u]) for u in conflicts if u != deepest]
+        self.record_path(rest + [(deepest, colors[deepest])])
+
+    def record_path(self, path):
+        """
+        Guarda como nogood a coloração parcial 'path' = [(vértice, cor), ...],
+        em que a última atribuição é a mais profunda.
+        """
+        if not path or len(path) > self.max_size:
+            return
+        self._by_literal.setdefault(path[-1], []).append(tuple(path[:-1]))
+        self.recorded += 1
+
+    def violated(self, vertex, color, colors):
+        """
+        Se colorir 'vertex' com 'color' completa algum nogood, retorna os demais
+        vértices dele (os culpados); senão retorna None.
+        """
+        for rest in self._by_literal.get((vertex, color), ()):
+            if all(colors[u] == c for u, c in rest):
+                self.hits += 1
+                return [u for u, _ in rest]
+        return None
@@ -0,0 +1,76 @@
+from core.coloring import ColorState
+
+
+class DsaturState(ColorState):
+    """
+    ColorState que escolhe o próximo vértice pela regra DSATUR: o de maior grau de
+    saturação (cores distintas nos vizinhos coloridos), desempatando pelo maior
+    grau e depois pelo menor número de vértice.
+
+    Os vértices não coloridos ficam em baldes indexados por
+    saturação * (grau máximo + 1) + grau; 'top' aponta para um balde igual ou
+    acima do mais alto não vazio. Atribuir ou desfazer uma cor move só os
+    vizinhos cuja saturação mudou, então a escolha custa O(1) amortizado mais o
+    tamanho do balde.
+    """
+
+    def __init__(self, G, vertices, num_colors=4, track_cost=True):
+        super().__init__(G, num_colors, track_cost)
+        self._degree = [0] * (G.dimension + 1)
+        for v in vertices:
+            self._degree[v] = len(self._adjacency[v])
+        self._span = max(self._degree) + 1
+        self._key = [-1] * (G.dimension + 1)
+        self._buckets = [set() for _ in range((num_colors + 1) * self._span)]
+        self._top = 0
+        self.uncolored = 0
+        for v in vertices:
+            self._insert(v)
+
+    def _insert(self, vertex):
+        key = self.saturation(vertex) * self._span + self._degree[vertex]
+        self._key[vertex] = key
+        self._buckets[key].add(vertex)
+        if key > self._top:
+            self._top = key
+        self.uncolored += 1
+
+    def _remove(self, vertex):
+        self._buckets[self._key[vertex]].discard(vertex)
+        self._key[vertex] = -1
+        self.uncolored -= 1
+
+    def _refresh_neighbors(self, vertex):
+        colors = self.colors
+        for neighbor in self._adjacency[vertex]:
+            old = self._key[neighbor]
+            if old < 0 or colors[neighbor]:
+                continue
+            key = self.saturation(neighbor) * self._span + self._degree[neighbor]
+            if key != old:
+                self._buckets[old].discard(neighbor)
+                self._buckets[key].add(neighbor)
+                self._key[neighbor] = key
+                if key > self._top:
+                    self._top = key
+
+    def assign(self, vertex, color):
+        self._remove(vertex)
+        super().assign(vertex, color)
+        self._refresh_neighbors(vertex)
+
+    def unassign(self, vertex):
+        super().unassign(vertex)
+        self._refresh_neighbors(vertex)
+        self._insert(vertex)
+
+    def select_vertex(self):
+        """Retorna o próximo vértice a colorir (None se todos estão coloridos)."""
+        if not self.uncolored:
+            return None
+        buckets = self._buckets
+        top = self._top
+        while not buckets[top]:
+            top -= 1
+        self._top = top
+        return min(buckets[top])
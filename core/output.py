@@ -0,0 +1,51 @@
+"""
+Saída para execução sem interface: --no-draw e --json.
+
+Com --no-draw os scripts não desenham o grafo nem a árvore (o matplotlib e o
+networkx só são importados dentro das funções de desenho, então nem chegam a
+ser carregados) e a árvore de busca deixa de ser guardada, a menos que
+--tree-export a peça. Com --json o resultado é escrito em uma linha JSON no
+stdout; as mensagens de sempre passam para o stderr.
+"""
+import sys
+import json
+
+
+def add_output_arguments(parser):
+    """Adiciona ao argparse as opções --no-draw e --json."""
+    parser.add_argument("--no-draw", action="store_true",
+                        help="Não desenha o grafo colorido nem a árvore de busca")
+    parser.add_argument("--json", action="store_true",
+                        help="Escreve o resultado em JSON no stdout; as demais mensagens vão para o stderr")
+
+
+def output_from_args(args):
+    """
+    Aplica --no-draw e --json antes da busca: desliga o registro da árvore que
+    não será desenhada nem exportada e desvia as mensagens para o stderr.
+    Retorna o stdout original, onde write_result grava o JSON.
+    """
+    if args.no_draw and not args.tree_export:
+        args.tree = "off"
+    stdout = sys.stdout
+    if args.json:
+        sys.stdout = sys.stderr
+    return stdout
+
+
+def write_result(args, stdout, algorithm, assignment, nodes, seconds, **extra):
+    """
+    Com --json, grava em 'stdout' o resultado: arquivo, algoritmo, status,
+    número de cores, coloração, nós gerados, segundos de busca e os campos de
+    'extra' (custo, total de colorações...).
+    """
+    if not args.json:
+        return
+    result = {"arquivo": args.file_path, "algoritmo": algorithm,
+              "status": "coloração" if assignment is not None else "sem coloração",
+              "cores": max(assignment.values(), default=0) if assignment is not None else None,
+              "solucao": assignment, "nos": nodes, "segundos": round(seconds, 6)}
+    result.update(extra)
+    json.dump(result, stdout, ensure_ascii=False)
+    stdout.write("\n")
+    stdout.flush()
@@ -0,0 +1,75 @@
+class PackedColoring:
+    """
+    Codifica colorações parciais de uma ordem fixa de vértices em um inteiro.
+
+    O vértice na posição i da ordem ocupa 'bits' bits a partir do bit bits * i,
+    guardando cor - 1 (2 bits por vértice com 4 cores). Como a ordem é fixa, um
+    estado com 'index' vértices coloridos usa só as primeiras 'index' posições.
+    """
+
+    def __init__(self, G, vertices, num_colors=4):
+        self.vertices = vertices
+        self.num_colors = num_colors
+        self.palette = list(range(1, num_colors + 1))
+        self.bits = max(1, (num_colors - 1).bit_length())
+        self.mask = (1 << self.bits) - 1
+        self.nbytes = (self.bits * len(vertices) + 7) // 8
+        position = {v: i for i, v in enumerate(vertices)}
+        adjacency = G.adjacency()
+        # Para cada posição, os deslocamentos dos vizinhos que vêm antes na ordem.
+        self.earlier_shifts = [
+            [position[u] * self.bits for u in adjacency[v] if u in position and position[u] < i]
+            for i, v in enumerate(vertices)
+        ]
+        self._legal = {}
+        self._above = [sum(1 << c for c in self.palette if c > limit) for limit in range(num_colors + 2)]
+
+    def color_at(self, packed, index):
+        return ((packed >> (self.bits * index)) & self.mask) + 1
+
+    def with_color(self, packed, index, color):
+        return packed | ((color - 1) << (self.bits * index))
+
+    def legal_colors(self, packed, index, top=None):
+        """
+        Retorna as cores válidas para o vértice na posição 'index'. Se 'top' (a
+        maior cor já usada) for informado, só aceita cores até top + 1.
+        """
+        mask = self.mask
+        forbidden = 0 if top is None else self._above[top + 1]
+        for shift in self.earlier_shifts[index]:
+            forbidden |= 2 << ((packed >> shift) & mask)
+        legal = self._legal.get(forbidden)
+        if legal is None:
+            legal = [color for color in self.palette if not forbidden >> color & 1]
+            self._legal[forbidden] = legal
+        return legal
+
+    def unpack(self, packed, index):
+        """Reconstrói o dicionário {vértice: cor} das 'index' primeiras posições."""
+        return {self.vertices[i]: self.color_at(packed, i) for i in range(index)}
+
+    def to_bytes(self, packed):
+        return packed.to_bytes(self.nbytes, "little")
+
+    def from_bytes(self, data):
+        return int.from_bytes(data, "little")
+
+    def canonical_root(self):
+        """Forma canônica da coloração vazia: (packed, relabel)."""
+        return 0, (0,) * (self.num_colors + 1)
+
+    def canonical_child(self, canon, index, color):
+        """
+        Estende a forma canônica 'canon' = (packed, relabel) com 'color' na
+        posição 'index'. As cores são renomeadas na ordem em que aparecem (a
+        primeira cor usada vira 1, a segunda 2, ...); 'relabel[c]' é o novo nome
+        da cor c (0 se ainda não apareceu). Colorações que diferem só por uma
+        permutação das cores têm o mesmo 'packed' canônico.
+        """
+        packed, relabel = canon
+        label = relabel[color]
+        if not label:
+            label = max(relabel) + 1
+            relabel = relabel[:color] + (label,) + relabel[color + 1:]
+        return packed | ((label - 1) << (self.bits * index)), relabel
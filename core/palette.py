@@ -0,0 +1,47 @@
+"""
+Paleta de cores dos scripts: quantas cores a busca pode usar e o nome de cada
+uma nos desenhos.
+"""
+import argparse
+import colorsys
+
+DEFAULT_COLORS = 4
+
+# As quatro primeiras são as cores originais dos desenhos.
+COLOR_NAMES = ("red", "green", "blue", "yellow", "orange", "purple",
+               "cyan", "magenta", "brown", "pink", "olive", "teal")
+
+
+def color_name(color, default="gray"):
+    """
+    Cor do matplotlib para a cor 'color' (int ou texto, como nos rótulos da
+    árvore). Além das nomeadas, gera tons espaçados pela razão áurea.
+    Devolve 'default' se 'color' não for uma cor válida.
+    """
+    try:
+        color = int(color)
+    except (TypeError, ValueError):
+        return default
+    if color < 1:
+        return default
+    if color <= len(COLOR_NAMES):
+        return COLOR_NAMES[color - 1]
+    hue = (color * 0.618033988749895) % 1.0
+    r, g, b = colorsys.hsv_to_rgb(hue, 0.65, 0.95)
+    return f"#{int(r * 255):02x}{int(g * 255):02x}{int(b * 255):02x}"
+
+
+def _palette_size(text):
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"número de cores inválido: {text}") from None
+    if not 1 <= value <= 127:
+        raise argparse.ArgumentTypeError("o número de cores deve estar entre 1 e 127")
+    return value
+
+
+def add_palette_arguments(parser):
+    """Adiciona ao argparse a opção --colors."""
+    parser.add_argument("--colors", type=_palette_size, default=DEFAULT_COLORS,
+                        help=f"Número de cores disponíveis (padrão: {DEFAULT_COLORS})")
@@ -0,0 +1,75 @@
+"""
+Busca paralela por divisão da árvore de busca.
+
+A árvore é cortada em subproblemas independentes (por exemplo, colorações
+parciais dos primeiros vértices) que rodam em um pool de processos. Cada
+subproblema tem um orçamento de nós; quem o esgota devolve os ramos que ainda
+não tentou como novos subproblemas, então subárvores desequilibradas são
+redivididas enquanto a busca anda sem que nada já explorado seja refeito. Os
+subproblemas esperam em uma pilha (LIFO): os ramos devolvidos por último, os
+mais fundos, rodam primeiro, e a busca segue em profundidade como a
+sequencial. A primeira solução encerra o pool, interrompendo os processos que
+ainda trabalham.
+"""
+import multiprocessing
+import queue
+
+from core.tree import SOLUTION, STEP, SearchTreeRecorder
+
+
+class BudgetExceeded(Exception):
+    """O subproblema gerou mais nós do que o orçamento permite."""
+
+
+class BudgetRecorder(SearchTreeRecorder):
+    """
+    Registro de árvore desligado que conta os nós gerados e interrompe a busca
+    com BudgetExceeded ao passar de 'budget'. Nós de solução não são
+    interrompidos: a coloração já está completa.
+    """
+
+    def __init__(self, budget):
+        super().__init__("off")
+        self.budget = budget
+
+    def add(self, parent=None, vertex=0, color=0, g=0.0, h=0.0, kind=STEP):
+        node_id = self.size
+        if node_id >= self.budget and kind != SOLUTION:
+            raise BudgetExceeded()
+        self.size = node_id + 1
+        return node_id
+
+
+def parallel_search(tasks, run_task, workers, initializer=None, initargs=()):
+    """
+    Distribui 'tasks' por 'workers' processos. 'run_task(task)' roda em um
+    processo do pool e devolve (solução, subtarefas, nós gerados): uma solução
+    diferente de None encerra a busca; senão as subtarefas (possivelmente
+    nenhuma) entram no topo da pilha. 'tasks' e as subtarefas vêm na ordem em
+    que devem rodar. Só 'workers' tarefas ficam no pool de cada vez, para que
+    a ordem da pilha valha.
+    Retorna (solução ou None, subproblemas resolvidos, nós gerados).
+    """
+    results = queue.SimpleQueue()
+    stack = list(reversed(tasks))
+    solved = 0
+    nodes = 0
+    with multiprocessing.Pool(workers, initializer, initargs) as pool:
+        running = 0
+        while True:
+            while stack and running < workers:
+                pool.apply_async(run_task, (stack.pop(),), callback=results.put, error_callback=results.put)
+                running += 1
+            if not running:
+                return None, solved, nodes
+            result = results.get()
+            running -= 1
+            if isinstance(result, BaseException):
+                raise result
+            solution, subtasks, task_nodes = result
+            solved += 1
+            nodes += task_nodes
+            if solution is not None:
+                # Sair do 'with' chama pool.terminate(), que interrompe os demais.
+                return solution, solved, nodes
+            stack.extend(reversed(subtasks))
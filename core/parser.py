@@ -0,0 +1,236 @@
+import hashlib
+import io
+import mmap
+import os
+import warnings
+
+import numpy as np
+
+from core.graph import CSRGraph
+
+# Tamanho dos blocos lidos do arquivo mapeado em memória.
+CHUNK_SIZE = 1 << 24
+# Incrementar sempre que o conteúdo do cache mudar de formato.
+CACHE_VERSION = 2
+CACHE_DIR_NAME = ".graph_cache"
+
+
+def read_graph(file_path, weighted=False, use_cache=True, cache_dir=None):
+    """
+    Lê o arquivo e cria o grafo.
+    Formato esperado:
+      DIMENSION
+      <número de vértices>
+      GRAPH
+      <vértice1> <vértice2> [<custo>]
+      ...
+    Com weighted=True o custo é obrigatório e linhas sem ele são ignoradas.
+
+    O resultado é guardado em um cache binário (.npz) em 'cache_dir' (por padrão
+    a pasta .graph_cache ao lado do arquivo); uma nova leitura do mesmo arquivo
+    carrega os vetores do cache sem analisar o texto.
+    """
+    stat = os.stat(file_path)
+    cache_path = _cache_path(file_path, weighted, cache_dir) if use_cache else None
+    if cache_path is not None:
+        G = _load_cache(cache_path, file_path, stat)
+        if G is not None:
+            return G
+
+    G = parse_graph_file(file_path, weighted)
+
+    if cache_path is not None:
+        _save_cache(cache_path, G, stat, _file_digest(file_path))
+    return G
+
+
+def parse_graph_file(file_path, weighted=False):
+    """
+    Analisa o arquivo de grafo com o arquivo mapeado em memória, convertendo
+    cada bloco de arestas de uma só vez com NumPy.
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError("Erro: esperava 'DIMENSION' na primeira linha.")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            dimension, body_start = _parse_header(mm)
+            sources, destinations, costs = _parse_edges(mm, body_start, weighted)
+
+    if len(sources):
+        low = int(min(sources.min(), destinations.min()))
+        high = int(max(sources.max(), destinations.max()))
+        if low < 1 or high > dimension:
+            vertex = low if low < 1 else high
+            raise ValueError(f"Erro: vértice {vertex} fora do intervalo 1..{dimension} de 'DIMENSION'.")
+    return CSRGraph.from_edges(dimension, sources, destinations, costs)
+
+
+def _next_line(mm, pos):
+    """Retorna (linha sem espaços, posição seguinte), pulando linhas em branco."""
+    while pos < len(mm):
+        end = mm.find(b"\n", pos)
+        if end == -1:
+            end = len(mm)
+        line = mm[pos:end].strip()
+        pos = end + 1
+        if line:
+            return line.decode(), pos
+    return None, pos
+
+
+def _parse_header(mm):
+    line, pos = _next_line(mm, 0)
+    if line is None or line.upper() != "DIMENSION":
+        raise ValueError("Erro: esperava 'DIMENSION' na primeira linha.")
+    line, pos = _next_line(mm, pos)
+    if line is None:
+        raise ValueError("Erro: esperava o número de vértices após 'DIMENSION'.")
+    dimension = int(line)
+    line, pos = _next_line(mm, pos)
+    if line is None or line.upper() != "GRAPH":
+        raise ValueError("Erro: esperava 'GRAPH' após a dimensão.")
+    return dimension, pos
+
+
+def _parse_edges(mm, pos, weighted):
+    """
+    Converte as linhas de arestas em vetores (origens, destinos, custos).
+    O número de colunas é definido pela primeira linha de arestas; blocos que
+    não seguem esse padrão são analisados linha a linha.
+    """
+    first, _ = _next_line(mm, pos)
+    min_parts = 3 if weighted else 2
+    columns = len(first.split()) if first is not None else 0
+
+    blocks = []
+    size = len(mm)
+    while pos < size:
+        end = min(pos + CHUNK_SIZE, size)
+        if end < size:
+            newline = mm.rfind(b"\n", pos, end)
+            end = newline + 1 if newline != -1 else size
+        chunk = mm[pos:end]
+        pos = end
+        blocks.append(_parse_chunk(chunk, columns, min_parts))
+
+    if blocks:
+        values = np.concatenate(blocks)
+    else:
+        values = np.empty((0, min_parts))
+    sources = values[:, 0].astype(np.int64)
+    destinations = values[:, 1].astype(np.int64)
+    costs = values[:, 2] if weighted else None
+    return sources, destinations, costs
+
+
+def _parse_chunk(chunk, columns, min_parts):
+    chunk = chunk.strip()
+    if not chunk:
+        return np.empty((0, min_parts))
+    if columns >= min_parts:
+        # Inteiros são convertidos bem mais rápido. Se o bloco tiver custos com
+        # casas decimais, o fromstring para no meio: conforme a versão do NumPy
+        # ele levanta ValueError ou só avisa com DeprecationWarning e devolve o
+        # que leu, por isso o aviso vira erro. Como ele ignora as quebras de
+        # linha, o número de valores de cada linha também é conferido antes de
+        # remontar a matriz. Se algo falhar, o bloco inteiro é lido como float
+        # pelo loadtxt, que exige o mesmo número de colunas em todas as linhas.
+        lines = chunk.count(b"\n") + 1
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error", DeprecationWarning)
+                values = np.fromstring(chunk, dtype=np.int64, sep=" ")
+        except (ValueError, DeprecationWarning):
+            values = None
+        if values is not None and values.size == lines * columns and _uniform_lines(chunk, lines, columns):
+            return values.reshape(lines, columns)[:, :min_parts].astype(np.float64)
+        try:
+            values = np.loadtxt(io.BytesIO(chunk), dtype=np.float64, ndmin=2)
+        except ValueError:
+            values = None
+        if values is not None and values.shape[1] >= min_parts:
+            return values[:, :min_parts]
+
+    rows = []
+    for line in chunk.splitlines():
+        parts = line.split()
+        if len(parts) >= min_parts:
+            rows.append([float(p) for p in parts[:min_parts]])
+    return np.array(rows, dtype=np.float64).reshape(-1, min_parts)
+
+
+def _uniform_lines(chunk, lines, columns):
+    """Confere se cada uma das 'lines' linhas do bloco tem exatamente 'columns' valores."""
+    data = np.frombuffer(chunk, dtype=np.uint8)
+    blank = data <= ord(" ")
+    # Um valor começa em cada caractere não branco precedido por um branco.
+    starts = ~blank
+    starts[1:] &= blank[:-1]
+    bounds = np.flatnonzero(data == ord("\n")) + 1
+    if len(bounds) != lines - 1:
+        return False
+    counts = np.add.reduceat(starts, np.concatenate(([0], bounds)), dtype=np.int64)
+    return bool((counts == columns).all())
+
+
+def _digest(mm):
+    h = hashlib.blake2b(digest_size=16)
+    for start in range(0, len(mm), CHUNK_SIZE):
+        h.update(mm[start:start + CHUNK_SIZE])
+    return h.hexdigest()
+
+
+def _file_digest(file_path):
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.blake2b(digest_size=16).hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _digest(mm)
+
+
+def _cache_path(file_path, weighted, cache_dir):
+    file_path = os.path.abspath(file_path)
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(file_path), CACHE_DIR_NAME)
+    key = hashlib.sha1(file_path.encode()).hexdigest()[:12]
+    kind = "w" if weighted else "u"
+    return os.path.join(cache_dir, f"{os.path.basename(file_path)}.{key}.{kind}.npz")
+
+
+def _load_cache(cache_path, file_path, stat):
+    """
+    Carrega o grafo do cache se ele corresponder ao arquivo atual. Tamanho e
+    data de modificação iguais bastam; se só a data mudou, o conteúdo é
+    comparado pelo resumo antes de aceitar o cache.
+    """
+    try:
+        with np.load(cache_path) as data:
+            if int(data["version"]) != CACHE_VERSION or int(data["size"]) != stat.st_size:
+                return None
+            G = CSRGraph(int(data["dimension"]), data["offsets"], data["targets"],
+                         data["weights"], bool(data["weighted"]))
+            touched = int(data["mtime_ns"]) != stat.st_mtime_ns
+            digest = str(data["digest"])
+    except (OSError, KeyError, ValueError):
+        return None
+
+    if touched:
+        if digest != _file_digest(file_path):
+            return None
+        _save_cache(cache_path, G, stat, digest)
+    return G
+
+
+def _save_cache(cache_path, G, stat, digest):
+    """Grava o cache de forma atômica; falhas de escrita são ignoradas."""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, version=CACHE_VERSION, size=stat.st_size, mtime_ns=stat.st_mtime_ns,
+                     digest=digest, dimension=G.dimension, weighted=G.weighted,
+                     offsets=G.offsets, targets=G.targets, weights=G.weights)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -0,0 +1,82 @@
+"""
+Perfil de desempenho de uma execução com cProfile, ligado pela opção --profile.
+
+O perfil é gravado no arquivo .prof pedido (que pode ser aberto com pstats,
+snakeviz etc.) junto com um resumo em texto das funções mais caras, no mesmo
+caminho com o sufixo '_top.txt'. Com --profile-scope search (padrão) só a fase
+de busca é medida; com 'all', a execução inteira depois da leitura das opções,
+incluindo a leitura do grafo, os logs e os desenhos.
+"""
+import io
+import os
+import cProfile
+import pstats
+from contextlib import contextmanager, nullcontext
+
+PROFILE_SCOPES = ("search", "all")
+
+
+class SearchProfiler:
+    """Perfil cProfile de uma execução, restrito à busca ou da execução inteira."""
+
+    def __init__(self, path, top=20, scope="search"):
+        self.path = path
+        self.top = top
+        self.scope = scope
+        self.profile = cProfile.Profile()
+        if scope == "all":
+            self.profile.enable()
+
+    @contextmanager
+    def phase(self, name):
+        """Mede o bloco se ele é a fase escolhida em --profile-scope."""
+        if self.scope != name:
+            yield
+            return
+        self.profile.enable()
+        try:
+            yield
+        finally:
+            self.profile.disable()
+
+    def summary(self):
+        """Texto com as 'top' funções de maior tempo próprio e de maior tempo acumulado."""
+        text = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=text).strip_dirs()
+        for order in ("tottime", "cumulative"):
+            stats.sort_stats(order).print_stats(self.top)
+        return text.getvalue()
+
+    def save(self):
+        """Grava o .prof e o resumo; retorna o caminho do resumo."""
+        if self.scope == "all":
+            self.profile.disable()
+        self.profile.dump_stats(self.path)
+        summary_path = os.path.splitext(self.path)[0] + "_top.txt"
+        with open(summary_path, "w", encoding="utf-8") as output:
+            output.write(self.summary())
+        return summary_path
+
+
+def profiled(profiler, name):
+    """Bloco medido pelo perfil na fase 'name', ou um bloco vazio sem --profile."""
+    return profiler.phase(name) if profiler is not None else nullcontext()
+
+
+def add_profile_arguments(parser):
+    """Adiciona ao argparse as opções --profile, --profile-top e --profile-scope."""
+    parser.add_argument("--profile", metavar="ARQUIVO", default=None,
+                        help="Roda sob cProfile e grava o perfil neste arquivo .prof (e o resumo em *_top.txt)")
+    parser.add_argument("--profile-top", type=int, default=20, metavar="N",
+                        help="Funções listadas no resumo do perfil (padrão: 20)")
+    parser.add_argument("--profile-scope", choices=PROFILE_SCOPES, default="search",
+                        help="Mede só a busca ('search', padrão) ou a execução inteira ('all')")
+
+
+def profiler_from_args(parser, args):
+    """Cria o SearchProfiler pedido na linha de comando ou None se --profile não foi usado."""
+    if args.profile is None:
+        return None
+    if args.profile_top < 1:
+        parser.error("--profile-top deve ser pelo menos 1")
+    return SearchProfiler(args.profile, args.profile_top, args.profile_scope)
@@ -0,0 +1,88 @@
+"""
+Propagação de restrições para o backtracking.
+
+Cada vértice tem um domínio (máscara de bits, bit c ligado se a cor c ainda é
+possível). Toda redução de domínio é empilhada em uma trilha, e undo(marca)
+desfaz as reduções feitas depois de mark(). Níveis de propagação:
+
+  fc   forward checking: ao colorir v com c, remove c dos domínios dos vizinhos
+       de v e falha se algum ficar vazio;
+  ac3  consistência de arco: como as restrições são u != v, revisar o arco
+       (u, v) só remove algo quando o domínio de v tem uma única cor; assim o
+       AC-3 se reduz a propagar todo domínio que ficar unitário.
+"""
+
+PROPAGATION_MODES = ("none", "fc", "ac3")
+
+
+class DomainStore:
+    """Domínios dos vértices com trilha para desfazer."""
+
+    def __init__(self, G, vertices, num_colors=4, mode="fc"):
+        if mode not in ("fc", "ac3"):
+            raise ValueError(f"Propagação desconhecida: {mode}")
+        self.mode = mode
+        self.palette = list(range(1, num_colors + 1))
+        full = sum(1 << c for c in self.palette)
+        self.domain = [0] * (G.dimension + 1)
+        for v in vertices:
+            self.domain[v] = full
+        self.trail = []
+        self.wipeouts = 0
+        self._adjacency = G.adjacency()
+        self._legal = {}
+        self._above = [sum(1 << c for c in self.palette if c > limit) for limit in range(num_colors + 2)]
+
+    def mark(self):
+        return len(self.trail)
+
+    def undo(self, mark):
+        domain = self.domain
+        trail = self.trail
+        while len(trail) > mark:
+            vertex, old = trail.pop()
+            domain[vertex] = old
+
+    def legal_colors(self, vertex, top=None):
+        """
+        Cores do domínio de 'vertex' (lista compartilhada, não alterar). Se 'top'
+        (a maior cor já usada) for informado, só aceita cores até top + 1.
+        """
+        mask = self.domain[vertex]
+        if top is not None:
+            mask &= ~self._above[top + 1]
+        legal = self._legal.get(mask)
+        if legal is None:
+            legal = [color for color in self.palette if mask >> color & 1]
+            self._legal[mask] = legal
+        return legal
+
+    def assign(self, vertex, color):
+        """
+        Reduz o domínio de 'vertex' a 'color' e propaga. Retorna False se algum
+        domínio esvaziar; nesse caso o chamador deve desfazer até a sua marca.
+        """
+        domain = self.domain
+        trail = self.trail
+        adjacency = self._adjacency
+        bit = 1 << color
+        if domain[vertex] != bit:
+            trail.append((vertex, domain[vertex]))
+            domain[vertex] = bit
+        singletons = self.mode == "ac3"
+        pending = [(vertex, bit)]
+        while pending:
+            source, bit = pending.pop()
+            for neighbor in adjacency[source]:
+                mask = domain[neighbor]
+                if not mask & bit:
+                    continue
+                trail.append((neighbor, mask))
+                mask &= ~bit
+                domain[neighbor] = mask
+                if not mask:
+                    self.wipeouts += 1
+                    return False
+                if singletons and not mask & (mask - 1):
+                    pending.append((neighbor, mask))
+        return True
@@ -0,0 +1,44 @@
+"""
+Reconstrói, a partir de um log delta, as listas de abertos e fechados no
+formato do log completo.
+
+Uso:
+  python -m core.replay_log <log_delta> <iteração>   mostra uma iteração
+  python -m core.replay_log <log_delta> --all        mostra todas as iterações
+"""
+import argparse
+import sys
+
+from core.searchlog import DELTA_HEADER, replay
+
+
+def format_snapshot(number, open_states, closed_states):
+    return (f"Iteração {number}:\n"
+            "Abertos: " + ", ".join(open_states.values()) + "\n"
+            "Fechados: " + ", ".join(closed_states.values()) + "\n\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reconstrói abertos/fechados de um log delta")
+    parser.add_argument("log_file", help="Arquivo gravado com --log-mode delta")
+    parser.add_argument("iteration", type=int, nargs="?", help="Iteração a reconstruir")
+    parser.add_argument("--all", action="store_true", help="Mostra todas as iterações")
+    args = parser.parse_args()
+    if args.iteration is None and not args.all:
+        parser.error("informe a iteração ou --all")
+
+    with open(args.log_file, "r", encoding="utf-8") as f:
+        if f.readline() != DELTA_HEADER:
+            sys.exit(f"Erro: '{args.log_file}' não é um log delta.")
+        out = sys.stdout
+        found = False
+        for number, open_states, closed_states in replay(f, None if args.all else args.iteration):
+            if args.all or number == args.iteration:
+                out.write(format_snapshot(number, open_states, closed_states))
+                found = True
+        if not found:
+            sys.exit(f"Erro: a iteração {args.iteration} não existe no log.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+"""
+Logs de abertos/fechados usados pelas buscas.
+
+Modos:
+  full   a cada iteração grava as listas completas de abertos e fechados
+         (formato original dos arquivos *_log.txt);
+  delta  grava só o que mudou em cada iteração, uma linha por evento;
+  off    não grava nada.
+
+Formato do modo delta (texto, uma linha por evento):
+  # delta-log 1
+  i<n>            início da iteração n
+  +<id> <texto>   estado inserido em abertos
+  -<id>           estado removido de abertos
+  c<id>           estado inserido em fechados
+O estado completo de qualquer iteração pode ser reconstruído com
+'python -m core.replay_log <arquivo> <iteração>'.
+"""
+
+LOG_MODES = ("full", "delta", "off")
+DELTA_HEADER = "# delta-log 1\n"
+# Buffer grande: o log delta é escrito evento a evento.
+BUFFER_SIZE = 1 << 20
+
+
+class NullLog:
+    """Log desligado: todas as operações são vazias."""
+
+    keeps_closed = False
+
+    def iteration(self, number, open_states, closed_states):
+        pass
+
+    def push(self, state):
+        pass
+
+    def pop(self, state):
+        pass
+
+    def close_state(self, state):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class FullLog(NullLog):
+    """
+    Log completo: em cada iteração grava 'Abertos' e 'Fechados' inteiros
+    usando 'describe(state)'. Custa O(n) por iteração.
+    """
+
+    keeps_closed = True
+
+    def __init__(self, path, describe):
+        self.describe = describe
+        self._file = open(path, "w", encoding="utf-8", buffering=BUFFER_SIZE)
+
+    def iteration(self, number, open_states, closed_states):
+        describe = self.describe
+        self._file.write(f"Iteração {number}:\n")
+        self._file.write("Abertos: " + ", ".join([describe(s) for s in open_states]) + "\n")
+        self._file.write("Fechados: " + ", ".join([describe(s) for s in closed_states]) + "\n\n")
+
+    def close(self):
+        self._file.close()
+
+
+class DeltaLog(NullLog):
+    """
+    Log incremental: grava só os eventos de cada iteração. 'key(state)'
+    identifica o estado (o ID do nó na árvore de busca) e 'describe(state)' é o
+    texto mostrado na reconstrução.
+    """
+
+    def __init__(self, path, describe, key):
+        self.describe = describe
+        self.key = key
+        self._file = open(path, "w", encoding="utf-8", buffering=BUFFER_SIZE)
+        self._file.write(DELTA_HEADER)
+
+    def iteration(self, number, open_states, closed_states):
+        self._file.write(f"i{number}\n")
+
+    def push(self, state):
+        self._file.write(f"+{self.key(state)} {self.describe(state)}\n")
+
+    def pop(self, state):
+        self._file.write(f"-{self.key(state)}\n")
+
+    def close_state(self, state):
+        self._file.write(f"c{self.key(state)}\n")
+
+    def close(self):
+        self._file.close()
+
+
+def open_search_log(mode, path, describe, key):
+    """Cria o log do modo indicado ('full', 'delta' ou 'off')."""
+    if mode == "full":
+        return FullLog(path, describe)
+    if mode == "delta":
+        return DeltaLog(path, describe, key)
+    if mode == "off":
+        return NullLog()
+    raise ValueError(f"Modo de log desconhecido: {mode}")
+
+
+def replay(lines, stop=None):
+    """
+    Reconstrói os abertos e fechados de um log delta.
+    Gera (iteração, abertos, fechados) no início de cada iteração, onde abertos
+    e fechados são dicionários {id: texto} em ordem de inserção (os mesmos
+    objetos, atualizados a cada passo); para após a iteração 'stop', se informada.
+    Numa busca ordenada por heap os abertos aparecem em ordem de inserção, não
+    na ordem interna do heap.
+    """
+    open_states = {}
+    closed_states = {}
+    popped = {}
+    for line in lines:
+        line = line.rstrip("\n")
+        if not line or line.startswith("#"):
+            continue
+        kind, rest = line[0], line[1:]
+        if kind == "i":
+            number = int(rest)
+            if stop is not None and number > stop:
+                return
+            yield number, open_states, closed_states
+            popped.clear()
+        elif kind == "+":
+            key, _, text = rest.partition(" ")
+            open_states[key] = text
+        elif kind == "-":
+            popped[rest] = open_states.pop(rest)
+        elif kind == "c":
+            closed_states[rest] = popped.pop(rest)
+        else:
+            raise ValueError(f"Linha inválida no log delta: {line}")
@@ -0,0 +1,61 @@
+"""
+Enumeração e contagem de todas as colorações (modos --all e --count).
+
+Nesses modos a árvore de busca e o log ficam desligados por padrão (ver
+solutions_from_args).
+
+Com a quebra de simetria (--symmetry) a busca gera uma única coloração por
+classe de colorações que diferem só por uma troca de cores: a que usa as cores
+na ordem em que aparecem. Uma coloração que usa m das k cores representa
+k! / (k - m)! colorações, que é o peso somado na contagem.
+"""
+
+
+def symmetry_weight(num_colors, used):
+    """Número de colorações representadas por uma canônica com 'used' cores."""
+    weight = 1
+    for i in range(used):
+        weight *= num_colors - i
+    return weight
+
+
+def write_solutions(path, vertices, solutions):
+    """
+    Grava as colorações de 'solutions' em 'path', uma por linha (as cores na
+    ordem de 'vertices', precedidas de um cabeçalho com essa ordem), sem
+    guardá-las em memória. Retorna quantas foram gravadas.
+    """
+    count = 0
+    with open(path, "w", encoding="utf-8") as output:
+        output.write("# vértices: " + " ".join(map(str, vertices)) + "\n")
+        for assignment in solutions:
+            output.write(" ".join(str(assignment[v]) for v in vertices) + "\n")
+            count += 1
+    return count
+
+
+def solutions_from_args(args):
+    """
+    Diz se --all ou --count foi pedido. Nesse caso a árvore de busca e o log de
+    abertos/fechados ficam desligados, a menos que sejam pedidos na linha de
+    comando (--tree, --tree-export ou --log-mode): a enumeração percorre a
+    árvore inteira, e guardá-la custaria mais que montar as colorações.
+    Deve ser chamada antes de recorder_from_args.
+    """
+    enumerate_all = args.all is not None or args.count
+    if enumerate_all:
+        if args.tree is None and not args.tree_export:
+            args.tree = "off"
+        if getattr(args, "log_mode", "off") is None:
+            args.log_mode = "off"
+    return enumerate_all
+
+
+def add_solution_arguments(parser):
+    """Adiciona ao argparse as opções --all e --count."""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--all", metavar="ARQUIVO", default=None,
+                       help="Grava todas as colorações válidas neste arquivo, uma por linha "
+                            "(com --symmetry, uma por classe de troca de cores)")
+    group.add_argument("--count", action="store_true",
+                       help="Só conta as colorações válidas, sem montá-las")
@@ -0,0 +1,65 @@
+from core.coloring import ColorState
+
+
+class SearchNode:
+    """
+    Estado de busca representado por um ponteiro para o pai.
+    Cada nó guarda apenas a atribuição feita no passo que o gerou
+    ('vertex' = 'color'); a coloração parcial é o caminho até a raiz, de modo que
+    cada estado aberto ocupa memória constante.
+    A raiz não tem vértice nem pai e tem profundidade 0.
+    """
+
+    __slots__ = ("vertex", "color", "parent", "depth")
+
+    def __init__(self, vertex=None, color=0, parent=None):
+        self.vertex = vertex
+        self.color = color
+        self.parent = parent
+        self.depth = parent.depth + 1 if parent is not None else 0
+
+    def path(self):
+        """Retorna os nós do caminho da raiz (exclusive) até este nó."""
+        nodes = []
+        node = self
+        while node.parent is not None:
+            nodes.append(node)
+            node = node.parent
+        nodes.reverse()
+        return nodes
+
+    def assignment(self):
+        """Reconstrói o dicionário {vértice: cor} na ordem em que foram coloridos."""
+        return {node.vertex: node.color for node in self.path()}
+
+
+class TrailState(ColorState):
+    """
+    ColorState posicionado sobre um SearchNode.
+    goto() leva a coloração de um nó a outro desfazendo as atribuições até o
+    ancestral comum e refazendo as do caminho de destino. Em buscas que expandem
+    nós próximos (DFS, busca ordenada) o deslocamento é curto.
+    """
+
+    def __init__(self, G, root, num_colors=4):
+        super().__init__(G, num_colors)
+        self.node = root
+
+    def goto(self, destination):
+        current = self.node
+        target = destination
+        redo = []
+        while target.depth > current.depth:
+            redo.append(target)
+            target = target.parent
+        while current.depth > target.depth:
+            self.unassign(current.vertex)
+            current = current.parent
+        while current is not target:
+            self.unassign(current.vertex)
+            current = current.parent
+            redo.append(target)
+            target = target.parent
+        for node in reversed(redo):
+            self.assign(node.vertex, node.color)
+        self.node = destination
@@ -0,0 +1,35 @@
+class TranspositionTable:
+    """
+    Tabela de transposição das buscas com custo.
+
+    Guarda, para cada estado já gerado, o menor custo acumulado (g) com que ele
+    foi alcançado. A chave é (index, packed) com a coloração parcial em forma
+    canônica (ver PackedColoring.canonical_child), de modo que colorações iguais
+    a menos de uma permutação das cores contam como o mesmo estado.
+    """
+
+    def __init__(self):
+        self.best = {}
+        self.pruned = 0
+
+    def __len__(self):
+        return len(self.best)
+
+    def offer(self, key, g):
+        """
+        Registra o estado 'key' alcançado com custo 'g'. Retorna False (e conta
+        a poda) se ele já tinha sido alcançado com custo igual ou menor.
+        """
+        best = self.best.get(key)
+        if best is not None and best <= g:
+            self.pruned += 1
+            return False
+        self.best[key] = g
+        return True
+
+    def is_stale(self, key, g):
+        """Indica se o estado retirado da fila foi superado por um caminho mais barato."""
+        if self.best[key] < g:
+            self.pruned += 1
+            return True
+        return False
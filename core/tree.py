@@ -0,0 +1,230 @@
+"""
+Registro da árvore de busca em arrays.
+
+Cada nó gerado pela busca recebe um ID sequencial (usado também nos logs) e,
+conforme o modo, é guardado em arrays paralelos (pai, vértice, cor, g, h,
+profundidade, tipo). Os rótulos só são formatados na hora de desenhar.
+
+Modos:
+  full    guarda todos os nós;
+  depth   guarda só os nós com profundidade até 'max_depth';
+  sample  guarda cada nó com probabilidade 'sample_rate', independentemente
+          dos demais (o pai de um nó amostrado pode não ter sido guardado);
+  off     não guarda nada, só numera os nós.
+O desenho da árvore (formato e cortes) fica em core.treeview.
+"""
+import random
+from array import array
+from collections import deque
+
+TREE_MODES = ("full", "depth", "sample", "off")
+# Formatos do desenho da árvore (ver core.treeview).
+DRAW_FORMATS = ("png", "dot", "svg")
+
+# Tipos de nó
+ROOT = 0
+STEP = 1
+SOLUTION = 2
+
+FIELDS = (
+    ("id", "q", "i8"),
+    ("parent", "q", "i8"),
+    ("vertex", "q", "i8"),
+    ("color", "b", "i1"),
+    ("g", "d", "f8"),
+    ("h", "d", "f8"),
+    ("depth", "q", "i8"),
+    ("kind", "b", "i1"),
+)
+
+
+class SearchTreeRecorder:
+    """
+    Árvore de busca guardada em arrays que crescem conforme a busca avança.
+    add() devolve o ID do novo nó mesmo quando ele não é guardado.
+    """
+
+    def __init__(self, mode="full", max_depth=None, sample_rate=1.0, seed=0):
+        if mode not in TREE_MODES:
+            raise ValueError(f"Modo de árvore desconhecido: {mode}")
+        if mode == "depth" and max_depth is None:
+            raise ValueError("O modo 'depth' exige 'max_depth'.")
+        self.mode = mode
+        self.max_depth = max_depth
+        self.sample_rate = sample_rate
+        self._random = random.Random(seed).random
+        self.size = 0
+        for name, code, _ in FIELDS:
+            setattr(self, name, array(code))
+        # Nos modos parciais, linha de cada ID guardado.
+        self._row = {} if mode in ("depth", "sample") else None
+        # No modo sample, a profundidade de todos os nós gerados (4 bytes por nó).
+        self._all_depths = array("i") if mode == "sample" else None
+
+    def __len__(self):
+        return len(self.id)
+
+    def add(self, parent=None, vertex=0, color=0, g=0.0, h=0.0, kind=STEP):
+        node_id = self.size
+        self.size += 1
+        mode = self.mode
+        if mode == "off":
+            return node_id
+        if parent is None:
+            depth = 0
+        elif mode == "full":
+            depth = self.depth[parent] + 1
+        elif mode == "depth":
+            row = self._row.get(parent)
+            if row is None:
+                return node_id
+            depth = self.depth[row] + 1
+            if depth > self.max_depth:
+                return node_id
+        else:
+            depth = self._all_depths[parent] + 1
+        if mode == "sample":
+            self._all_depths.append(depth)
+            if parent is not None and self._random() >= self.sample_rate:
+                return node_id
+        if self._row is not None:
+            self._row[node_id] = len(self.id)
+        self.id.append(node_id)
+        self.parent.append(-1 if parent is None else parent)
+        self.vertex.append(vertex)
+        self.color.append(color)
+        self.g.append(g)
+        self.h.append(h)
+        self.depth.append(depth)
+        self.kind.append(kind)
+        return node_id
+
+    def row_of(self, node_id):
+        """Linha do nó nos arrays ou None se ele não foi guardado."""
+        if self._row is None:
+            return node_id if node_id < len(self.id) else None
+        return self._row.get(node_id)
+
+    def assignment(self, row):
+        """Reconstrói {vértice: cor} subindo do nó até a raiz."""
+        pairs = []
+        while row is not None and self.kind[row] != ROOT:
+            if self.kind[row] == STEP:
+                pairs.append((self.vertex[row], self.color[row]))
+            row = self.row_of(self.parent[row])
+        return dict(reversed(pairs))
+
+    def children(self):
+        """
+        Filhos (linhas) de cada linha e as linhas sem pai guardado, que são as
+        raízes do desenho.
+        """
+        children = [[] for _ in range(len(self.id))]
+        roots = []
+        for row, parent in enumerate(self.parent):
+            parent_row = self.row_of(parent) if parent >= 0 else None
+            if parent_row is None:
+                roots.append(row)
+            else:
+                children[parent_row].append(row)
+        return children, roots
+
+    def visible_rows(self, max_nodes=None, max_depth=None):
+        """
+        Escolhe as linhas a desenhar: percorre a árvore em largura a partir das
+        raízes, até 'max_depth' e até juntar 'max_nodes' linhas. Retorna
+        (linhas, filhos, ocultos), em que 'ocultos' dá, para cada linha
+        escolhida com filhos cortados, quantos nós guardados ficaram de fora
+        abaixo dela.
+        """
+        children, roots = self.children()
+        if max_nodes is None and max_depth is None:
+            return list(range(len(self.id))), children, {}
+        visible = bytearray(len(self.id))
+        rows = []
+        queue = deque(roots)
+        depths = self.depth
+        while queue and (max_nodes is None or len(rows) < max_nodes):
+            row = queue.popleft()
+            if max_depth is not None and depths[row] > max_depth:
+                continue
+            visible[row] = 1
+            rows.append(row)
+            queue.extend(children[row])
+        # Tamanho de cada subárvore; os filhos vêm sempre depois do pai nos arrays.
+        sizes = [1] * len(self.id)
+        for row in range(len(self.id) - 1, -1, -1):
+            for child in children[row]:
+                sizes[row] += sizes[child]
+        hidden = {}
+        for row in rows:
+            count = sum(sizes[child] for child in children[row] if not visible[child])
+            if count:
+                hidden[row] = count
+        return rows, children, hidden
+
+    def to_networkx(self, label, max_nodes=None, max_depth=None):
+        """
+        Monta um nx.DiGraph com os nós guardados; 'label(tree, row)' devolve o
+        rótulo de cada nó. Nós cujo pai não foi guardado ficam sem aresta de
+        entrada. Com 'max_nodes' ou 'max_depth' só entram as linhas de
+        visible_rows(), e os filhos cortados de cada nó viram um nó de resumo
+        "+N nós".
+        """
+        import networkx as nx
+
+        rows, _, hidden = self.visible_rows(max_nodes, max_depth)
+        tree = nx.DiGraph()
+        ids = self.id
+        parents = self.parent
+        for row in rows:
+            tree.add_node(ids[row], label=label(self, row))
+        for row in rows:
+            if parents[row] >= 0 and parents[row] in tree:
+                tree.add_edge(parents[row], ids[row])
+        for row, count in hidden.items():
+            summary = f"{ids[row]}+"
+            tree.add_node(summary, label=f"+{count} nós")
+            tree.add_edge(ids[row], summary)
+        return tree
+
+    def save(self, path):
+        """Grava os nós guardados em um único .npy com um campo por array."""
+        import numpy as np
+
+        data = np.empty(len(self.id), dtype=[(name, dtype) for name, _, dtype in FIELDS])
+        for name, _, dtype in FIELDS:
+            data[name] = np.frombuffer(getattr(self, name), dtype=dtype)
+        np.save(path, data)
+
+
+def add_tree_arguments(parser):
+    """Adiciona ao argparse as opções de registro da árvore de busca."""
+    parser.add_argument("--tree", choices=TREE_MODES, default=None,
+                        help="Registro da árvore de busca: completo, até uma profundidade, amostrado ou desligado "
+                             "(padrão: full; off com --all e --count)")
+    parser.add_argument("--tree-depth", type=int, default=None,
+                        help="Profundidade máxima guardada no modo depth")
+    parser.add_argument("--tree-sample", type=float, default=0.1,
+                        help="Fração de nós guardada no modo sample (padrão: 0.1)")
+    parser.add_argument("--tree-export", default=None,
+                        help="Grava os arrays da árvore neste arquivo .npy")
+    parser.add_argument("--tree-format", choices=DRAW_FORMATS, default="png",
+                        help="Formato do desenho da árvore; dot e svg são escritos direto, sem matplotlib (padrão: png)")
+    parser.add_argument("--tree-max-nodes", type=int, default=500, metavar="N",
+                        help="Máximo de nós desenhados; os filhos cortados viram um nó '+N nós' (padrão: 500; 0 desenha todos)")
+    parser.add_argument("--tree-max-depth", type=int, default=None, metavar="D",
+                        help="Profundidade máxima desenhada (padrão: sem limite)")
+
+
+def recorder_from_args(parser, args):
+    """Cria o SearchTreeRecorder pedido na linha de comando."""
+    if args.tree == "depth" and args.tree_depth is None:
+        parser.error("--tree depth exige --tree-depth")
+    if not 0.0 < args.tree_sample <= 1.0:
+        parser.error("--tree-sample deve estar entre 0 e 1")
+    if args.tree_max_nodes < 0:
+        parser.error("--tree-max-nodes não pode ser negativo")
+    if args.tree_max_depth is not None and args.tree_max_depth < 0:
+        parser.error("--tree-max-depth não pode ser negativo")
+    return SearchTreeRecorder(args.tree or "full", max_depth=args.tree_depth, sample_rate=args.tree_sample)
@@ -0,0 +1,158 @@
+"""
+Saída da árvore de busca: PNG (matplotlib, pelo draw_search_tree de cada
+script), DOT ou SVG.
+
+DOT e SVG são escritos direto dos arrays do SearchTreeRecorder, nó a nó, sem
+montar um nx.DiGraph nem uma figura do matplotlib. O SVG usa um layout em
+camadas calculado aqui (folhas lado a lado, cada pai centrado sobre os
+filhos), então não depende do Graphviz; o DOT pode ser passado ao 'dot' para
+outros formatos.
+
+Árvores grandes são cortadas por --tree-max-nodes e --tree-max-depth (ver
+SearchTreeRecorder.visible_rows); os filhos cortados de cada nó viram um nó de
+resumo "+N nós".
+"""
+import os
+from html import escape
+
+from core.palette import color_name
+from core.tree import STEP
+
+# Medidas do SVG, em pixels.
+SLOT_WIDTH = 64
+LEVEL_HEIGHT = 72
+NODE_RADIUS = 24
+MARGIN = 40
+# Caracteres do rótulo mostrados dentro do nó no SVG; o rótulo inteiro fica na dica (<title>).
+LABEL_CHARS = 10
+
+
+def _fill(tree, row):
+    return color_name(tree.color[row], "lightgray") if tree.kind[row] == STEP else "lightgray"
+
+
+def _dot_text(text):
+    return text.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def write_dot(tree, label, path, rows, hidden, title=""):
+    """Grava as linhas 'rows' da árvore (e os nós de resumo de 'hidden') em DOT."""
+    ids = tree.id
+    parents = tree.parent
+    visible = set(ids[row] for row in rows)
+    with open(path, "w", encoding="utf-8") as output:
+        output.write("digraph busca {\n")
+        if title:
+            output.write(f'  label="{_dot_text(title)}";\n  labelloc=t;\n')
+        output.write("  node [style=filled, fillcolor=lightgray, fontsize=10];\n")
+        for row in rows:
+            node_id = ids[row]
+            output.write(f'  n{node_id} [label="{_dot_text(label(tree, row))}", '
+                         f'fillcolor="{_fill(tree, row)}"];\n')
+            if parents[row] in visible:
+                output.write(f"  n{parents[row]} -> n{node_id};\n")
+            count = hidden.get(row)
+            if count:
+                output.write(f'  r{node_id} [label="+{count} nós", shape=box, style=dashed];\n'
+                             f"  n{node_id} -> r{node_id};\n")
+        output.write("}\n")
+
+
+def _layout(rows, children, hidden):
+    """
+    Posições (coluna, nível) das linhas visíveis e dos nós de resumo (chave
+    ('+', linha)), percorrendo a floresta desenhada em profundidade sem recursão.
+    """
+    visible = set(rows)
+    parent_rows = {child: row for row in rows for child in children[row]}
+    roots = [row for row in rows if parent_rows.get(row) not in visible]
+    position = {}
+    next_slot = 0
+    for root in roots:
+        stack = [(root, 0, False)]
+        while stack:
+            node, level, done = stack.pop()
+            if isinstance(node, tuple):
+                position[node] = (next_slot, level)
+                next_slot += 1
+                continue
+            drawn = [child for child in children[node] if child in visible]
+            if node in hidden:
+                drawn.append(("+", node))
+            if not drawn:
+                position[node] = (next_slot, level)
+                next_slot += 1
+            elif done:
+                first, last = position[drawn[0]][0], position[drawn[-1]][0]
+                position[node] = ((first + last) / 2, level)
+            else:
+                stack.append((node, level, True))
+                stack.extend((child, level + 1, False) for child in reversed(drawn))
+    return position, max(next_slot, 1)
+
+
+def write_svg(tree, label, path, rows, children, hidden, title=""):
+    """Grava as linhas 'rows' da árvore (e os nós de resumo de 'hidden') em SVG."""
+    position, slots = _layout(rows, children, hidden)
+    levels = 1 + max((level for _, level in position.values()), default=0)
+    width = 2 * MARGIN + slots * SLOT_WIDTH
+    height = 2 * MARGIN + levels * LEVEL_HEIGHT
+
+    def center(node):
+        slot, level = position[node]
+        return MARGIN + (slot + 0.5) * SLOT_WIDTH, MARGIN + (level + 0.5) * LEVEL_HEIGHT
+
+    visible = set(rows)
+    with open(path, "w", encoding="utf-8") as output:
+        output.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.0f}" height="{height:.0f}" '
+                     f'font-family="sans-serif" font-size="10" text-anchor="middle">\n')
+        if title:
+            output.write(f'<text x="{width / 2:.0f}" y="{MARGIN / 2:.0f}" font-size="14">{escape(title)}</text>\n')
+        # Arestas antes dos nós, para ficarem por baixo.
+        output.write('<g stroke="gray">\n')
+        for row in rows:
+            x1, y1 = center(row)
+            drawn = [child for child in children[row] if child in visible]
+            if row in hidden:
+                drawn.append(("+", row))
+            for child in drawn:
+                x2, y2 = center(child)
+                output.write(f'<line x1="{x1:.1f}" y1="{y1:.1f}" x2="{x2:.1f}" y2="{y2:.1f}"/>\n')
+        output.write("</g>\n")
+        for row in rows:
+            x, y = center(row)
+            text = label(tree, row)
+            short = text.split("\n")[0]
+            if len(short) > LABEL_CHARS:
+                short = short[:LABEL_CHARS - 1] + "…"
+            output.write(f'<g><title>{escape(text)}</title>'
+                         f'<circle cx="{x:.1f}" cy="{y:.1f}" r="{NODE_RADIUS}" fill="{_fill(tree, row)}" stroke="black"/>'
+                         f'<text x="{x:.1f}" y="{y + 3:.1f}">{escape(short)}</text></g>\n')
+        for row, count in hidden.items():
+            x, y = center(("+", row))
+            output.write(f'<g><rect x="{x - NODE_RADIUS:.1f}" y="{y - 10:.1f}" width="{2 * NODE_RADIUS}" height="20" '
+                         f'fill="white" stroke="gray" stroke-dasharray="3"/>'
+                         f'<text x="{x:.1f}" y="{y + 3:.1f}">+{count} nós</text></g>\n')
+        output.write("</svg>\n")
+
+
+def render_search_tree(tree, label, output_file, args, draw_png, title=""):
+    """
+    Grava a árvore no formato de --tree-format, com os cortes de
+    --tree-max-nodes e --tree-max-depth. 'output_file' é o nome do PNG; DOT e
+    SVG trocam só a extensão. 'draw_png(nx_tree, arquivo)' desenha o PNG.
+    Retorna (arquivo gravado, nós desenhados, nós guardados).
+    """
+    max_nodes = args.tree_max_nodes or None
+    if args.tree_format == "png":
+        nx_tree = tree.to_networkx(label, max_nodes, args.tree_max_depth)
+        draw_png(nx_tree, output_file)
+        drawn = sum(1 for node in nx_tree if not isinstance(node, str))
+        return output_file, drawn, len(tree)
+    rows, children, hidden = tree.visible_rows(max_nodes, args.tree_max_depth)
+    path = f"{os.path.splitext(output_file)[0]}.{args.tree_format}"
+    if args.tree_format == "dot":
+        write_dot(tree, label, path, rows, hidden, title)
+    else:
+        write_svg(tree, label, path, rows, children, hidden, title)
+    return path, len(rows), len(tree)
@@ -1,198 +1,286 @@
-import networkx as nx
-import matplotlib.pyplot as plt
-import sys
-
-search_tree = nx.DiGraph()
-node_counter = 0
-
-def add_tree_node(label, parent_node_id=None):
-    """
-    Adiciona um nó à árvore de busca com o rótulo 'label'. Se informado,
-    cria uma aresta do nó 'parent_node_id' para o novo nó.
-    """
-    global node_counter
-    node_id = node_counter
-    node_counter += 1
-    search_tree.add_node(node_id, label=label)
-    if parent_node_id is not None:
-        search_tree.add_edge(parent_node_id, node_id)
-    return node_id
-
-def read_graph(file_path):
-    """
-    Lê o arquivo e cria o grafo.
-    Formato esperado:
-      DIMENSION 
-      <número de vértices>
-      GRAPH
-      <vértice1> <vértice2>
-      ...
-    """
-    with open(file_path, 'r') as f:
-        lines = [line.strip() for line in f if line.strip()]
-    
-    if lines[0].upper() != "DIMENSION":
-        raise ValueError("Erro: esperava 'DIMENSION' na primeira linha.")
-    dimension = int(lines[1])
-    
-    if lines[2].upper() != "GRAPH":
-        raise ValueError("Erro: esperava 'GRAPH' após a dimensão.")
-    
-    edges = []
-    for line in lines[3:]:
-        parts = line.split()
-        if len(parts) >= 2:
-            u = int(parts[0])
-            v = int(parts[1])
-            edges.append((u, v))
-    
-    G = nx.Graph()
-    G.add_nodes_from(range(1, dimension + 1))
-    G.add_edges_from(edges)
-    return G
-
-def is_valid(G, vertex, color, assignment):
-    """
-    Verifica se é válido colorir 'vertex' com 'color', isto é, nenhum vizinho já
-    colorido possui a mesma cor.
-    """
-    for neighbor in G.neighbors(vertex):
-        if neighbor in assignment and assignment[neighbor] == color:
-            return False
-    return True
-
-def state_to_string_simple(state, vertices):
-    """
-    Converte o estado para uma string simples contendo o ID do nó e a cor
-    atribuída no último vértice (ou 'sem cor' se nenhum vértice foi colorido).
-    Cada estado é uma tupla: (assignment, index, tree_node_id)
-    """
-    assignment, index, tree_node_id = state
-    if index > 0:
-        last_vertex = vertices[index - 1]
-        last_color = assignment[last_vertex]
-        return f"ID {tree_node_id}: {last_vertex} = {last_color}"
-    else:
-        return f"ID {tree_node_id}: sem cor"
-
-def dfs(G, vertices, root_id, log_filename="dfs_log.txt"):
-    """
-    Executa a busca em profundidade para encontrar uma coloração válida.
-    Em cada iteração, grava (comentado, mas pode ser reativado) um log simples (em português)
-    com a lista de estados abertos ("Abertos") e fechados ("Fechados").
-    
-    Cada estado é representado por (assignment, index, tree_node_id).
-    """
-    open_stack = []
-    closed_states = []
-    initial_state = ({}, 0, root_id)
-    open_stack.append(initial_state)
-    iteration = 0
-
-    with open(log_filename, "w", encoding="utf-8") as log_file:
-        while open_stack:
-            log_file.write(f"Iteração {iteration}:\n")
-            log_file.write("Abertos: " + ", ".join([state_to_string_simple(s, vertices) for s in open_stack]) + "\n")
-            log_file.write("Fechados: " + ", ".join([state_to_string_simple(s, vertices) for s in closed_states]) + "\n\n")
-            iteration += 1
-
-            state = open_stack.pop()
-            assignment, index, tree_node_id = state
-
-            if index == len(vertices):
-                sol_label = "Solução: " + str(assignment)
-                add_tree_node(sol_label, tree_node_id)
-                return assignment
-
-            vertex = vertices[index]
-            for color in [1, 2, 3, 4]:
-                if is_valid(G, vertex, color, assignment):
-                    new_assignment = assignment.copy()
-                    new_assignment[vertex] = color
-                    new_index = index + 1
-                    new_label = f"{vertex} = {color}"
-                    new_tree_node_id = add_tree_node(new_label, tree_node_id)
-                    new_state = (new_assignment, new_index, new_tree_node_id)
-                    open_stack.append(new_state)
-            closed_states.append(state)
-    return None
-
-def draw_colored_graph(G, assignment, output_file="colored_graph_dfs.png"):
-    """
-    Desenha o grafo colorido usando o dicionário 'assignment' e salva a imagem.
-    """
-    color_map = {1: "red", 2: "green", 3: "blue", 4: "yellow"}
-    node_colors = [color_map[assignment[node]] if node in assignment else "gray" for node in G.nodes()]
-    
-    try:
-        pos = nx.nx_agraph.graphviz_layout(G, prog='dot', args='-Granksep=2 -Gnodesep=1')
-    except Exception as e:
-        pos = nx.spring_layout(G)
-
-    plt.figure(figsize=(8, 6))
-    nx.draw(G, pos, with_labels=True, node_color=node_colors, node_size=800, font_size=12)
-    plt.title("Grafo Colorido (DFS)")
-    plt.savefig(output_file)
-    plt.close()
-
-def draw_search_tree(tree, output_file="search_tree_dfs.png"):
-    """
-    Desenha a árvore de busca com nós preenchidos com a cor correspondente.
-    Tenta usar um layout hierárquico com Graphviz, aplicando espaçamentos personalizados;
-    caso não seja possível, utiliza um layout padrão.
-    """
-    try:
-        pos = nx.nx_agraph.graphviz_layout(tree, prog='dot', args='-Granksep=2 -Gnodesep=1')
-    except Exception as e:
-        pos = nx.spring_layout(tree)
-    
-    labels = nx.get_node_attributes(tree, 'label')
-    mapping = {"1": "red", "2": "green", "3": "blue", "4": "yellow"}
-    
-    node_colors = []
-    for n in tree.nodes():
-        label = labels.get(n, "")
-        fill_color = "lightgray"  
-        if " = " in label:
-            try:
-                parts = label.split(" = ")
-                candidate = parts[-1].strip()
-                if candidate in mapping:
-                    fill_color = mapping[candidate]
-            except Exception as ex:
-                fill_color = "lightgray"
-        node_colors.append(fill_color)
-    
-    plt.figure(figsize=(16, 12))
-    nx.draw(tree, pos, with_labels=True, labels=labels, node_color=node_colors,
-            node_size=500, font_size=10, arrows=True)
-    plt.title("Árvore de Busca (DFS) com nós coloridos")
-    plt.savefig(output_file)
-    plt.close()
-
-def main():
-    if len(sys.argv) < 2:
-        sys.exit(1)
-    
-    file_path = sys.argv[1]
-    G = read_graph(file_path)
-    vertices = list(G.nodes())
-    vertices.sort()
-    
-    root_id = add_tree_node("root")
-    solution = dfs(G, vertices, root_id, log_filename="dfs_log.txt")
-    
-    if solution:
-        print("Solução encontrada:", solution)
-    else:
-        print("Nenhuma solução encontrada.")
-    
-    draw_colored_graph(G, solution, output_file="colored_graph_dfs.png")
-    print("Grafo colorido salvo em 'colored_graph_dfs.png'.")
-    
-    draw_search_tree(search_tree, output_file="search_tree_dfs.png")
-    print("Árvore de busca salva em 'search_tree_dfs.png'.")
-    print("Log de DFS salvo em 'dfs_log.txt'.")
-
-if __name__ == '__main__':
-    main()
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from core import (SearchNode, TrailState, read_graph, LOG_MODES, open_search_log,
+                  ROOT, SOLUTION, SearchTreeRecorder, add_tree_arguments, recorder_from_args,
+                  add_palette_arguments, color_name,
+                  add_solution_arguments, solutions_from_args, symmetry_weight, write_solutions,
+                  add_metrics_arguments, metrics_from_args, timed,
+                  add_profile_arguments, profiler_from_args, profiled, render_search_tree,
+                  add_output_arguments, output_from_args, write_result)
+
+# Árvore de busca (ver core.tree); main() a troca pelo modo pedido na linha de comando.
+search_tree = SearchTreeRecorder()
+# Métricas da execução (ver core.metrics); None quando --metrics não é usado.
+metrics = None
+
+def tree_label(tree, row):
+    """Formata o rótulo de um nó da árvore de busca; só é chamada ao desenhar."""
+    kind = tree.kind[row]
+    if kind == ROOT:
+        return "root"
+    if kind == SOLUTION:
+        return "Solução: " + str(tree.assignment(row))
+    return f"{tree.vertex[row]} = {tree.color[row]}"
+
+def state_to_string_simple(state):
+    """
+    Converte o estado para uma string simples contendo o ID do nó e a cor
+    atribuída no último vértice (ou 'sem cor' se nenhum vértice foi colorido).
+    Cada estado é uma tupla: (search_node, tree_node_id)
+    """
+    node, tree_node_id = state
+    if node.depth > 0:
+        return f"ID {tree_node_id}: {node.vertex} = {node.color}"
+    else:
+        return f"ID {tree_node_id}: sem cor"
+
+def state_key(state):
+    """Identifica o estado no log delta pelo ID do nó na árvore de busca."""
+    return state[1]
+
+def dfs_leaves(G, vertices, root_id, log_filename="dfs_log.txt", log_mode="full", symmetry=False,
+               num_colors=4):
+    """
+    Busca em profundidade como gerador: devolve o SearchNode de cada coloração
+    completa e, ao ser retomada, continua a busca.
+    Em cada iteração, grava um log simples (em português) com a lista de estados
+    abertos ("Abertos") e fechados ("Fechados"). Com log_mode="delta" grava só as
+    mudanças de cada iteração (ver core.searchlog); com "off" não grava log.
+    
+    Cada estado é representado por (search_node, tree_node_id): o SearchNode guarda
+    só a última atribuição e aponta para o pai, e um único TrailState é deslocado
+    até o nó expandido para consultar as cores válidas. Com symmetry=True, cada
+    vértice só recebe cores até (maior cor usada + 1); 'num_colors' é o tamanho
+    da paleta.
+    """
+    open_stack = []
+    closed_states = []
+    root = SearchNode()
+    trail = TrailState(G, root, num_colors)
+    initial_state = (root, root_id)
+    iteration = 0
+    add_node = search_tree.add
+    first_id = search_tree.size
+    if metrics is not None:
+        metrics.instrument(trail)
+    expanded = max_frontier = max_depth = 0
+
+    try:
+        with open_search_log(log_mode, log_filename, state_to_string_simple, state_key) as log:
+            open_stack.append(initial_state)
+            log.push(initial_state)
+            while open_stack:
+                log.iteration(iteration, open_stack, closed_states)
+                iteration += 1
+
+                if len(open_stack) > max_frontier:
+                    max_frontier = len(open_stack)
+                state = open_stack.pop()
+                log.pop(state)
+                node, tree_node_id = state
+                index = node.depth
+                if index > max_depth:
+                    max_depth = index
+
+                if index == len(vertices):
+                    add_node(tree_node_id, kind=SOLUTION)
+                    yield node
+                else:
+                    trail.goto(node)
+                    vertex = vertices[index]
+                    expanded += 1
+                    for color in trail.legal_colors(vertex, symmetry):
+                        new_node = SearchNode(vertex, color, node)
+                        new_tree_node_id = add_node(tree_node_id, vertex, color)
+                        new_state = (new_node, new_tree_node_id)
+                        open_stack.append(new_state)
+                        log.push(new_state)
+                if log.keeps_closed:
+                    closed_states.append(state)
+                log.close_state(state)
+    finally:
+        # Também roda quando o gerador é fechado antes do fim (ver dfs).
+        if metrics is not None:
+            metrics.record(generated=search_tree.size - first_id, expanded=expanded,
+                           max_frontier=max_frontier, max_depth=max_depth)
+
+def dfs(G, vertices, root_id, log_filename="dfs_log.txt", log_mode="full", symmetry=False,
+        num_colors=4):
+    """
+    Executa a busca em profundidade (ver dfs_leaves) até a primeira coloração
+    válida e a retorna, ou None se não houver.
+    """
+    leaves = dfs_leaves(G, vertices, root_id, log_filename, log_mode, symmetry, num_colors)
+    try:
+        node = next(leaves, None)
+    finally:
+        leaves.close()
+    return node.assignment() if node is not None else None
+
+def dfs_solutions(G, vertices, root_id, log_filename="dfs_log.txt", log_mode="full", symmetry=False,
+                  num_colors=4):
+    """Gera, uma de cada vez, todas as colorações válidas como dicionários."""
+    for node in dfs_leaves(G, vertices, root_id, log_filename, log_mode, symmetry, num_colors):
+        yield node.assignment()
+
+def dfs_count(G, vertices, root_id, log_filename="dfs_log.txt", log_mode="full", symmetry=False,
+              num_colors=4):
+    """
+    Conta as colorações válidas sem montá-las. Com 'symmetry', cada coloração
+    gerada vale pelas k! / (k - m)! que diferem dela por uma troca de cores.
+    """
+    total = 0
+    for node in dfs_leaves(G, vertices, root_id, log_filename, log_mode, symmetry, num_colors):
+        if symmetry:
+            used = 0
+            while node.parent is not None:
+                used = max(used, node.color)
+                node = node.parent
+            total += symmetry_weight(num_colors, used)
+        else:
+            total += 1
+    return total
+
+def draw_colored_graph(G, assignment, output_file="colored_graph_dfs.png"):
+    """
+    Desenha o grafo colorido usando o dicionário 'assignment' e salva a imagem.
+    """
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
+    G = G.to_networkx()
+    node_colors = [color_name(assignment.get(node)) for node in G.nodes()]
+    
+    try:
+        pos = nx.nx_agraph.graphviz_layout(G, prog='dot', args='-Granksep=2 -Gnodesep=1')
+    except Exception as e:
+        pos = nx.spring_layout(G)
+
+    plt.figure(figsize=(8, 6))
+    nx.draw(G, pos, with_labels=True, node_color=node_colors, node_size=800, font_size=12)
+    plt.title("Grafo Colorido (DFS)")
+    plt.savefig(output_file)
+    plt.close()
+
+def draw_search_tree(tree, output_file="search_tree_dfs.png"):
+    """
+    Desenha a árvore de busca com nós preenchidos com a cor correspondente.
+    Tenta usar um layout hierárquico com Graphviz, aplicando espaçamentos personalizados;
+    caso não seja possível, utiliza um layout padrão.
+    """
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
+    try:
+        pos = nx.nx_agraph.graphviz_layout(tree, prog='dot', args='-Granksep=2 -Gnodesep=1')
+    except Exception as e:
+        pos = nx.spring_layout(tree)
+    
+    labels = nx.get_node_attributes(tree, 'label')
+    node_colors = []
+    for n in tree.nodes():
+        label = labels.get(n, "")
+        fill_color = "lightgray"  
+        if " = " in label:
+            try:
+                parts = label.split(" = ")
+                fill_color = color_name(parts[-1].strip(), "lightgray")
+            except Exception as ex:
+                fill_color = "lightgray"
+        node_colors.append(fill_color)
+    
+    plt.figure(figsize=(16, 12))
+    nx.draw(tree, pos, with_labels=True, labels=labels, node_color=node_colors,
+            node_size=500, font_size=10, arrows=True)
+    plt.title("Árvore de Busca (DFS) com nós coloridos")
+    plt.savefig(output_file)
+    plt.close()
+
+def main():
+    global search_tree, metrics
+    parser = argparse.ArgumentParser(description="Coloração de grafos por busca em profundidade")
+    parser.add_argument("file_path", help="Caminho do arquivo de entrada")
+    parser.add_argument("--log-mode", choices=LOG_MODES, default=None,
+                        help="Log de abertos/fechados: completo, só mudanças ou desligado "
+                             "(padrão: full; off com --all e --count)")
+    parser.add_argument("--symmetry", action="store_true",
+                        help="Quebra a simetria de cores: cada vértice só recebe cores até (maior cor usada + 1)")
+    add_palette_arguments(parser)
+    add_solution_arguments(parser)
+    add_tree_arguments(parser)
+    add_metrics_arguments(parser)
+    add_profile_arguments(parser)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+    enumerate_all = solutions_from_args(args)
+    if args.log_mode is None:
+        args.log_mode = "full"
+    stdout = output_from_args(args)
+    search_tree = recorder_from_args(parser, args)
+    metrics = metrics_from_args(parser, args)
+    profiler = profiler_from_args(parser, args)
+    
+    with timed(metrics, "parse"):
+        G = read_graph(args.file_path)
+    vertices = list(G.nodes())
+    vertices.sort()
+    
+    root_id = search_tree.add(kind=ROOT)
+    options = dict(log_filename="dfs_log.txt", log_mode=args.log_mode, symmetry=args.symmetry,
+                   num_colors=args.colors)
+    start = time.perf_counter()
+    solution = total = None
+    if args.count:
+        with timed(metrics, "search"), profiled(profiler, "search"):
+            total = dfs_count(G, vertices, root_id, **options)
+        seconds = time.perf_counter() - start
+        print("Número de colorações válidas:", total)
+    elif args.all is not None:
+        with timed(metrics, "search"), profiled(profiler, "search"):
+            total = write_solutions(args.all, vertices, dfs_solutions(G, vertices, root_id, **options))
+        seconds = time.perf_counter() - start
+        print(f"{total} colorações gravadas em '{args.all}'.")
+    else:
+        with timed(metrics, "search"), profiled(profiler, "search"):
+            solution = dfs(G, vertices, root_id, **options)
+        seconds = time.perf_counter() - start
+        
+        if solution:
+            print("Solução encontrada:", solution)
+        else:
+            print("Nenhuma solução encontrada.")
+        
+        if not args.no_draw:
+            with timed(metrics, "render"):
+                draw_colored_graph(G, solution or {}, output_file="colored_graph_dfs.png")
+            print("Grafo colorido salvo em 'colored_graph_dfs.png'.")
+    
+    if search_tree.mode != "off" and not args.no_draw and not enumerate_all:
+        with timed(metrics, "render"):
+            path, drawn, stored = render_search_tree(search_tree, tree_label, "search_tree_dfs.png", args,
+                                                     lambda tree, path: draw_search_tree(tree, output_file=path),
+                                                     "Árvore de Busca (DFS)")
+        print(f"Árvore de busca salva em '{path}' ({drawn} de {stored} nós).")
+    if args.tree_export:
+        search_tree.save(args.tree_export)
+        print(f"Árvore de busca exportada para '{args.tree_export}'.")
+    if args.log_mode != "off":
+        print("Log de DFS salvo em 'dfs_log.txt'.")
+    if metrics is not None:
+        metrics.save(args.metrics)
+        print(f"Métricas salvas em '{args.metrics}'.")
+    if profiler is not None:
+        summary = profiler.save()
+        print(f"Perfil salvo em '{args.profile}' (resumo em '{summary}').")
+    if total is None:
+        write_result(args, stdout, "dfs", solution, search_tree.size, seconds)
+    else:
+        write_result(args, stdout, "dfs", None, search_tree.size, seconds, status="enumeração", total=total)
+
+if __name__ == '__main__':
+    main()
@@ -1,80 +1,29 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+import os
 import sys
+import time
+import argparse
 
-# Árvore de busca para visualização
-search_tree = nx.DiGraph()
-node_counter = 0
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
 
-def add_tree_node(label, parent_node_id=None):
-    """
-    Adiciona um nó à árvore de busca com o rótulo 'label'.
-    Se 'parent_node_id' for informado, cria uma aresta do pai para o novo nó.
-    Retorna o ID do nó criado.
-    """
-    global node_counter
-    node_id = node_counter
-    node_counter += 1
-    search_tree.add_node(node_id, label=label)
-    if parent_node_id is not None:
-        search_tree.add_edge(parent_node_id, node_id)
-    return node_id
+from core import (ColorState, read_graph,
+                  ROOT, SOLUTION, SearchTreeRecorder, add_tree_arguments, recorder_from_args,
+                  add_palette_arguments, color_name, add_metrics_arguments, metrics_from_args, timed,
+                  add_profile_arguments, profiler_from_args, profiled, render_search_tree,
+                  add_output_arguments, output_from_args, write_result)
 
-def read_graph(file_path):
-    """
-    Lê o arquivo e cria o grafo.
-    Formato esperado:
-      DIMENSION 
-      <número de vértices>
-      GRAPH
-      <vértice1> <vértice2> <custo>
-      ...
-    """
-    with open(file_path, 'r') as f:
-        lines = [line.strip() for line in f if line.strip()]
-    
-    if lines[0].upper() != "DIMENSION":
-        raise ValueError("Erro: esperava 'DIMENSION' na primeira linha.")
-    dimension = int(lines[1])
-    
-    if lines[2].upper() != "GRAPH":
-        raise ValueError("Erro: esperava 'GRAPH' após a dimensão.")
-    
-    edges = []
-    for line in lines[3:]:
-        parts = line.split()
-        if len(parts) >= 3:
-            u = int(parts[0])
-            v = int(parts[1])
-            cost = float(parts[2])
-            edges.append((u, v, cost))
-    
-    # Cria um grafo não direcionado
-    G = nx.Graph()
-    G.add_nodes_from(range(1, dimension + 1))
-    G.add_weighted_edges_from(edges)
-    return G
+# Árvore de busca (ver core.tree); main() a troca pelo modo pedido na linha de comando.
+search_tree = SearchTreeRecorder()
+# Métricas da execução (ver core.metrics); None quando --metrics não é usado.
+metrics = None
 
-def is_valid(G, vertex, color, assignment):
-    """
-    Verifica se é válido colorir 'vertex' com 'color',
-    isto é, nenhum vizinho já colorido possui a mesma cor.
-    """
-    for neighbor in G.neighbors(vertex):
-        if neighbor in assignment and assignment[neighbor] == color:
-            return False
-    return True
-
-def cost_for_vertex(G, vertex, assignment):
-    """
-    Calcula o custo de colorir 'vertex' dado que alguns vizinhos já foram coloridos.
-    O custo é a soma dos pesos das arestas que ligam 'vertex' a cada vizinho já colorido.
-    """
-    custo = 0
-    for neighbor in G.neighbors(vertex):
-        if neighbor in assignment:
-            custo += G[vertex][neighbor]["weight"]
-    return custo
+def tree_label(tree, row):
+    """Formata o rótulo de um nó da árvore de busca; só é chamada ao desenhar."""
+    kind = tree.kind[row]
+    if kind == ROOT:
+        return "root"
+    if kind == SOLUTION:
+        return f"Solução: {tree.assignment(row)}, Custo Total: {tree.g[row]}"
+    return f"{tree.vertex[row]}={tree.color[row]}"
 
 def state_to_string(state):
     """
@@ -83,79 +32,88 @@ def state_to_string(state):
     vertex, color, cost = state
     return f"(v={vertex}, cor={color}, custo_add={cost})"
 
-def greedy_search(G, vertices, root_id, log_filename="greedy_log.txt"):
+def greedy_search(G, vertices, root_id, log_filename="greedy_log.txt", symmetry=False,
+                  num_colors=4):
     """
     Executa a busca gulosa para encontrar uma coloração válida.
     Em cada passo, gera-se uma lista de 'abertos' (todas as cores válidas para o vértice),
     escolhe-se aquela com menor custo adicional e move-se para 'fechados'.
     
     Cada estado aqui é representado como (vertex, color, custo_adicional).
+    Com symmetry=True, cada vértice só recebe cores até (maior cor usada + 1).
+    'num_colors' é o tamanho da paleta.
     """
-    assignment = {}
+    state = ColorState(G, num_colors)
     current_cost = 0
     current_tree_node_id = root_id
+    first_id = search_tree.size
+    if metrics is not None:
+        metrics.instrument(state)
+    expanded = max_frontier = max_depth = 0
     
-    with open(log_filename, "w", encoding="utf-8") as log_file:
-        for index, vertex in enumerate(vertices):
-            log_file.write(f"\n=== Iteração para vértice {vertex} ===\n")
+    try:
+        with open(log_filename, "w", encoding="utf-8") as log_file:
+            for index, vertex in enumerate(vertices):
+                log_file.write(f"\n=== Iteração para vértice {vertex} ===\n")
             
-            # Lista de estados abertos: (vertex, color, custo_adicional)
-            abertos = []
+                # Lista de estados abertos: (vertex, color, custo_adicional)
+                abertos = []
+                expanded += 1
             
-            # Gera todas as cores válidas para este vértice
-            for color in [1, 2, 3, 4]:
-                if is_valid(G, vertex, color, assignment):
-                    # Cria um "estado" para log
-                    new_assignment = assignment.copy()
-                    new_assignment[vertex] = color
-                    additional_cost = cost_for_vertex(G, vertex, new_assignment)
+                # Gera todas as cores válidas para este vértice; o custo adicional
+                # não depende da cor, só dos vizinhos já coloridos
+                additional_cost = state.cost_for_vertex(vertex)
+                for color in state.legal_colors(vertex, symmetry):
                     abertos.append((vertex, color, additional_cost))
+                max_frontier = max(max_frontier, len(abertos))
             
-            # Log dos abertos
-            if abertos:
-                log_file.write("Abertos: " + ", ".join(state_to_string(s) for s in abertos) + "\n")
-            else:
-                log_file.write("Abertos: (nenhum estado válido)\n")
-                log_file.write(f"Falha ao colorir o vértice {vertex}. Sem cores válidas.\n")
-                return None
+                # Log dos abertos
+                if abertos:
+                    log_file.write("Abertos: " + ", ".join(state_to_string(s) for s in abertos) + "\n")
+                else:
+                    log_file.write("Abertos: (nenhum estado válido)\n")
+                    log_file.write(f"Falha ao colorir o vértice {vertex}. Sem cores válidas.\n")
+                    return None
             
-            # Escolhe a cor com menor custo adicional (abordagem gulosa)
-            chosen_state = min(abertos, key=lambda x: x[2])  # x[2] é o custo_add
-            (chosen_vertex, chosen_color, chosen_add_cost) = chosen_state
+                # Escolhe a cor com menor custo adicional (abordagem gulosa)
+                chosen_state = min(abertos, key=lambda x: x[2])  # x[2] é o custo_add
+                (chosen_vertex, chosen_color, chosen_add_cost) = chosen_state
             
-            # Lista de fechados (neste caso, só o estado escolhido)
-            fechados = [chosen_state]
-            log_file.write("Fechados (escolhido): " + ", ".join(state_to_string(s) for s in fechados) + "\n")
+                # Lista de fechados (neste caso, só o estado escolhido)
+                fechados = [chosen_state]
+                log_file.write("Fechados (escolhido): " + ", ".join(state_to_string(s) for s in fechados) + "\n")
             
-            # Aplica a cor escolhida
-            assignment[chosen_vertex] = chosen_color
-            current_cost += chosen_add_cost
+                # Aplica a cor escolhida
+                state.assign(chosen_vertex, chosen_color)
+                current_cost += chosen_add_cost
+                max_depth = index + 1
             
-            # Atualiza a árvore de busca
-            new_label = f"{chosen_vertex}={chosen_color}"
-            current_tree_node_id = add_tree_node(new_label, current_tree_node_id)
+                # Atualiza a árvore de busca
+                current_tree_node_id = search_tree.add(current_tree_node_id, chosen_vertex, chosen_color, current_cost)
             
-            log_file.write(f"Cor escolhida para vértice {vertex} = {chosen_color}, custo adicional = {chosen_add_cost}\n")
-            log_file.write(f"Custo acumulado até agora: {current_cost}\n")
+                log_file.write(f"Cor escolhida para vértice {vertex} = {chosen_color}, custo adicional = {chosen_add_cost}\n")
+                log_file.write(f"Custo acumulado até agora: {current_cost}\n")
     
-    # Ao final, criamos um nó na árvore com a solução
-    sol_label = f"Solução: {assignment}, Custo Total: {current_cost}"
-    add_tree_node(sol_label, current_tree_node_id)
+        # Ao final, criamos um nó na árvore com a solução
+        assignment = state.assignment(vertices)
+        search_tree.add(current_tree_node_id, g=current_cost, kind=SOLUTION)
     
-    return (assignment, len(vertices), current_tree_node_id, current_cost)
+        return (assignment, len(vertices), current_tree_node_id, current_cost)
+    finally:
+        if metrics is not None:
+            metrics.record(generated=search_tree.size - first_id, expanded=expanded,
+                           max_frontier=max_frontier, max_depth=max_depth)
 
 def draw_colored_graph(G, assignment, output_file="colored_graph_greedy.png"):
     """
     Desenha o grafo colorido de acordo com o dicionário 'assignment'.
-    As cores são: 1->red, 2->green, 3->blue, 4->yellow.
+    As cores são: 1->red, 2->green, 3->blue, 4->yellow, ... (ver core.palette).
     """
-    color_map = {1: "red", 2: "green", 3: "blue", 4: "yellow"}
-    node_colors = []
-    for node in G.nodes():
-        if node in assignment:
-            node_colors.append(color_map.get(assignment[node], "gray"))
-        else:
-            node_colors.append("gray")
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
+    G = G.to_networkx()
+    node_colors = [color_name(assignment.get(node)) for node in G.nodes()]
     try:
         pos = nx.nx_agraph.graphviz_layout(G, prog='dot', args='-Granksep=2 -Gnodesep=1')
     except Exception:
@@ -171,13 +129,15 @@ def draw_search_tree(tree, output_file="search_tree_greedy.png"):
     Desenha a árvore de busca com os nós coloridos.
     Cada nó da árvore apresenta o rótulo no formato "v=c" (ex.: "3=blue") quando possível.
     """
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
     try:
         pos = nx.nx_agraph.graphviz_layout(tree, prog='dot', args='-Granksep=2 -Gnodesep=1')
     except Exception:
         pos = nx.spring_layout(tree)
     
     labels = nx.get_node_attributes(tree, 'label')
-    color_map = {"1": "red", "2": "green", "3": "blue", "4": "yellow"}
     node_colors = []
     for n in tree.nodes():
         label = labels.get(n, "")
@@ -185,7 +145,7 @@ def draw_search_tree(tree, output_file="search_tree_greedy.png"):
             parts = label.split("=")
             if len(parts) == 2:
                 c = parts[1].strip()
-                node_colors.append(color_map.get(c, "lightgray"))
+                node_colors.append(color_name(c, "lightgray"))
             else:
                 node_colors.append("lightgray")
         else:
@@ -199,28 +159,62 @@ def draw_search_tree(tree, output_file="search_tree_greedy.png"):
     plt.close()
 
 def main():
-    if len(sys.argv) < 2:
-        sys.exit("Uso: python main.py <arquivo_grafo>")
+    global search_tree, metrics
+    parser = argparse.ArgumentParser(description="Coloração de grafos por busca gulosa")
+    parser.add_argument("file_path", help="Caminho do arquivo de entrada")
+    parser.add_argument("--symmetry", action="store_true",
+                        help="Quebra a simetria de cores: cada vértice só recebe cores até (maior cor usada + 1)")
+    add_palette_arguments(parser)
+    add_tree_arguments(parser)
+    add_metrics_arguments(parser)
+    add_profile_arguments(parser)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+    stdout = output_from_args(args)
+    search_tree = recorder_from_args(parser, args)
+    metrics = metrics_from_args(parser, args)
+    profiler = profiler_from_args(parser, args)
     
-    file_path = sys.argv[1]
-    G = read_graph(file_path)
+    with timed(metrics, "parse"):
+        G = read_graph(args.file_path, weighted=True)
     vertices = list(G.nodes())
     vertices.sort()  # Ordena os vértices (por exemplo, 1, 2, 3, ...)
     
-    root_id = add_tree_node("root")
-    solution = greedy_search(G, vertices, root_id, log_filename="greedy_log.txt")
+    root_id = search_tree.add(kind=ROOT)
+    start = time.perf_counter()
+    with timed(metrics, "search"), profiled(profiler, "search"):
+        solution = greedy_search(G, vertices, root_id, log_filename="greedy_log.txt", symmetry=args.symmetry,
+                                 num_colors=args.colors)
+    seconds = time.perf_counter() - start
     
     if solution:
         assignment, index, tree_node_id, total_cost = solution
         print("Solução encontrada:", assignment, "Custo Total:", total_cost)
-        draw_colored_graph(G, assignment, output_file="colored_graph_greedy.png")
-        print("Grafo colorido salvo em 'colored_graph_greedy.png'.")
+        if not args.no_draw:
+            with timed(metrics, "render"):
+                draw_colored_graph(G, assignment, output_file="colored_graph_greedy.png")
+            print("Grafo colorido salvo em 'colored_graph_greedy.png'.")
     else:
         print("Nenhuma solução encontrada.")
     
-    draw_search_tree(search_tree, output_file="search_tree_greedy.png")
-    print("Árvore de busca salva em 'search_tree_greedy.png'.")
+    if search_tree.mode != "off" and not args.no_draw:
+        with timed(metrics, "render"):
+            path, drawn, stored = render_search_tree(search_tree, tree_label, "search_tree_greedy.png", args,
+                                                     lambda tree, path: draw_search_tree(tree, output_file=path),
+                                                     "Árvore de Busca Gulosa")
+        print(f"Árvore de busca salva em '{path}' ({drawn} de {stored} nós).")
+    if args.tree_export:
+        search_tree.save(args.tree_export)
+        print(f"Árvore de busca exportada para '{args.tree_export}'.")
     print("Log de Busca Gulosa salvo em 'greedy_log.txt'.")
+    if metrics is not None:
+        metrics.save(args.metrics)
+        print(f"Métricas salvas em '{args.metrics}'.")
+    if profiler is not None:
+        summary = profiler.save()
+        print(f"Perfil salvo em '{args.profile}' (resumo em '{summary}').")
+    write_result(args, stdout, "greedy", solution[0] if solution else None, search_tree.size, seconds,
+                 custo=solution[-1] if solution else None)
 
 if __name__ == '__main__':
     main()
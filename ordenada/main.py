@@ -1,156 +1,131 @@
-import networkx as nx
-import matplotlib.pyplot as plt
+import os
 import sys
+import time
 import heapq
+import argparse
 
-# Árvore de busca para visualização
-search_tree = nx.DiGraph()
-node_counter = 0
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
 
-def add_tree_node(label, parent_node_id=None):
-    """
-    Adiciona um nó à árvore de busca com o rótulo 'label'.
-    Se 'parent_node_id' for informado, cria uma aresta do pai para o novo nó.
-    Retorna o ID do nó criado.
-    """
-    global node_counter
-    node_id = node_counter
-    node_counter += 1
-    search_tree.add_node(node_id, label=label)
-    if parent_node_id is not None:
-        search_tree.add_edge(parent_node_id, node_id)
-    return node_id
-
-def read_graph(file_path):
-    """
-    Lê o arquivo e cria o grafo.
-    Formato esperado:
-      DIMENSION 
-      <número de vértices>
-      GRAPH
-      <vértice1> <vértice2> <custo>
-      ...
-    """
-    with open(file_path, 'r') as f:
-        lines = [line.strip() for line in f if line.strip()]
-    
-    if lines[0].upper() != "DIMENSION":
-        raise ValueError("Erro: esperava 'DIMENSION' na primeira linha.")
-    dimension = int(lines[1])
-    
-    if lines[2].upper() != "GRAPH":
-        raise ValueError("Erro: esperava 'GRAPH' após a dimensão.")
-    
-    edges = []
-    for line in lines[3:]:
-        parts = line.split()
-        if len(parts) >= 3:
-            u = int(parts[0])
-            v = int(parts[1])
-            cost = float(parts[2])
-            edges.append((u, v, cost))
-    
-    # Cria um grafo não direcionado
-    G = nx.Graph()
-    G.add_nodes_from(range(1, dimension + 1))
-    G.add_weighted_edges_from(edges)
-    return G
+from core import (SearchNode, TrailState, read_graph, LOG_MODES, open_search_log,
+                  ROOT, SOLUTION, SearchTreeRecorder, add_tree_arguments, recorder_from_args,
+                  add_palette_arguments, color_name, add_metrics_arguments, metrics_from_args, timed,
+                  add_profile_arguments, profiler_from_args, profiled, render_search_tree,
+                  add_output_arguments, output_from_args, write_result)
 
-def is_valid(G, vertex, color, assignment):
-    """
-    Verifica se é válido colorir 'vertex' com 'color',
-    isto é, nenhum vizinho já colorido possui a mesma cor.
-    """
-    for neighbor in G.neighbors(vertex):
-        if neighbor in assignment and assignment[neighbor] == color:
-            return False
-    return True
+# Árvore de busca (ver core.tree); main() a troca pelo modo pedido na linha de comando.
+search_tree = SearchTreeRecorder()
+# Métricas da execução (ver core.metrics); None quando --metrics não é usado.
+metrics = None
 
-def cost_for_vertex(G, vertex, assignment):
-    """
-    Calcula o custo de colorir 'vertex' dado que alguns vizinhos já foram coloridos.
-    O custo é a soma dos pesos das arestas que ligam 'vertex' a cada vizinho já colorido.
-    """
-    custo = 0
-    for neighbor in G.neighbors(vertex):
-        if neighbor in assignment:
-            custo += G[vertex][neighbor]["weight"]
-    return custo
+def tree_label(tree, row):
+    """Formata o rótulo de um nó da árvore de busca; só é chamada ao desenhar."""
+    kind = tree.kind[row]
+    if kind == ROOT:
+        return "root"
+    if kind == SOLUTION:
+        return f"Solução: {tree.assignment(row)}, Custo Total: {tree.g[row]}"
+    return f"{tree.vertex[row]}={tree.color[row]}"
 
-def state_to_string(state, vertices):
+def state_to_string(state):
     """
     Converte um estado para string, exibindo:
       - O ID do nó da árvore,
       - O último vértice colorido (com sua cor),
       - O custo acumulado.
     """
-    assignment, index, tree_node_id, custo = state
-    if index > 0:
-        last_vertex = vertices[index - 1]
-        last_color = assignment.get(last_vertex, None)
-        return f"ID {tree_node_id}: {last_vertex}={last_color}, Custo={custo}"
+    node, tree_node_id, custo = state
+    if node.depth > 0:
+        return f"ID {tree_node_id}: {node.vertex}={node.color}, Custo={custo}"
     else:
         return f"ID {tree_node_id}: Início, Custo={custo}"
 
-def ordered_search(G, vertices, root_id, log_filename="ordered_log.txt"):
+def state_key(state):
+    """Identifica o estado no log delta pelo ID do nó na árvore de busca."""
+    return state[1]
+
+def ordered_search(G, vertices, root_id, log_filename="ordered_log.txt", log_mode="full",
+                   symmetry=False, num_colors=4):
     """
     Executa a busca ordenada (com custo) para encontrar uma coloração válida.
-    Cada estado é uma tupla: (assignment, index, tree_node_id, custo).
-    Registra os estados abertos e fechados (com custo acumulado) em um arquivo de log.
-    Retorna o estado solução ou None se não encontrar solução.
+    Cada estado é uma tupla: (search_node, tree_node_id, custo), em que o SearchNode
+    guarda só a última atribuição e aponta para o pai.
+    Registra os estados abertos e fechados (com custo acumulado) em um arquivo de log,
+    completo ou só com as mudanças de cada iteração, conforme 'log_mode'.
+    Com symmetry=True, cada vértice só recebe cores até (maior cor usada + 1).
+    'num_colors' é o tamanho da paleta.
+    Retorna (assignment, index, tree_node_id, custo) da solução ou None se não
+    encontrar solução.
     """
     open_list = []
     closed_states = []
     # Para evitar problemas de comparação, usamos um contador de estados como desempate.
     state_counter = 0
-    initial_state = ({}, 0, root_id, 0)  # assignment vazio, sem vértices coloridos, custo 0
+    root = SearchNode()
+    trail = TrailState(G, root, num_colors)
+    initial_state = (root, root_id, 0)  # nenhum vértice colorido, custo 0
     heapq.heappush(open_list, (0, state_counter, initial_state))
     state_counter += 1
     iteration = 0
+    add_node = search_tree.add
+    first_id = search_tree.size
+    if metrics is not None:
+        metrics.instrument(trail)
+    expanded = pops = max_frontier = max_depth = 0
+
+    try:
+        with open_search_log(log_mode, log_filename, state_to_string, state_key) as log:
+            log.push(initial_state)
+            while open_list:
+                log.iteration(iteration, (s for _, _, s in open_list), closed_states)
+                iteration += 1
+
+                if len(open_list) > max_frontier:
+                    max_frontier = len(open_list)
+                _, _, state = heapq.heappop(open_list)
+                pops += 1
+                log.pop(state)
+                node, tree_node_id, current_cost = state
+                index = node.depth
+                if index > max_depth:
+                    max_depth = index
 
-    with open(log_filename, "w", encoding="utf-8") as log_file:
-        while open_list:
-            log_file.write(f"Iteração {iteration}:\n")
-            log_file.write("Abertos: " + ", ".join([state_to_string(s, vertices) for _, _, s in open_list]) + "\n")
-            log_file.write("Fechados: " + ", ".join([state_to_string(s, vertices) for s in closed_states]) + "\n\n")
-            iteration += 1
-
-            _, _, state = heapq.heappop(open_list)
-            assignment, index, tree_node_id, current_cost = state
-
-            if index == len(vertices):
-                sol_label = f"Solução: {assignment}, Custo Total: {current_cost}"
-                add_tree_node(sol_label, tree_node_id)
-                return state
-
-            vertex = vertices[index]
-            for color in [1, 2, 3, 4]:
-                if is_valid(G, vertex, color, assignment):
-                    new_assignment = assignment.copy()
-                    new_assignment[vertex] = color
-                    additional_cost = cost_for_vertex(G, vertex, new_assignment)
-                    new_cost = current_cost + additional_cost
-                    new_index = index + 1
-                    new_label = f"{vertex}={color}"
-                    new_tree_node_id = add_tree_node(new_label, tree_node_id)
-                    new_state = (new_assignment, new_index, new_tree_node_id, new_cost)
+                if index == len(vertices):
+                    assignment = node.assignment()
+                    add_node(tree_node_id, g=current_cost, kind=SOLUTION)
+                    return (assignment, index, tree_node_id, current_cost)
+
+                trail.goto(node)
+                vertex = vertices[index]
+                expanded += 1
+                additional_cost = trail.cost_for_vertex(vertex)
+                new_cost = current_cost + additional_cost
+                for color in trail.legal_colors(vertex, symmetry):
+                    new_node = SearchNode(vertex, color, node)
+                    new_tree_node_id = add_node(tree_node_id, vertex, color, new_cost)
+                    new_state = (new_node, new_tree_node_id, new_cost)
                     heapq.heappush(open_list, (new_cost, state_counter, new_state))
                     state_counter += 1
-            closed_states.append(state)
+                    log.push(new_state)
+                if log.keeps_closed:
+                    closed_states.append(state)
+                log.close_state(state)
+    finally:
+        if metrics is not None:
+            metrics.record(generated=search_tree.size - first_id, expanded=expanded,
+                           heap_pushes=state_counter, heap_pops=pops,
+                           max_frontier=max_frontier, max_depth=max_depth)
     return None
 
 def draw_colored_graph(G, assignment, output_file="colored_graph_ordered.png"):
     """
     Desenha o grafo colorido de acordo com o dicionário 'assignment'.
-    As cores são: 1->red, 2->green, 3->blue, 4->yellow.
+    As cores são: 1->red, 2->green, 3->blue, 4->yellow, ... (ver core.palette).
     """
-    color_map = {1: "red", 2: "green", 3: "blue", 4: "yellow"}
-    node_colors = []
-    for node in G.nodes():
-        if node in assignment:
-            node_colors.append(color_map.get(assignment[node], "gray"))
-        else:
-            node_colors.append("gray")
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
+    G = G.to_networkx()
+    node_colors = [color_name(assignment.get(node)) for node in G.nodes()]
     try:
         pos = nx.nx_agraph.graphviz_layout(G, prog='dot', args='-Granksep=2 -Gnodesep=1')
     except Exception:
@@ -166,13 +141,15 @@ def draw_search_tree(tree, output_file="search_tree_ordered.png"):
     Desenha a árvore de busca com os nós coloridos.
     Cada nó da árvore apresenta o rótulo no formato "v=c" (ex.: "3=blue") quando possível.
     """
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
     try:
         pos = nx.nx_agraph.graphviz_layout(tree, prog='dot', args='-Granksep=2 -Gnodesep=1')
     except Exception:
         pos = nx.spring_layout(tree)
     
     labels = nx.get_node_attributes(tree, 'label')
-    color_map = {"1": "red", "2": "green", "3": "blue", "4": "yellow"}
     node_colors = []
     for n in tree.nodes():
         label = labels.get(n, "")
@@ -181,7 +158,7 @@ def draw_search_tree(tree, output_file="search_tree_ordered.png"):
             parts = label.split("=")
             if len(parts) == 2:
                 c = parts[1].strip()
-                node_colors.append(color_map.get(c, "lightgray"))
+                node_colors.append(color_name(c, "lightgray"))
             else:
                 node_colors.append("lightgray")
         else:
@@ -195,28 +172,66 @@ def draw_search_tree(tree, output_file="search_tree_ordered.png"):
     plt.close()
 
 def main():
-    if len(sys.argv) < 2:
-        sys.exit("Uso: python main.py <arquivo_grafo>")
+    global search_tree, metrics
+    parser = argparse.ArgumentParser(description="Coloração de grafos por busca ordenada com custo")
+    parser.add_argument("file_path", help="Caminho do arquivo de entrada")
+    parser.add_argument("--log-mode", choices=LOG_MODES, default="full",
+                        help="Log de abertos/fechados: completo, só mudanças ou desligado (padrão: full)")
+    parser.add_argument("--symmetry", action="store_true",
+                        help="Quebra a simetria de cores: cada vértice só recebe cores até (maior cor usada + 1)")
+    add_palette_arguments(parser)
+    add_tree_arguments(parser)
+    add_metrics_arguments(parser)
+    add_profile_arguments(parser)
+    add_output_arguments(parser)
+    args = parser.parse_args()
+    stdout = output_from_args(args)
+    search_tree = recorder_from_args(parser, args)
+    metrics = metrics_from_args(parser, args)
+    profiler = profiler_from_args(parser, args)
     
-    file_path = sys.argv[1]
-    G = read_graph(file_path)
+    with timed(metrics, "parse"):
+        G = read_graph(args.file_path, weighted=True)
     vertices = list(G.nodes())
     vertices.sort()  # Ordena os vértices (por exemplo, 1, 2, 3, ...)
     
-    root_id = add_tree_node("root")
-    solution = ordered_search(G, vertices, root_id, log_filename="ordered_log.txt")
+    root_id = search_tree.add(kind=ROOT)
+    start = time.perf_counter()
+    with timed(metrics, "search"), profiled(profiler, "search"):
+        solution = ordered_search(G, vertices, root_id, log_filename="ordered_log.txt",
+                                  log_mode=args.log_mode, symmetry=args.symmetry,
+                                  num_colors=args.colors)
+    seconds = time.perf_counter() - start
     
     if solution:
         assignment, index, tree_node_id, total_cost = solution
         print("Solução encontrada:", assignment, "Custo Total:", total_cost)
-        draw_colored_graph(G, assignment, output_file="colored_graph_ordered.png")
-        print("Grafo colorido salvo em 'colored_graph_ordered.png'.")
+        if not args.no_draw:
+            with timed(metrics, "render"):
+                draw_colored_graph(G, assignment, output_file="colored_graph_ordered.png")
+            print("Grafo colorido salvo em 'colored_graph_ordered.png'.")
     else:
         print("Nenhuma solução encontrada.")
     
-    draw_search_tree(search_tree, output_file="search_tree_ordered.png")
-    print("Árvore de busca salva em 'search_tree_ordered.png'.")
-    print("Log de Busca Ordenada com Custo salvo em 'ordered_log.txt'.")
+    if search_tree.mode != "off" and not args.no_draw:
+        with timed(metrics, "render"):
+            path, drawn, stored = render_search_tree(search_tree, tree_label, "search_tree_ordered.png", args,
+                                                     lambda tree, path: draw_search_tree(tree, output_file=path),
+                                                     "Árvore de Busca Ordenada com Custo")
+        print(f"Árvore de busca salva em '{path}' ({drawn} de {stored} nós).")
+    if args.tree_export:
+        search_tree.save(args.tree_export)
+        print(f"Árvore de busca exportada para '{args.tree_export}'.")
+    if args.log_mode != "off":
+        print("Log de Busca Ordenada com Custo salvo em 'ordered_log.txt'.")
+    if metrics is not None:
+        metrics.save(args.metrics)
+        print(f"Métricas salvas em '{args.metrics}'.")
+    if profiler is not None:
+        summary = profiler.save()
+        print(f"Perfil salvo em '{args.profile}' (resumo em '{summary}').")
+    write_result(args, stdout, "ordered", solution[0] if solution else None, search_tree.size, seconds,
+                 custo=solution[-1] if solution else None)
 
 if __name__ == '__main__':
     main()
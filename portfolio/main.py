@@ -0,0 +1,107 @@
+import os
+import sys
+import time
+import argparse
+import multiprocessing
+import queue
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from core import ENGINES, load_script, run_engine, read_graph, add_palette_arguments
+
+DEFAULT_ENGINES = "backtracking,dsatur,dfs,greedy,astar"
+
+def engine_worker(name, G, vertices, num_colors, symmetry, results):
+    """Processo de um motor do portfólio: envia (nome, coloração ou None, erro, segundos)."""
+    start = time.perf_counter()
+    try:
+        solution, _, _ = run_engine(name, G, vertices, num_colors, symmetry)
+    except Exception as e:
+        results.put((name, None, f"{type(e).__name__}: {e}", time.perf_counter() - start))
+    else:
+        results.put((name, solution, None, time.perf_counter() - start))
+
+def run_portfolio(G, vertices, engines, deadline, num_colors=4, symmetry=False):
+    """
+    Roda os motores 'engines' ao mesmo tempo, cada um em um processo, sobre o
+    mesmo grafo já lido, e para no primeiro que encontrar uma coloração ou no
+    primeiro motor completo que terminar sem nenhuma (o que prova que ela não
+    existe). Os processos que ainda estiverem rodando são encerrados.
+    Retorna (motor, coloração ou None, segundos, terminados); o motor é None se
+    todos terminarem sem resultado ou se o prazo 'deadline' (em segundos)
+    acabar. 'terminados' lista (nome, coloração, erro, segundos) de cada motor
+    que chegou ao fim.
+    """
+    # Os scripts são carregados antes de criar os processos, que os herdam já prontos.
+    for name in engines:
+        load_script(ENGINES[name].directory)
+    results = multiprocessing.Queue()
+    processes = {
+        name: multiprocessing.Process(target=engine_worker,
+                                      args=(name, G, vertices, num_colors, symmetry, results),
+                                      daemon=True)
+        for name in engines
+    }
+    start = time.perf_counter()
+    finished = []
+    try:
+        for process in processes.values():
+            process.start()
+        while len(finished) < len(processes):
+            remaining = deadline - (time.perf_counter() - start)
+            if remaining <= 0:
+                break
+            try:
+                name, solution, error, seconds = results.get(timeout=remaining)
+            except queue.Empty:
+                break
+            finished.append((name, solution, error, seconds))
+            if error is None and (solution is not None or ENGINES[name].complete):
+                return name, solution, seconds, finished
+        return None, None, time.perf_counter() - start, finished
+    finally:
+        for process in processes.values():
+            if process.is_alive():
+                process.terminate()
+        for process in processes.values():
+            process.join()
+
+def main():
+    parser = argparse.ArgumentParser(description="Portfólio de algoritmos de coloração de grafos")
+    parser.add_argument("file_path", help="Caminho do arquivo de entrada")
+    parser.add_argument("--engines", default=DEFAULT_ENGINES,
+                        help=f"Motores separados por vírgula, entre: {', '.join(ENGINES)} (padrão: {DEFAULT_ENGINES})")
+    parser.add_argument("--deadline", type=float, default=60.0,
+                        help="Prazo em segundos (padrão: 60)")
+    parser.add_argument("--weighted", action="store_true",
+                        help="Lê o custo de cada aresta (arquivos *custo.txt)")
+    parser.add_argument("--symmetry", action="store_true",
+                        help="Quebra a simetria de cores em todos os motores")
+    add_palette_arguments(parser)
+    args = parser.parse_args()
+    engines = [name.strip() for name in args.engines.split(",") if name.strip()]
+    unknown = [name for name in engines if name not in ENGINES]
+    if unknown or not engines:
+        parser.error(f"motores desconhecidos: {', '.join(unknown)}" if unknown else "nenhum motor informado")
+    if args.deadline <= 0:
+        parser.error("--deadline deve ser positivo")
+
+    G = read_graph(args.file_path, weighted=args.weighted)
+    vertices = sorted(G.nodes())
+
+    winner, solution, seconds, finished = run_portfolio(G, vertices, engines, args.deadline,
+                                                        args.colors, args.symmetry)
+    for name, result, error, elapsed in finished:
+        if error is not None:
+            print(f"  {name}: erro após {elapsed:.2f}s ({error})")
+        else:
+            print(f"  {name}: {'coloração' if result is not None else 'sem coloração'} em {elapsed:.2f}s")
+    if solution is not None:
+        print(f"Solução encontrada por '{winner}' em {seconds:.2f}s:", solution)
+    elif winner is not None:
+        print(f"'{winner}' provou em {seconds:.2f}s que não há coloração com {args.colors} cores.")
+    else:
+        print(f"Nenhum resultado em {seconds:.2f}s.")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""Enumeração exaustiva das colorações, usada como referência nos testes."""
+import itertools
+
+import numpy as np
+
+from core import CSRGraph
+from core.generators import random_graph
+
+
+def colorings(G, num_colors):
+    """Todas as colorações válidas com cores de 1 a 'num_colors', como dicionários."""
+    vertices = sorted(G.nodes())
+    adjacency = G.adjacency()
+    for colors in itertools.product(range(1, num_colors + 1), repeat=len(vertices)):
+        assignment = dict(zip(vertices, colors))
+        if all(assignment[u] != assignment[v] for u in vertices for v in adjacency[u]):
+            yield assignment
+
+
+def is_coloring(G, assignment, num_colors):
+    """Confere se 'assignment' colore todos os vértices, sem conflitos, com até 'num_colors' cores."""
+    adjacency = G.adjacency()
+    return (set(assignment) == set(G.nodes())
+            and all(1 <= c <= num_colors for c in assignment.values())
+            and all(assignment[u] != assignment[v] for u in assignment for v in adjacency[u]))
+
+
+def chromatic(G):
+    """Menor k com alguma k-coloração."""
+    k = 0 if G.dimension == 0 else 1
+    while next(colorings(G, k), None) is None:
+        k += 1
+    return k
+
+
+def small_graphs(seed, count, min_n=3, max_n=8):
+    """Grafos aleatórios pequenos o bastante para a enumeração exaustiva."""
+    rng = np.random.default_rng(seed)
+    for _ in range(count):
+        n = int(rng.integers(min_n, max_n + 1))
+        degree = float(rng.uniform(1.5, 5.0))
+        yield CSRGraph.from_edges(n, *random_graph(n, rng, degree=degree))
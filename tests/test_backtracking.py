@@ -0,0 +1,143 @@
+import json
+import os
+import subprocess
+import sys
+from argparse import Namespace
+
+import numpy as np
+
+from core import (CSRGraph, ColorState, DsaturState, DomainStore, ROOT, SearchTreeRecorder, load_script,
+                  read_graph)
+from core.engines import REPO_DIR
+
+from bruteforce import colorings, is_coloring, small_graphs
+
+
+def path_graph(n):
+    sources = np.arange(1, n)
+    return CSRGraph.from_edges(n, sources, sources + 1)
+
+
+def fresh_module():
+    module = load_script("backtracking")
+    module.search_tree = SearchTreeRecorder("off")
+    return module, module.search_tree.add(kind=ROOT)
+
+
+def test_backtrack_deeper_than_recursion_limit():
+    G = path_graph(5000)
+    vertices = sorted(G.nodes())
+    for order in ("static", "dsatur"):
+        for propagation in ("none", "fc"):
+            module, root_id = fresh_module()
+            dsatur = order == "dsatur"
+            if dsatur:
+                state = DsaturState(G, vertices, 3, track_cost=False)
+            else:
+                state = ColorState(G, 3, track_cost=False)
+            domains = DomainStore(G, vertices, 3, mode=propagation) if propagation != "none" else None
+            found, solution = module.backtrack(state, vertices, 0, root_id, dsatur, domains)
+            assert found and is_coloring(G, solution, 3)
+
+
+def test_backjump_deeper_than_recursion_limit():
+    G = path_graph(5000)
+    vertices = sorted(G.nodes())
+    module, root_id = fresh_module()
+    level = [0] * (G.dimension + 1)
+    found, solution, _ = module.backjump(ColorState(G, 2, track_cost=False), vertices, 0, root_id,
+                                         False, level)
+    assert found and is_coloring(G, solution, 2)
+
+
+def test_backjump_deep_failure():
+    # Caminho longo seguido de um triângulo: com 2 cores a falha só aparece no
+    # fim, e o salto precisa atravessar os milhares de níveis de volta.
+    n = 3000
+    sources = list(range(1, n)) + [n - 2]
+    destinations = list(range(2, n + 1)) + [n]
+    G = CSRGraph.from_edges(n, sources, destinations)
+    vertices = sorted(G.nodes())
+    module, root_id = fresh_module()
+    level = [0] * (G.dimension + 1)
+    found, solution, conflicts = module.backjump(ColorState(G, 2, track_cost=False), vertices, 0,
+                                                 root_id, False, level)
+    assert not found and solution is None
+
+
+def split_search(G, num_colors, budget, order="static", propagation="none", symmetry=False):
+    """
+    Roda os subproblemas de run_prefix um de cada vez, na ordem da pilha de
+    parallel_search. Retorna (solução ou None, nós gerados, subproblemas).
+    """
+    module = load_script("backtracking")
+    vertices = sorted(G.nodes())
+    args = Namespace(order=order, propagation=propagation, symmetry=symmetry, split_budget=budget)
+    module.init_worker(G, vertices, num_colors, args)
+    stack = [()]
+    nodes = solved = 0
+    while stack:
+        solution, subtasks, task_nodes = module.run_prefix(stack.pop())
+        nodes += task_nodes
+        solved += 1
+        if solution is not None:
+            return solution, nodes, solved
+        stack.extend(reversed(subtasks))
+    return None, nodes, solved
+
+
+def sequential_search(G, num_colors, order="static", propagation="none", symmetry=False):
+    module, root_id = fresh_module()
+    vertices = sorted(G.nodes())
+    args = Namespace(order=order, propagation=propagation, symmetry=symmetry)
+    state, dsatur, domains = module.build_state(G, vertices, num_colors, args)
+    first_id = module.search_tree.size
+    found, solution = module.backtrack(state, vertices, 0, root_id, dsatur, domains, symmetry)
+    return solution, module.search_tree.size - first_id
+
+
+def test_split_search_never_redoes_work():
+    # Cada nó da árvore sequencial é gerado por exatamente um subproblema, e a
+    # pilha visita os ramos na mesma ordem da busca sequencial.
+    for G in small_graphs(seed=47, count=30, max_n=9):
+        for num_colors in (2, 3, 4):
+            for order in ("static", "dsatur"):
+                for propagation in ("none", "fc"):
+                    for symmetry in (False, True):
+                        expected, sequential_nodes = sequential_search(G, num_colors, order, propagation, symmetry)
+                        for budget in (1, 2, 5):
+                            solution, nodes, _ = split_search(G, num_colors, budget, order, propagation, symmetry)
+                            assert solution == expected
+                            assert nodes == sequential_nodes
+
+
+def test_split_search_agrees_with_brute_force():
+    for G in small_graphs(seed=53, count=40, max_n=8):
+        for num_colors in (2, 3):
+            colorable = next(colorings(G, num_colors), None) is not None
+            for propagation in ("none", "fc", "ac3"):
+                solution, _, _ = split_search(G, num_colors, 2, "dsatur", propagation)
+                assert (solution is not None) == colorable
+                if solution is not None:
+                    assert is_coloring(G, solution, num_colors)
+
+
+def test_split_search_on_grafo3():
+    G = read_graph(os.path.join(REPO_DIR, "grafo3.txt"), use_cache=False)
+    expected, sequential_nodes = sequential_search(G, 4)
+    for budget in (1, 10, 20, 30):
+        solution, nodes, solved = split_search(G, 4, budget)
+        assert solution == expected
+        assert nodes == sequential_nodes
+        assert solved <= sequential_nodes
+
+
+def test_parallel_cli_with_small_budget(tmp_path):
+    script = os.path.join(REPO_DIR, "backtracking", "main.py")
+    result = subprocess.run([sys.executable, script, os.path.join(REPO_DIR, "grafo3.txt"),
+                             "--jobs", "4", "--split-budget", "10", "--no-draw", "--json"],
+                            cwd=tmp_path, capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    data = json.loads(result.stdout)
+    G = read_graph(os.path.join(REPO_DIR, "grafo3.txt"), use_cache=False)
+    assert is_coloring(G, {int(v): c for v, c in data["solucao"].items()}, 4)
@@ -0,0 +1,88 @@
+from argparse import Namespace
+
+from core import CSRGraph, NogoodStore, SearchTreeRecorder, chromatic_number, load_script
+from core.chromatic import drop_color, dsatur_coloring, greedy_clique
+
+from bruteforce import chromatic, colorings, is_coloring, small_graphs
+
+
+def backtracking_solver(G, vertices, **options):
+    """O 'solve' de backtracking/main.py com as opções de linha de comando dadas."""
+    module = load_script("backtracking")
+    args = Namespace(order="static", propagation="none", backjump=False, symmetry=False)
+    vars(args).update(options)
+
+    def solve(k, nogoods):
+        module.search_tree = SearchTreeRecorder("off")
+        return module.solve(G, vertices, k, args, nogoods)[1]
+    return solve
+
+
+def test_matches_brute_force():
+    for G in small_graphs(seed=19, count=80, min_n=1):
+        vertices = sorted(G.nodes())
+        expected = chromatic(G)
+        for options, nogoods in (({}, None),
+                                 ({}, NogoodStore(8)),
+                                 ({"order": "dsatur", "propagation": "fc", "symmetry": True}, NogoodStore(3)),
+                                 ({"backjump": True}, NogoodStore(8))):
+            k, assignment = chromatic_number(G, vertices, backtracking_solver(G, vertices, **options), nogoods)
+            assert k == expected
+            assert is_coloring(G, assignment, k)
+            assert max(assignment.values()) == k
+
+
+def test_reports_each_decision():
+    G = CSRGraph.from_edges(5, [1, 2, 3, 4, 5], [2, 3, 4, 5, 1])
+    vertices = sorted(G.nodes())
+    reports = []
+    k, _ = chromatic_number(G, vertices, backtracking_solver(G, vertices),
+                            report=lambda k, assignment, origin: reports.append((k, origin)))
+    assert k == 3
+    assert reports[0] == (2, "clique")
+    assert reports[1][1] == "dsatur"
+    assert reports[-1] == (2, "busca")
+
+
+def test_empty_graph():
+    G = CSRGraph.from_edges(0, [], [])
+    assert chromatic_number(G, [], lambda k, context: None) == (0, {})
+
+
+def test_bounds():
+    for G in small_graphs(seed=23, count=40):
+        vertices = sorted(G.nodes())
+        adjacency = G.adjacency()
+        clique = greedy_clique(G, vertices)
+        assert all(v in adjacency[u] for u in clique for v in clique if u != v)
+        upper = dsatur_coloring(G, vertices)
+        assert is_coloring(G, upper, max(upper.values()))
+        assert len(clique) <= chromatic(G) <= max(upper.values())
+
+
+def test_drop_color_keeps_a_valid_coloring():
+    for G in small_graphs(seed=29, count=40):
+        for assignment in colorings(G, 4):
+            top = max(assignment.values())
+            repaired = drop_color(G, assignment, top)
+            if repaired is not None:
+                assert is_coloring(G, repaired, top - 1)
+            break
+
+
+def test_failed_prefixes_carry_over_to_fewer_colors():
+    # O que falhou com k cores é cortado sem busca com k - 1 cores.
+    hits = 0
+    for G in small_graphs(seed=59, count=40, min_n=6, max_n=8):
+        vertices = sorted(G.nodes())
+        k = chromatic(G)
+        for options in ({}, {"symmetry": True}, {"order": "dsatur", "propagation": "fc"}):
+            solve = backtracking_solver(G, vertices, **options)
+            nogoods = NogoodStore(8)
+            assert is_coloring(G, solve(k + 1, nogoods), k + 1)
+            learned = nogoods.hits
+            assert is_coloring(G, solve(k, nogoods), k)
+            if k > 1:
+                assert solve(k - 1, nogoods) is None
+            hits += nogoods.hits - learned
+    assert hits > 0
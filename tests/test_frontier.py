@@ -0,0 +1,81 @@
+import os
+import struct
+
+import numpy as np
+
+from core import CSRGraph, SpillQueue, load_script
+from core.generators import random_graph
+
+RECORD = struct.Struct("<q")
+
+
+def make_queue(capacity, tmp_path):
+    return SpillQueue(RECORD.size, RECORD.pack, lambda data: RECORD.unpack(data)[0],
+                      capacity=capacity, spill_dir=str(tmp_path))
+
+
+def test_fifo_past_capacity(tmp_path):
+    queue = make_queue(3, tmp_path)
+    for item in range(10):
+        queue.append(item)
+    assert len(queue) == 10
+    assert queue.spilled_total == 7
+    assert list(queue) == list(range(10))
+    assert [queue.popleft() for _ in range(10)] == list(range(10))
+    assert not queue
+    queue.close()
+
+
+def test_fifo_with_interleaved_appends(tmp_path):
+    # Alterna inserções e remoções para passar pelo arquivo várias vezes,
+    # inclusive depois de ele ser esvaziado e reaproveitado.
+    queue = make_queue(4, tmp_path)
+    expected = []
+    popped = []
+    item = 0
+    for step in range(200):
+        for _ in range(step % 7):
+            queue.append(item)
+            expected.append(item)
+            item += 1
+        for _ in range(step % 5):
+            if queue:
+                popped.append(queue.popleft())
+    assert list(queue) == expected[len(popped):]
+    while queue:
+        popped.append(queue.popleft())
+    assert popped == expected
+    assert queue.spilled_total > 0
+    queue.close()
+
+
+def test_flush_of_large_batches(tmp_path):
+    # Mais de 4096 itens pendentes: parte vai para o arquivo antes da leitura.
+    queue = make_queue(100, tmp_path)
+    for item in range(10000):
+        queue.append(item)
+    assert list(queue) == list(range(10000))
+    assert [queue.popleft() for _ in range(10000)] == list(range(10000))
+    queue.close()
+
+
+def test_without_capacity_is_a_deque():
+    queue = SpillQueue(RECORD.size, RECORD.pack, RECORD.unpack)
+    for item in range(5):
+        queue.append(item)
+    assert queue.spilled_total == 0
+    assert [queue.popleft() for _ in range(5)] == list(range(5))
+
+
+def test_bfs_with_spilled_frontier(tmp_path):
+    module = load_script("bfs")
+    rng = np.random.default_rng(5)
+    for _ in range(10):
+        n = int(rng.integers(5, 10))
+        G = CSRGraph.from_edges(n, *random_graph(n, rng, degree=3.0))
+        vertices = sorted(G.nodes())
+        for num_colors in (2, 3):
+            expected = module.bfs(G, vertices, None, os.devnull, "off", num_colors=num_colors)
+            spilled = module.bfs(G, vertices, None, os.devnull, "off", frontier_cap=2,
+                                 spill_dir=str(tmp_path), num_colors=num_colors)
+            assert spilled == expected
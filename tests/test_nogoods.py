@@ -0,0 +1,59 @@
+from core import ColorState, DsaturState, NogoodStore, ROOT, SearchTreeRecorder, load_script
+
+from bruteforce import colorings, is_coloring, small_graphs
+
+
+def run_backjump(G, num_colors, nogoods, dsatur=False, symmetry=False):
+    module = load_script("backtracking")
+    module.search_tree = SearchTreeRecorder("off")
+    root_id = module.search_tree.add(kind=ROOT)
+    vertices = sorted(G.nodes())
+    if dsatur:
+        state = DsaturState(G, vertices, num_colors, track_cost=False)
+    else:
+        state = ColorState(G, num_colors, track_cost=False)
+    level = [0] * (G.dimension + 1)
+    found, solution, _ = module.backjump(state, vertices, 0, root_id, dsatur, level, nogoods, symmetry)
+    return solution if found else None
+
+
+def test_learning_never_removes_a_coloring():
+    for G in small_graphs(seed=13, count=60):
+        for num_colors in (2, 3, 4):
+            colorable = next(colorings(G, num_colors), None) is not None
+            for dsatur in (False, True):
+                for symmetry in (False, True):
+                    for max_size in (1, 2, 4, 8):
+                        solution = run_backjump(G, num_colors, NogoodStore(max_size), dsatur, symmetry)
+                        assert (solution is not None) == colorable
+                        if solution is not None:
+                            assert is_coloring(G, solution, num_colors)
+
+
+def test_store_shared_across_fewer_colors():
+    # Como no modo --chromatic: os nogoods aprendidos com k cores valem para menos cores.
+    for G in small_graphs(seed=17, count=40):
+        nogoods = NogoodStore(8)
+        for num_colors in (4, 3, 2, 1):
+            colorable = next(colorings(G, num_colors), None) is not None
+            assert (run_backjump(G, num_colors, nogoods) is not None) == colorable
+
+
+def test_violated_returns_culprits():
+    store = NogoodStore(2)
+    colors = [0, 1, 2, 0]
+    level = [0, 0, 1, 2]
+    store.record({1, 2}, colors, level)
+    assert len(store) == 1
+    # O nogood {1 = 1, 2 = 2} fica indexado pelo vértice mais profundo, o 2.
+    assert store.violated(2, 2, [0, 1, 0, 0]) == [1]
+    assert store.violated(2, 2, [0, 3, 0, 0]) is None
+    assert store.violated(2, 1, [0, 1, 0, 0]) is None
+    assert store.hits == 1
+
+
+def test_large_nogoods_are_not_recorded():
+    store = NogoodStore(1)
+    store.record({1, 2}, [0, 1, 2], [0, 0, 1])
+    store.record(set(), [0, 1, 2], [0, 0, 1])
+    assert len(store) == 0
@@ -0,0 +1,34 @@
+import io
+import json
+from argparse import Namespace
+
+from core import write_result
+
+
+def result(assignment, **extra):
+    stdout = io.StringIO()
+    args = Namespace(json=True, file_path="grafo.txt")
+    write_result(args, stdout, "bfs", assignment, 3, 0.5, **extra)
+    return json.loads(stdout.getvalue())
+
+
+def test_coloring():
+    data = result({1: 1, 2: 2})
+    assert data["status"] == "coloração"
+    assert data["cores"] == 2
+    assert data["solucao"] == {"1": 1, "2": 2}
+
+
+def test_empty_graph_is_colored():
+    data = result({})
+    assert data["status"] == "coloração"
+    assert data["cores"] == 0
+    assert data["solucao"] == {}
+
+
+def test_no_coloring():
+    data = result(None, custo=None)
+    assert data["status"] == "sem coloração"
+    assert data["cores"] is None
+    assert data["solucao"] is None
+    assert data["custo"] is None
@@ -0,0 +1,131 @@
+import os
+import warnings
+
+import numpy as np
+import pytest
+
+from core import read_graph
+from core.parser import _cache_path, parse_graph_file
+
+WEIGHTED = """DIMENSION
+4
+GRAPH
+1 2 2.5
+1 3 0.75
+2 3 3
+3 4 1.125
+"""
+
+
+def write_graph(tmp_path, text, name="grafo.txt"):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+
+def edges(G):
+    """Arestas (u, v, custo) com u < v, lidas dos vetores CSR."""
+    result = []
+    for u in G.nodes():
+        for v in G.neighbors(u):
+            if u < v:
+                result.append((u, v, G.weight(u, v)))
+    return result
+
+
+def test_decimal_costs_through_mmap_and_cache(tmp_path):
+    path = write_graph(tmp_path, WEIGHTED)
+    cache_dir = str(tmp_path / "cache")
+    expected = [(1, 2, 2.5), (1, 3, 0.75), (2, 3, 3.0), (3, 4, 1.125)]
+
+    parsed = read_graph(path, weighted=True, cache_dir=cache_dir)
+    assert edges(parsed) == expected
+    assert os.path.exists(_cache_path(path, True, cache_dir))
+
+    cached = read_graph(path, weighted=True, cache_dir=cache_dir)
+    assert edges(cached) == expected
+    assert cached.weighted
+
+
+def test_decimal_costs_in_later_chunk(tmp_path, monkeypatch):
+    # Blocos pequenos: o primeiro só tem inteiros e o último tem custos decimais.
+    monkeypatch.setattr("core.parser.CHUNK_SIZE", 16)
+    G = parse_graph_file(write_graph(tmp_path, WEIGHTED), weighted=True)
+    assert edges(G) == [(1, 2, 2.5), (1, 3, 0.75), (2, 3, 3.0), (3, 4, 1.125)]
+
+
+def test_partial_integer_read_falls_back_to_float(tmp_path, monkeypatch):
+    # NumPy antigos não levantam erro ao encontrar um decimal lendo inteiros:
+    # avisam com DeprecationWarning e devolvem só o que foi lido até ali.
+    fromstring = np.fromstring
+
+    def partial_fromstring(data, dtype=float, sep=""):
+        if dtype is np.int64:
+            warnings.warn("string or file could not be read to its end", DeprecationWarning)
+            return np.array([1, 2], dtype=np.int64)
+        return fromstring(data, dtype=dtype, sep=sep)
+
+    monkeypatch.setattr(np, "fromstring", partial_fromstring)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        G = parse_graph_file(write_graph(tmp_path, WEIGHTED), weighted=True)
+    assert edges(G) == [(1, 2, 2.5), (1, 3, 0.75), (2, 3, 3.0), (3, 4, 1.125)]
+
+
+def test_cache_round_trip(tmp_path):
+    path = write_graph(tmp_path, "DIMENSION\n5\nGRAPH\n1 2\n2 3\n\n3 1\n4 5\n2 3\n")
+    cache_dir = str(tmp_path / "cache")
+    parsed = read_graph(path, cache_dir=cache_dir)
+    cached = read_graph(path, cache_dir=cache_dir)
+    assert parsed.dimension == cached.dimension == 5
+    assert not cached.weighted
+    np.testing.assert_array_equal(parsed.offsets, cached.offsets)
+    np.testing.assert_array_equal(parsed.targets, cached.targets)
+    np.testing.assert_array_equal(parsed.weights, cached.weights)
+    assert cached.number_of_edges() == 4
+    assert sorted(cached.neighbors(3)) == [1, 2]
+
+
+def test_cache_follows_file_changes(tmp_path):
+    path = write_graph(tmp_path, "DIMENSION\n3\nGRAPH\n1 2\n")
+    cache_dir = str(tmp_path / "cache")
+    assert read_graph(path, cache_dir=cache_dir).number_of_edges() == 1
+
+    # Mesmo tamanho, conteúdo diferente e outra data: o resumo não confere.
+    with open(path, "w") as f:
+        f.write("DIMENSION\n3\nGRAPH\n2 3\n")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    G = read_graph(path, cache_dir=cache_dir)
+    assert G.neighbors(1) == [] and G.neighbors(2) == [3]
+
+    # Só a data muda: o cache continua valendo.
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+    assert read_graph(path, cache_dir=cache_dir).neighbors(2) == [3]
+
+
+def test_weighted_and_unweighted_caches_are_separate(tmp_path):
+    path = write_graph(tmp_path, WEIGHTED)
+    cache_dir = str(tmp_path / "cache")
+    read_graph(path, cache_dir=cache_dir)
+    G = read_graph(path, weighted=True, cache_dir=cache_dir)
+    assert G.weighted and G.weight(1, 2) == 2.5
+    assert not read_graph(path, cache_dir=cache_dir).weighted
+
+
+def test_ragged_lines_are_not_paired_across_lines(tmp_path):
+    # Mesmo total de valores que 3 linhas de 3 colunas, mas distribuídos de
+    # outro jeito: a conversão vetorizada não pode remontar a matriz.
+    path = write_graph(tmp_path, "DIMENSION\n4\nGRAPH\n1 2 5\n3 4\n2 3 7 1\n")
+    G = parse_graph_file(path, weighted=True)
+    assert G.dimension == 4
+    assert edges(G) == [(1, 2, 5.0), (2, 3, 7.0)]
+    G = parse_graph_file(path)
+    assert [(u, v) for u, v, _ in edges(G)] == [(1, 2), (2, 3), (3, 4)]
+
+
+def test_vertices_outside_dimension_are_rejected(tmp_path):
+    with pytest.raises(ValueError, match="fora do intervalo"):
+        parse_graph_file(write_graph(tmp_path, "DIMENSION\n3\nGRAPH\n1 2\n2 4\n"))
+    with pytest.raises(ValueError, match="fora do intervalo"):
+        parse_graph_file(write_graph(tmp_path, "DIMENSION\n3\nGRAPH\n0 2\n"))
@@ -0,0 +1,51 @@
+from core import CSRGraph, ENGINES, load_script, run_engine
+
+from bruteforce import colorings, is_coloring, small_graphs
+
+
+def test_engines_agree_with_brute_force():
+    for G in small_graphs(seed=43, count=15, max_n=6):
+        vertices = sorted(G.nodes())
+        for num_colors in (2, 3):
+            colorable = next(colorings(G, num_colors), None) is not None
+            for name, engine in ENGINES.items():
+                for symmetry in (False, True):
+                    solution, _, _ = run_engine(name, G, vertices, num_colors, symmetry)
+                    if solution is not None:
+                        assert is_coloring(G, solution, num_colors), name
+                    elif engine.complete:
+                        assert not colorable, name
+
+
+def test_portfolio_returns_a_coloring():
+    run_portfolio = load_script("portfolio").run_portfolio
+    G = CSRGraph.from_edges(5, [1, 2, 3, 4, 5], [2, 3, 4, 5, 1])
+    vertices = sorted(G.nodes())
+    winner, solution, _, finished = run_portfolio(G, vertices, ["backtracking", "dfs", "greedy"], 30.0,
+                                                  num_colors=3)
+    assert winner in ("backtracking", "dfs", "greedy")
+    assert is_coloring(G, solution, 3)
+    assert any(name == winner for name, _, _, _ in finished)
+
+
+def test_portfolio_proves_no_coloring():
+    run_portfolio = load_script("portfolio").run_portfolio
+    G = CSRGraph.from_edges(3, [1, 2, 3], [2, 3, 1])
+    vertices = sorted(G.nodes())
+    winner, solution, _, _ = run_portfolio(G, vertices, ["backtracking", "dsatur"], 30.0, num_colors=2)
+    assert winner in ("backtracking", "dsatur")
+    assert solution is None
+
+
+def test_batch_reports_expanded_nodes(tmp_path):
+    path = tmp_path / "caminho.txt"
+    path.write_text("DIMENSION\n3\nGRAPH\n1 2\n2 3\n")
+    G = CSRGraph.from_edges(3, [1, 2], [2, 3])
+    solve_file = load_script("batch").solve_file
+    for name in ENGINES:
+        _, _, expanded = run_engine(name, G, [1, 2, 3], 2)
+        # Cada vértice do caminho abre um nível antes de chegar à solução.
+        assert expanded >= 3, name
+        row = solve_file((str(path), str(tmp_path / name), name, False, False, 2, False, None, None))
+        assert row["status"] == "coloração", name
+        assert row["nos_expandidos"] == expanded, name
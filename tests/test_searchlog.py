@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from core import CSRGraph, ROOT, SearchTreeRecorder, load_script
+from core.generators import random_graph
+from core.replay_log import format_snapshot
+from core.searchlog import DELTA_HEADER, replay
+
+
+def run_logged(module, search, G, vertices, path, mode):
+    module.search_tree = SearchTreeRecorder()
+    root_id = module.search_tree.add(kind=ROOT)
+    search(module, G, vertices, root_id, str(path), mode)
+
+
+def run_dfs(module, G, vertices, root_id, path, mode):
+    module.dfs(G, vertices, root_id, path, mode, num_colors=3)
+
+
+def run_bfs(module, G, vertices, root_id, path, mode):
+    module.bfs(G, vertices, root_id, path, mode, num_colors=3)
+
+
+@pytest.mark.parametrize("directory, search", [("dfs", run_dfs), ("bfs", run_bfs)])
+def test_delta_replay_matches_full_log(tmp_path, directory, search):
+    module = load_script(directory)
+    rng = np.random.default_rng(11)
+    for _ in range(5):
+        n = int(rng.integers(4, 8))
+        G = CSRGraph.from_edges(n, *random_graph(n, rng, degree=3.0))
+        vertices = sorted(G.nodes())
+        full_path = tmp_path / "full.txt"
+        delta_path = tmp_path / "delta.txt"
+        run_logged(module, search, G, vertices, full_path, "full")
+        run_logged(module, search, G, vertices, delta_path, "delta")
+
+        with open(delta_path, encoding="utf-8") as f:
+            assert f.readline() == DELTA_HEADER
+            replayed = "".join(format_snapshot(number, open_states, closed_states)
+                               for number, open_states, closed_states in replay(f))
+        assert replayed.startswith("Iteração 0:")
+        assert replayed == full_path.read_text(encoding="utf-8")
+
+
+def test_replay_stops_after_iteration():
+    lines = [DELTA_HEADER, "i0\n", "+1 a\n", "i1\n", "-1\n", "+2 b\n", "c1\n", "i2\n", "-2\n", "c2\n", "i3\n"]
+    snapshots = [(number, dict(open_states), dict(closed_states))
+                 for number, open_states, closed_states in replay(lines, stop=2)]
+    assert snapshots == [(0, {}, {}), (1, {"1": "a"}, {}), (2, {"2": "b"}, {"1": "a"})]
@@ -0,0 +1,115 @@
+import os
+import subprocess
+import sys
+from argparse import Namespace
+
+from core import ROOT, SearchTreeRecorder, load_script, solutions_from_args, symmetry_weight, write_solutions
+from core.engines import REPO_DIR
+
+from bruteforce import colorings, small_graphs
+
+# (ordem, propagação) de backtracking/main.py cobertas pelos testes.
+CONFIGURATIONS = [("static", "none"), ("static", "fc"), ("dsatur", "none"), ("dsatur", "ac3")]
+
+
+def backtracking_leaves(G, num_colors, order, propagation, symmetry):
+    """Monta o estado como backtracking/main.py e devolve (módulo, estado, vértices, dsatur, domínios, raiz)."""
+    module = load_script("backtracking")
+    module.search_tree = SearchTreeRecorder("off")
+    root_id = module.search_tree.add(kind=ROOT)
+    vertices = sorted(G.nodes())
+    args = Namespace(order=order, propagation=propagation, symmetry=symmetry)
+    state, dsatur, domains = module.build_state(G, vertices, num_colors, args)
+    return module, state, vertices, dsatur, domains, root_id
+
+
+def canonical(assignment, vertices):
+    """Renomeia as cores na ordem em que aparecem, como a quebra de simetria."""
+    names = {}
+    return tuple(names.setdefault(assignment[v], len(names) + 1) for v in vertices)
+
+
+def test_symmetry_weight():
+    assert symmetry_weight(4, 0) == 1
+    assert symmetry_weight(4, 1) == 4
+    assert symmetry_weight(4, 3) == 24
+    assert symmetry_weight(3, 3) == 6
+
+
+def test_backtracking_counts_match_brute_force():
+    for G in small_graphs(seed=31, count=40, min_n=1, max_n=7):
+        for num_colors in (2, 3, 4):
+            expected = sum(1 for _ in colorings(G, num_colors))
+            for order, propagation in CONFIGURATIONS:
+                for symmetry in (False, True):
+                    module, state, vertices, dsatur, domains, root_id = backtracking_leaves(
+                        G, num_colors, order, propagation, symmetry)
+                    total = module.count_solutions(state, vertices, root_id, dsatur, domains, symmetry)
+                    assert total == expected
+
+
+def test_backtracking_enumeration_matches_brute_force():
+    for G in small_graphs(seed=37, count=30, min_n=1, max_n=6):
+        vertices = sorted(G.nodes())
+        for num_colors in (2, 3):
+            expected = {tuple(a[v] for v in vertices) for a in colorings(G, num_colors)}
+            for order, propagation in CONFIGURATIONS:
+                module, state, _, dsatur, domains, root_id = backtracking_leaves(
+                    G, num_colors, order, propagation, False)
+                found = [tuple(a[v] for v in vertices)
+                         for a in module.all_solutions(state, vertices, root_id, dsatur, domains)]
+                assert len(found) == len(set(found))
+                assert set(found) == expected
+
+                # Com a quebra de simetria sai uma coloração por classe de troca de cores.
+                module, state, _, dsatur, domains, root_id = backtracking_leaves(
+                    G, num_colors, order, propagation, True)
+                found = [canonical(a, vertices)
+                         for a in module.all_solutions(state, vertices, root_id, dsatur, domains, True)]
+                assert len(found) == len(set(found))
+                assert set(found) == {canonical(dict(zip(vertices, c)), vertices) for c in expected}
+
+
+def test_dfs_counts_match_brute_force():
+    module = load_script("dfs")
+    for G in small_graphs(seed=41, count=30, min_n=1, max_n=6):
+        vertices = sorted(G.nodes())
+        for num_colors in (2, 3, 4):
+            expected = sum(1 for _ in colorings(G, num_colors))
+            for symmetry in (False, True):
+                module.search_tree = SearchTreeRecorder("off")
+                root_id = module.search_tree.add(kind=ROOT)
+                total = module.dfs_count(G, vertices, root_id, os.devnull, "off", symmetry, num_colors)
+                assert total == expected
+
+
+def test_write_solutions(tmp_path):
+    path = tmp_path / "solucoes.txt"
+    count = write_solutions(str(path), [2, 1], iter([{1: 1, 2: 2}, {1: 2, 2: 1}]))
+    assert count == 2
+    assert path.read_text(encoding="utf-8") == "# vértices: 2 1\n2 1\n1 2\n"
+
+
+def test_enumeration_turns_tree_and_log_off_by_default():
+    def options(**given):
+        args = Namespace(all=None, count=False, tree=None, tree_export=None, log_mode=None)
+        vars(args).update(given)
+        return solutions_from_args(args), args
+
+    enumerate_all, args = options()
+    assert not enumerate_all and args.tree is None and args.log_mode is None
+    enumerate_all, args = options(count=True)
+    assert enumerate_all and args.tree == "off" and args.log_mode == "off"
+    _, args = options(all="solucoes.txt", tree="sample", log_mode="delta")
+    assert args.tree == "sample" and args.log_mode == "delta"
+    _, args = options(count=True, tree_export="arvore.npy")
+    assert args.tree is None
+
+
+def test_dfs_count_writes_no_log(tmp_path):
+    result = subprocess.run([sys.executable, os.path.join(REPO_DIR, "dfs", "main.py"),
+                             os.path.join(REPO_DIR, "grafo1.txt"), "--count"],
+                            cwd=tmp_path, capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert "Número de colorações válidas:" in result.stdout
+    assert os.listdir(tmp_path) == []